@@ -0,0 +1,51 @@
+"""Add tombstones.owner_id so delta-sync deletions are scoped to their owner
+
+Revision ID: 3f7c9b2e5a14
+Revises: 6a8d2f4c1e97
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '3f7c9b2e5a14'
+down_revision = '6a8d2f4c1e97'
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = "ix_tombstones_table_name_owner_id_deleted_at"
+
+
+def _columns(bind) -> set[str]:
+    return {c["name"] for c in sa.inspect(bind).get_columns("tombstones")}
+
+
+def _indexes(bind) -> set[str]:
+    return {i["name"] for i in sa.inspect(bind).get_indexes("tombstones")}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    # Existing tombstones keep a NULL owner: the owner of a deleted row is gone. No
+    # client reads them again, since sync cursors issued before this revision are
+    # answered with 410 (full resync) and a full sync starts after them.
+    if "owner_id" not in _columns(bind):
+        op.add_column("tombstones", sa.Column("owner_id", postgresql.UUID(as_uuid=True), nullable=True))
+    if INDEX_NAME not in _indexes(bind):
+        op.create_index(INDEX_NAME, "tombstones", ["table_name", "owner_id", "deleted_at", "id"])
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+
+    if INDEX_NAME in _indexes(bind):
+        op.drop_index(INDEX_NAME, table_name="tombstones")
+    if "owner_id" in _columns(bind):
+        with op.batch_alter_table("tombstones") as batch_op:
+            batch_op.drop_column("owner_id")
@@ -0,0 +1,32 @@
+"""Add full-text search vectors for pets, lost/found and rescue reports
+
+Revision ID: 4b9e0f27d1c8
+Revises: 7d41b2e8c6a3
+Create Date: 2026-10-19 18:10:00.000000
+
+"""
+
+from alembic import op
+
+from src.database.fulltext import SEARCH_COLUMNS, create_search_index, drop_search_index
+
+
+# revision identifiers, used by Alembic.
+revision = '4b9e0f27d1c8'
+down_revision = '7d41b2e8c6a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Postgres: generated tsvector column + GIN index; SQLite: FTS5 table + triggers.
+    # Idempotent, since fresh databases already have them from 0001_create_all.
+    bind = op.get_bind()
+    for table in SEARCH_COLUMNS:
+        create_search_index(bind, table)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    for table in SEARCH_COLUMNS:
+        drop_search_index(bind, table)
@@ -0,0 +1,33 @@
+"""Add users.token_version for access-token revocation
+
+Revision ID: 5c2d8e6fa913
+Revises: e3f9a1c47b26
+Create Date: 2026-10-19 17:05:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c2d8e6fa913'
+down_revision = 'e3f9a1c47b26'
+branch_labels = None
+depends_on = None
+
+
+def _columns(table: str) -> set[str]:
+    return {c["name"] for c in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade() -> None:
+    # Fresh databases already have it from 0001_create_all.
+    if "token_version" not in _columns("users"):
+        op.add_column("users", sa.Column("token_version", sa.Integer(), nullable=False, server_default="0"))
+
+
+def downgrade() -> None:
+    if "token_version" in _columns("users"):
+        with op.batch_alter_table("users") as batch_op:
+            batch_op.drop_column("token_version")
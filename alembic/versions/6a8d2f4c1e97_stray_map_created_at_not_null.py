@@ -0,0 +1,46 @@
+"""Backfill stray_map_entries.created_at and make it NOT NULL
+
+Revision ID: 6a8d2f4c1e97
+Revises: 9e5a3c71b0d4
+Create Date: 2026-10-19 20:10:00.000000
+
+"""
+
+from datetime import datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6a8d2f4c1e97'
+down_revision = '9e5a3c71b0d4'
+branch_labels = None
+depends_on = None
+
+
+def _nullable(table: str, column: str) -> bool:
+    return next(c["nullable"] for c in sa.inspect(op.get_bind()).get_columns(table) if c["name"] == column)
+
+
+def upgrade() -> None:
+    # GET /stray-map/ pages on (created_at, id); a NULL created_at would drop the row
+    # out of the keyset comparison. Rows without one get their updated_at, or now.
+    if not _nullable("stray_map_entries", "created_at"):
+        return
+    op.get_bind().execute(
+        sa.text(
+            "UPDATE stray_map_entries SET created_at = COALESCE(updated_at, :now) "
+            "WHERE created_at IS NULL"
+        ),
+        {"now": datetime.now(timezone.utc).replace(tzinfo=None)},
+    )
+    with op.batch_alter_table("stray_map_entries") as batch_op:
+        batch_op.alter_column("created_at", existing_type=sa.DateTime(), nullable=False)
+
+
+def downgrade() -> None:
+    if _nullable("stray_map_entries", "created_at"):
+        return
+    with op.batch_alter_table("stray_map_entries") as batch_op:
+        batch_op.alter_column("created_at", existing_type=sa.DateTime(), nullable=True)
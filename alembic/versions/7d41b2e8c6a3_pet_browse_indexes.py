@@ -0,0 +1,53 @@
+"""Add partial indexes for the public pet browse endpoint
+
+Revision ID: 7d41b2e8c6a3
+Revises: 5c2d8e6fa913
+Create Date: 2026-10-19 17:40:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7d41b2e8c6a3'
+down_revision = '5c2d8e6fa913'
+branch_labels = None
+depends_on = None
+
+
+# Same as src/entities/pet.py BROWSE_INDEXES
+BROWSE_INDEXES = {
+    "ix_pets_browse": ["created_at", "pet_id"],
+    "ix_pets_browse_species": ["species", "created_at", "pet_id"],
+    "ix_pets_browse_species_size": ["species", "size", "created_at", "pet_id"],
+    "ix_pets_browse_species_temperament": ["species", "temperament", "created_at", "pet_id"],
+    "ix_pets_browse_species_activity_level": ["species", "activity_level", "created_at", "pet_id"],
+    "ix_pets_browse_species_age": ["species", "age", "created_at", "pet_id"],
+}
+
+NOT_ADOPTED = sa.column("is_adopted", sa.Boolean()) == sa.false()
+
+
+def _indexes() -> dict[str, list[str]]:
+    return {i["name"]: i["column_names"] for i in sa.inspect(op.get_bind()).get_indexes("pets")}
+
+
+def upgrade() -> None:
+    # Fresh databases already have these from 0001_create_all. An index left over
+    # from the earlier pet_id-only layout is rebuilt.
+    existing = _indexes()
+    for name, columns in BROWSE_INDEXES.items():
+        if existing.get(name) == columns:
+            continue
+        if name in existing:
+            op.drop_index(name, table_name="pets")
+        op.create_index(name, "pets", columns, postgresql_where=NOT_ADOPTED, sqlite_where=NOT_ADOPTED)
+
+
+def downgrade() -> None:
+    existing = _indexes()
+    for name in BROWSE_INDEXES:
+        if name in existing:
+            op.drop_index(name, table_name="pets")
@@ -0,0 +1,121 @@
+"""Move pet photos from the pets.images JSON column to a pet_images table
+
+Revision ID: 9e5a3c71b0d4
+Revises: 4b9e0f27d1c8
+Create Date: 2026-10-19 18:40:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from src.database.ids import uuid7
+
+
+# revision identifiers, used by Alembic.
+revision = '9e5a3c71b0d4'
+down_revision = '4b9e0f27d1c8'
+branch_labels = None
+depends_on = None
+
+
+BATCH_SIZE = 1000
+
+pets = sa.table(
+    "pets",
+    sa.column("pet_id", postgresql.UUID(as_uuid=True)),
+    sa.column("images", sa.JSON()),
+)
+pet_images = sa.table(
+    "pet_images",
+    sa.column("image_id", postgresql.UUID(as_uuid=True)),
+    sa.column("pet_id", postgresql.UUID(as_uuid=True)),
+    sa.column("position", sa.Integer()),
+    sa.column("url", sa.String()),
+    sa.column("variants", sa.JSON(none_as_null=True)),
+    sa.column("created_at", sa.DateTime()),
+)
+
+
+def _columns(bind, table: str) -> set[str]:
+    return {c["name"] for c in sa.inspect(bind).get_columns(table)}
+
+
+def _pages(bind, query, key):
+    # Keyset batches, so large tables are never read into memory at once.
+    last = None
+    while True:
+        page = query if last is None else query.where(key > last)
+        rows = bind.execute(page.order_by(key).limit(BATCH_SIZE)).fetchall()
+        if not rows:
+            return
+        yield rows
+        last = getattr(rows[-1], key.name)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    # Fresh databases already have the table (and no JSON column) from 0001_create_all.
+    if not sa.inspect(bind).has_table("pet_images"):
+        op.create_table(
+            "pet_images",
+            sa.Column("image_id", postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column(
+                "pet_id", postgresql.UUID(as_uuid=True),
+                sa.ForeignKey("pets.pet_id", ondelete="CASCADE"), nullable=False,
+            ),
+            sa.Column("position", sa.Integer(), nullable=False),
+            sa.Column("url", sa.String(), nullable=False),
+            sa.Column("variants", sa.JSON(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+        )
+        op.create_index("ix_pet_images_pet_id_position", "pet_images", ["pet_id", "position", "image_id"])
+
+    if "images" not in _columns(bind, "pets"):
+        return
+
+    # variants stay NULL: responses derive them from the URL until
+    # `python -m src.media --pet-images` stores them (it needs the media storage config).
+    query = sa.select(pets.c.pet_id, pets.c.images).where(pets.c.images.isnot(None))
+    now = sa.func.now()
+    for rows in _pages(bind, query, pets.c.pet_id):
+        images = [
+            {
+                "image_id": uuid7(),
+                "pet_id": row.pet_id,
+                "position": position,
+                "url": url,
+            }
+            for row in rows
+            for position, url in enumerate(row.images or [])
+            if isinstance(url, str) and url
+        ]
+        if images:
+            bind.execute(pet_images.insert().values(created_at=now), images)
+
+    op.drop_column("pets", "images")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+
+    if "images" not in _columns(bind, "pets"):
+        op.add_column("pets", sa.Column("images", sa.JSON(), nullable=True))
+
+    if sa.inspect(bind).has_table("pet_images"):
+        query = sa.select(pet_images.c.pet_id).distinct()
+        for rows in _pages(bind, query, pet_images.c.pet_id):
+            ids = [row.pet_id for row in rows]
+            urls: dict = {pet_id: [] for pet_id in ids}
+            for image in bind.execute(
+                sa.select(pet_images.c.pet_id, pet_images.c.url)
+                .where(pet_images.c.pet_id.in_(ids))
+                .order_by(pet_images.c.pet_id, pet_images.c.position, pet_images.c.image_id)
+            ):
+                urls[image.pet_id].append(image.url)
+            for pet_id, pet_urls in urls.items():
+                bind.execute(pets.update().where(pets.c.pet_id == pet_id).values(images=pet_urls))
+        op.drop_index("ix_pet_images_pet_id_position", table_name="pet_images")
+        op.drop_table("pet_images")
@@ -0,0 +1,58 @@
+"""Add tombstones table and updated_at indexes for delta sync
+
+Revision ID: a8b360c33258
+Revises: c8fae678b86b
+Create Date: 2026-10-19 15:05:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8b360c33258'
+down_revision = 'c8fae678b86b'
+branch_labels = None
+depends_on = None
+
+
+# rescue_reports and adoption_requests got theirs in c8fae678b86b
+INDEXED_TABLES = ["pets", "lost_found_reports"]
+
+
+def _indexes(bind, table: str) -> set[str]:
+    return {i["name"] for i in sa.inspect(bind).get_indexes(table)}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    # Fresh databases already have these from 0001_create_all.
+    if not sa.inspect(bind).has_table("tombstones"):
+        op.create_table(
+            "tombstones",
+            sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column("table_name", sa.String(), nullable=False),
+            sa.Column("row_id", postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column("deleted_at", sa.DateTime(), nullable=False),
+        )
+        op.create_index(
+            "ix_tombstones_table_name_deleted_at", "tombstones", ["table_name", "deleted_at", "id"]
+        )
+
+    for table in INDEXED_TABLES:
+        if f"ix_{table}_updated_at" not in _indexes(bind, table):
+            op.create_index(f"ix_{table}_updated_at", table, ["updated_at"])
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+
+    for table in INDEXED_TABLES:
+        if f"ix_{table}_updated_at" in _indexes(bind, table):
+            op.drop_index(f"ix_{table}_updated_at", table_name=table)
+
+    if sa.inspect(bind).has_table("tombstones"):
+        op.drop_table("tombstones")
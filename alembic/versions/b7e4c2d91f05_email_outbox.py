@@ -0,0 +1,47 @@
+"""Add email_outbox table
+
+Revision ID: b7e4c2d91f05
+Revises: a8b360c33258
+Create Date: 2026-10-19 16:10:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e4c2d91f05'
+down_revision = 'a8b360c33258'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Fresh databases already have it from 0001_create_all.
+    if sa.inspect(op.get_bind()).has_table("email_outbox"):
+        return
+
+    op.create_table(
+        "email_outbox",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("to_address", sa.String(), nullable=False),
+        sa.Column("subject", sa.String(), nullable=False),
+        sa.Column("body_text", sa.Text(), nullable=False),
+        sa.Column("body_html", sa.Text(), nullable=True),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("sent_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index(
+        "ix_email_outbox_status_next_attempt_at", "email_outbox", ["status", "next_attempt_at"]
+    )
+
+
+def downgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table("email_outbox"):
+        op.drop_table("email_outbox")
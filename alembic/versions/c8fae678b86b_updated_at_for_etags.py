@@ -0,0 +1,73 @@
+"""Add updated_at columns and indexes used for ETags
+
+Revision ID: c8fae678b86b
+Revises: d96f3a05d9a8
+Create Date: 2026-10-19 13:40:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8fae678b86b'
+down_revision = 'd96f3a05d9a8'
+branch_labels = None
+depends_on = None
+
+
+# table -> column to backfill from (None: the migration time), nullable
+NEW_COLUMNS = {
+    "products": ("created_at", False),
+    "leaderboard_users": ("created_at", False),
+    "users": (None, True),
+}
+
+INDEXED_TABLES = [
+    "products",
+    "leaderboard_users",
+    "users",
+    "stray_map_entries",
+    "rescue_reports",
+    "adoption_requests",
+]
+
+
+def _columns(bind, table: str) -> set[str]:
+    return {c["name"] for c in sa.inspect(bind).get_columns(table)}
+
+
+def _indexes(bind, table: str) -> set[str]:
+    return {i["name"] for i in sa.inspect(bind).get_indexes(table)}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    # Fresh databases already have these from 0001_create_all.
+    for table, (source, nullable) in NEW_COLUMNS.items():
+        if "updated_at" in _columns(bind, table):
+            continue
+        op.add_column(table, sa.Column("updated_at", sa.DateTime(), nullable=True))
+        op.execute(f"UPDATE {table} SET updated_at = {source or 'CURRENT_TIMESTAMP'}")
+        if not nullable:
+            with op.batch_alter_table(table) as batch:
+                batch.alter_column("updated_at", existing_type=sa.DateTime(), nullable=False)
+
+    for table in INDEXED_TABLES:
+        if f"ix_{table}_updated_at" not in _indexes(bind, table):
+            op.create_index(f"ix_{table}_updated_at", table, ["updated_at"])
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+
+    for table in INDEXED_TABLES:
+        if f"ix_{table}_updated_at" in _indexes(bind, table):
+            op.drop_index(f"ix_{table}_updated_at", table_name=table)
+
+    for table in NEW_COLUMNS:
+        if "updated_at" in _columns(bind, table):
+            with op.batch_alter_table(table) as batch:
+                batch.drop_column("updated_at")
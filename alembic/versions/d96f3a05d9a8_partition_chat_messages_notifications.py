@@ -0,0 +1,108 @@
+"""Partition chat_messages and notifications by month
+
+Revision ID: d96f3a05d9a8
+Revises: fa1653ae8f1a
+Create Date: 2026-10-19 10:12:00.000000
+
+"""
+
+from datetime import datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.database.partitions import (
+    MONTHS_AHEAD,
+    add_months,
+    create_default_partition,
+    ensure_partitions,
+    is_partitioned,
+    month_start,
+)
+
+
+# revision identifiers, used by Alembic.
+revision = 'd96f3a05d9a8'
+down_revision = 'fa1653ae8f1a'
+branch_labels = None
+depends_on = None
+
+
+# table, partition column, primary key, foreign keys, secondary index
+TABLES = [
+    (
+        "chat_messages",
+        "created_at",
+        "message_id, created_at",
+        [
+            "FOREIGN KEY (chat_id) REFERENCES chats (chat_id)",
+            "FOREIGN KEY (sender_id) REFERENCES users (id)",
+        ],
+        ("ix_chat_messages_chat_id_created_at", "chat_id, created_at"),
+    ),
+    (
+        "notifications",
+        "timestamp",
+        "notif_id, timestamp",
+        [
+            "FOREIGN KEY (user_id) REFERENCES users (id)",
+            "FOREIGN KEY (chat_id) REFERENCES chats (chat_id)",
+        ],
+        ("ix_notifications_user_id_timestamp", "user_id, timestamp"),
+    ),
+]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    this_month = month_start(datetime.now(timezone.utc))
+
+    for table, column, pk, fks, (index_name, index_cols) in TABLES:
+        if is_partitioned(bind, table):
+            # Created partitioned by 0001_create_all on a fresh database
+            ensure_partitions(bind, table, this_month, add_months(this_month, MONTHS_AHEAD))
+            continue
+
+        legacy = f"{table}_unpartitioned"
+        op.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+        op.execute(f"ALTER INDEX IF EXISTS {table}_pkey RENAME TO {legacy}_pkey")
+        op.execute(f"UPDATE {legacy} SET {column} = now() at time zone 'utc' WHERE {column} IS NULL")
+
+        constraints = ",\n".join([f"PRIMARY KEY ({pk})", *fks])
+        op.execute(
+            f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS, {constraints}) "
+            f"PARTITION BY RANGE ({column})"
+        )
+        op.execute(f"CREATE INDEX {index_name} ON {table} ({index_cols})")
+
+        oldest = bind.scalar(sa.text(f"SELECT min({column}) FROM {legacy}"))
+        first_month = month_start(oldest) if oldest else this_month
+        ensure_partitions(bind, table, first_month, add_months(this_month, MONTHS_AHEAD))
+        create_default_partition(bind, table)
+
+        op.execute(f"INSERT INTO {table} SELECT * FROM {legacy}")
+        op.execute(f"DROP TABLE {legacy}")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    for table, column, pk, fks, (index_name, index_cols) in TABLES:
+        if not is_partitioned(bind, table):
+            continue
+
+        partitioned = f"{table}_partitioned"
+        op.execute(f"ALTER TABLE {table} RENAME TO {partitioned}")
+        op.execute(f"ALTER INDEX IF EXISTS {table}_pkey RENAME TO {partitioned}_pkey")
+        op.execute(f"ALTER INDEX IF EXISTS {index_name} RENAME TO {partitioned}_{index_name}")
+
+        pk_column = pk.split(",")[0].strip()
+        constraints = ",\n".join([f"PRIMARY KEY ({pk_column})", *fks])
+        op.execute(f"CREATE TABLE {table} (LIKE {partitioned} INCLUDING DEFAULTS, {constraints})")
+        op.execute(f"INSERT INTO {table} SELECT * FROM {partitioned}")
+        op.execute(f"DROP TABLE {partitioned}")
@@ -0,0 +1,36 @@
+"""Add rate_limit_windows table for the database rate limit storage
+
+Revision ID: e3f9a1c47b26
+Revises: b7e4c2d91f05
+Create Date: 2026-10-19 16:40:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e3f9a1c47b26'
+down_revision = 'b7e4c2d91f05'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Fresh databases already have it from 0001_create_all.
+    if sa.inspect(op.get_bind()).has_table("rate_limit_windows"):
+        return
+
+    op.create_table(
+        "rate_limit_windows",
+        sa.Column("key", sa.String(), primary_key=True),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column("expires_at", sa.Float(), nullable=False),
+    )
+    op.create_index("ix_rate_limit_windows_expires_at", "rate_limit_windows", ["expires_at"])
+
+
+def downgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table("rate_limit_windows"):
+        op.drop_table("rate_limit_windows")
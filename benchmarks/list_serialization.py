@@ -0,0 +1,107 @@
+# Serialization cost of the big list responses: FastAPI response_model path vs orjson.
+#
+# Builds synthetic pages shaped like /lost-found/ and /rescue-rep/ service output
+# and times, per page:
+#   validate+dump  - what FastAPI does with response_model (validate dicts, dump JSON)
+#   encoder+json   - jsonable_encoder + stdlib json (older FastAPI / no response_model)
+#   orjson         - ORJSONResponse.render on the trusted dicts (what the routes return now)
+# No database needed.
+#
+#   python -m benchmarks.list_serialization --items 100 1000 10000
+
+import argparse
+import json
+import sys
+import time
+import uuid
+from pathlib import Path
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.lost_found.models import LostFoundResponse  # noqa: E402
+from src.pagination import Page  # noqa: E402
+from src.rescue_rep.models import RescueReportResponse  # noqa: E402
+from src.responses import ORJSONResponse  # noqa: E402
+
+
+def _lost_found_item(i: int) -> dict:
+    return {
+        "reportId": uuid.uuid4(),
+        "userId": uuid.uuid4(),
+        "userFirstName": "Jane",
+        "userLastName": "Doe",
+        "userFullName": "Jane Doe",
+        "pet_name": f"Pet {i}",
+        "pet_type": "Dog",
+        "gender": "Female",
+        "description": "Brown, answers to her name, last seen near the park entrance.",
+        "location": "Colombo 07",
+        "latitude": 6.9 + i * 1e-5,
+        "longitude": 79.86 + i * 1e-5,
+        "photo": f"https://bucket.s3.amazonaws.com/lost/{uuid.uuid4()}.jpg",
+        "status": "Lost",
+        "chatId": uuid.uuid4(),
+    }
+
+
+def _rescue_item(i: int) -> dict:
+    return {
+        "reportId": uuid.uuid4(),
+        "userId": uuid.uuid4(),
+        "userFirstName": "John",
+        "userLastName": "Doe",
+        "userFullName": "John Doe",
+        "location": "Kandy",
+        "latitude": 7.29 + i * 1e-5,
+        "longitude": 80.63 + i * 1e-5,
+        "photo": f"https://bucket.s3.amazonaws.com/rescue/{uuid.uuid4()}.jpg",
+        "status": "Pending",
+        "alert_type": "High",
+        "description": "Injured dog on the roadside, needs transport to a vet.",
+        "chatId": uuid.uuid4(),
+    }
+
+
+ENDPOINTS = {
+    "lost-found": (LostFoundResponse, _lost_found_item),
+    "rescue-rep": (RescueReportResponse, _rescue_item),
+}
+
+
+def _time(fn, repeat: int) -> float:
+    fn()  # warm up
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="List response serialization benchmark")
+    parser.add_argument("--items", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    response = ORJSONResponse(None)
+
+    print(f"{'endpoint':<11} {'items':>6} {'validate+dump ms':>17} {'encoder+json ms':>16} {'orjson ms':>10} {'speedup':>8}")
+    for name, (model, make_item) in ENDPOINTS.items():
+        adapter = TypeAdapter(Page[model])
+        for n in args.items:
+            page = {"items": [make_item(i) for i in range(n)], "next_cursor": "eyJ4IjoxfQ"}
+
+            validated = _time(lambda: adapter.dump_json(adapter.validate_python(page)), args.repeat)
+            encoded = _time(lambda: json.dumps(jsonable_encoder(page)).encode(), args.repeat)
+            fast = _time(lambda: response.render(page), args.repeat)
+
+            print(
+                f"{name:<11} {n:>6} {validated:>17.2f} {encoded:>16.2f} {fast:>10.2f} "
+                f"{validated / fast:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
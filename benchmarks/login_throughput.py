@@ -0,0 +1,69 @@
+# Login throughput by bcrypt cost factor: inline hashing vs the process pool.
+#
+# Simulates a login storm of --logins verifications from --concurrency request
+# threads and reports logins/s and latency, per BCRYPT_ROUNDS value:
+#   inline - bcrypt in the request thread (what the API did before src/auth/hashing.py)
+#   pool   - bcrypt on a spawned process pool with --workers processes
+# No database needed.
+#
+#   python -m benchmarks.login_throughput --rounds 10 11 12 13 --workers 4
+
+import argparse
+import multiprocessing
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from passlib.context import CryptContext
+
+
+PASSWORD = "correct horse battery staple"
+
+
+def _verify(hashed: str) -> bool:
+    return CryptContext(schemes=["bcrypt"]).verify(PASSWORD, hashed)
+
+
+def _storm(login, logins: int, concurrency: int) -> tuple[float, list[float]]:
+    latencies = []
+
+    def one(_):
+        started = time.perf_counter()
+        login()
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as threads:
+        list(threads.map(one, range(logins)))
+    return logins / (time.perf_counter() - started), latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Login (bcrypt verify) throughput benchmark")
+    parser.add_argument("--rounds", type=int, nargs="+", default=[10, 11, 12, 13])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=40, help="request threads (ANYIO_THREAD_LIMIT)")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1), help="hashing processes")
+    args = parser.parse_args()
+
+    pool = ProcessPoolExecutor(max_workers=args.workers, mp_context=multiprocessing.get_context("spawn"))
+    list(pool.map(int, range(args.workers)))  # start the processes before timing
+
+    print(f"{'rounds':>6} {'mode':<7} {'logins/s':>9} {'p50 ms':>8} {'p95 ms':>8}")
+    for rounds in args.rounds:
+        hashed = CryptContext(schemes=["bcrypt"], bcrypt__rounds=rounds).hash(PASSWORD)
+        modes = {
+            "inline": lambda: _verify(hashed),
+            "pool": lambda: pool.submit(_verify, hashed).result(),
+        }
+        for mode, login in modes.items():
+            rate, latencies = _storm(login, args.logins, args.concurrency)
+            p95 = statistics.quantiles(latencies, n=20)[-1]
+            print(f"{rounds:>6} {mode:<7} {rate:>9.1f} {statistics.median(latencies):>8.1f} {p95:>8.1f}")
+
+    pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
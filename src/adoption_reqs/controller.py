@@ -1,13 +1,16 @@
 from fastapi import APIRouter, UploadFile, File, Depends, status, HTTPException
-from typing import List
 from uuid import UUID
 from ..database.core import DbSession
 from . import models, service
 from ..auth.service import CurrentUser
+from ..pagination import Page, Pagination
+from ..responses import ORJSONResponse
+from ..sync import ChangeSet, Sync
+from ..fields import Fields
 from .service import get_adoption_request_by_chat
 from src.entities.pet import Pet
+from src.pets.service import add_pet_image
 from src.utils.s3_service import upload_image_to_s3
-from datetime import datetime, timezone
 import logging
 
 router = APIRouter(
@@ -15,23 +18,32 @@ router = APIRouter(
     tags=["Adoption Requests"]
 )
 
-@router.get("/all", response_model=List[models.AdoptionRequestResponse])
-def get_all_adoption_requests(db: DbSession, current_user: CurrentUser):
+@router.get("/all", response_model=Page[models.AdoptionRequestResponse], response_class=ORJSONResponse)
+def get_all_adoption_requests(db: DbSession, current_user: CurrentUser, page: Pagination, fields: Fields):
     
-    #Get all adoption requests (public).
+    #Get a page of adoption requests (public), newest first.
     # If a user is logged in, exclude their own requests.
     
     user_id = current_user.get_uuid() 
     exclude_user_id=user_id
-    return service.get_all_adoption_requests(db, exclude_user_id)
+    # Items are built as AdoptionRequestResponse once in the service; don't validate them again.
+    return ORJSONResponse(service.get_all_adoption_requests(db, page, exclude_user_id, fields))
 
 
-@router.get("/mine", response_model=List[models.AdoptionRequestResponse])
-def get_my_adoption_requests(db: DbSession, current_user: CurrentUser):
+@router.get("/changes", response_model=ChangeSet[models.AdoptionRequestResponse])
+def get_adoption_request_changes(db: DbSession, current_user: CurrentUser, sync: Sync):
     
-    #Get all adoption requests created by the logged-in user.
+    # Delta sync of the /all feed: requests created, updated or deleted since the cursor.
     
-    return service.get_adoption_requests(current_user, db)
+    return service.get_adoption_request_changes(current_user, db, sync)
+
+
+@router.get("/mine", response_model=Page[models.AdoptionRequestResponse])
+def get_my_adoption_requests(db: DbSession, current_user: CurrentUser, page: Pagination):
+    
+    #Get a page of adoption requests created by the logged-in user, newest first.
+    
+    return service.get_adoption_requests(current_user, db, page)
 
 
 
@@ -39,9 +51,9 @@ def get_my_adoption_requests(db: DbSession, current_user: CurrentUser):
 def create_adoption_request(db: DbSession, adoption_req: models.AdoptionRequestCreate, current_user: CurrentUser):
     return service.create_adoption_request(current_user, db, adoption_req)
 
-@router.get("/", response_model=List[models.AdoptionRequestResponse])
-def get_adoption_requests(db: DbSession, current_user: CurrentUser):
-    return service.get_adoption_requests(current_user, db)
+@router.get("/", response_model=Page[models.AdoptionRequestResponse])
+def get_adoption_requests(db: DbSession, current_user: CurrentUser, page: Pagination):
+    return service.get_adoption_requests(current_user, db, page)
 
 @router.get("/{adopt_id}", response_model=models.AdoptionRequestResponse)
 def get_adoption_request(db: DbSession, adopt_id: UUID, current_user: CurrentUser):
@@ -75,7 +87,7 @@ def get_adoption_request_by_chat(chat_id: UUID, db: DbSession, current_user: Cur
 
 
 @router.post("/{pet_id}/upload-image")
-async def upload_pet_image(
+def upload_pet_image(
     pet_id: UUID,
     file: UploadFile ,
     db: DbSession ,
@@ -96,6 +108,8 @@ async def upload_pet_image(
     try:
         # will go under pets
         url = upload_image_to_s3(file, folder="pets")
+    except HTTPException:
+        raise
     except Exception as e:
         logging.error(f"Pet image upload failed: {e}")
         raise HTTPException(
@@ -103,13 +117,7 @@ async def upload_pet_image(
             detail="Failed to upload image to storage",
         )
 
-    images = pet.images or []
-    images.append(url)
-    pet.images = images
-    pet.updated_at = datetime.now(timezone.utc)
-
-    db.add(pet)
+    add_pet_image(db, pet, url)
     db.commit()
-    db.refresh(pet)
 
-    return {"url": url, "images": images}
\ No newline at end of file
+    return {"url": url, "images": pet.images}
\ No newline at end of file
@@ -1,9 +1,10 @@
 from datetime import datetime
-from typing import Optional, List
-from pydantic import BaseModel, ConfigDict
+from typing import Dict, Optional, List
+from pydantic import BaseModel, ConfigDict, model_validator
 from ..entities.adoption_req import AdoptionStatus
 from src.entities.pet import PetType, PetGender, PetSizeEnum, PetTemperamentEnum, PetActivityLevelEnum
 import enum
+from src.media.variants import fill_variants
 
 # Nested pet details for adoption request
 class PetCreate(BaseModel):
@@ -23,6 +24,13 @@ class PetResponse(PetCreate):
     owner_id: str
     created_at: datetime
     updated_at: datetime
+    # thumb/medium URLs for each entry of images (None where there are none)
+    image_variants: List[Optional[Dict[str, str]]] = []
+
+    @model_validator(mode="after")
+    def _derive_missing_variants(self):
+        self.image_variants = fill_variants(self.images or [], self.image_variants)
+        return self
 
     @classmethod
     def from_orm(cls, pet):
@@ -38,7 +46,8 @@ class PetResponse(PetCreate):
             gender=pet.gender.value if isinstance(pet.gender, enum.Enum) else pet.gender,
             color=pet.color,
             description=pet.description,
-            images=pet.images or [],
+            images=pet.images,
+            image_variants=pet.image_variants,
             created_at=pet.created_at,
             updated_at=pet.updated_at
         )
@@ -1,16 +1,20 @@
-from uuid import uuid4, UUID
+from uuid import UUID
 from datetime import datetime, timezone
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager, joinedload
 from fastapi import HTTPException
 from . import models
 from src.auth.models import TokenData
 from ..entities.adoption_req import AdoptionRequest, AdoptionStatus
 from ..entities.pet import Pet
+from ..database.ids import uuid7
 from src.entities.leaderboard import LeaderboardUser  
 from sqlalchemy import and_
 from sqlalchemy import func
 from src.entities.leaderboard import LeaderboardUser
 from src.entities.chat import ChatMessage
+from src.pagination import PageParams, paginate
+from src.sync import SyncParams, changes_since
+from src.fields import FieldMap, check_fields, load_options, project
 import logging
 from datetime import datetime, timezone
 
@@ -28,7 +32,7 @@ def create_adoption_request(
         # Create Pet
         pet_data = adoption_req.pet.model_dump(exclude={"images"})
         new_pet = Pet(**pet_data)
-        new_pet.pet_id = uuid4()
+        new_pet.pet_id = uuid7()
         new_pet.user_id = current_user.get_uuid()
         new_pet.created_at = datetime.now(timezone.utc)
         new_pet.updated_at = datetime.now(timezone.utc)
@@ -38,7 +42,7 @@ def create_adoption_request(
 
         # Create Adoption Request
         new_request = AdoptionRequest(
-            adopt_id=uuid4(),
+            adopt_id=uuid7(),
             pet_id=new_pet.pet_id,
             requester_id=current_user.get_uuid(),
             description=adoption_req.description,
@@ -93,21 +97,28 @@ def create_adoption_request(
 
 
 
-def get_adoption_requests(current_user: TokenData, db: Session) -> list[models.AdoptionRequestResponse]:
-    requests = db.query(AdoptionRequest).filter(AdoptionRequest.requester_id == current_user.get_uuid()).all()
-    response = []
-    for r in requests:
-        pet = db.query(Pet).filter(Pet.pet_id == r.pet_id).first()
-        response.append(models.AdoptionRequestResponse(
-            id=str(r.adopt_id),
-            pet=models.PetResponse.from_orm(pet),
-            requester_id=str(r.requester_id),
-            description=r.description,
-            status=r.status.value,
-            created_at=r.created_at,
-            updated_at=r.updated_at
-        ))
-    return response
+def _to_response(r: AdoptionRequest) -> models.AdoptionRequestResponse:
+    # For listings: r.pet must already be loaded with the page, or this queries per row.
+    return models.AdoptionRequestResponse(
+        id=str(r.adopt_id),
+        pet=models.PetResponse.from_orm(r.pet),
+        requester_id=str(r.requester_id),
+        description=r.description,
+        status=r.status.value,
+        created_at=r.created_at,
+        updated_at=r.updated_at
+    )
+
+
+def get_adoption_requests(current_user: TokenData, db: Session, page: PageParams) -> dict:
+    # A page of the caller's own requests, newest first, each with its pet joined in.
+    query = (
+        db.query(AdoptionRequest)
+        .options(joinedload(AdoptionRequest.pet, innerjoin=True))
+        .filter(AdoptionRequest.requester_id == current_user.get_uuid())
+    )
+    requests, next_cursor = paginate(query, page, AdoptionRequest.created_at, AdoptionRequest.adopt_id)
+    return {"items": [_to_response(r) for r in requests], "next_cursor": next_cursor}
 
 
 def get_adoption_request_by_id(current_user: TokenData, db: Session, adopt_id: UUID) -> models.AdoptionRequestResponse:
@@ -276,14 +287,49 @@ def get_adoption_request_by_chat(current_user, db: Session, chat_id: UUID) -> mo
     )
 
 
+# AdoptionRequestResponse field -> (what to load, value), for sparse ?fields= lists
+# (see src/fields.py). The nested "pet" is handled separately: it comes from the join.
+REQUEST_FIELDS: FieldMap = {
+    "id": ((AdoptionRequest.adopt_id,), lambda r: str(r.adopt_id)),
+    "requester_id": ((AdoptionRequest.requester_id,), lambda r: str(r.requester_id)),
+    "description": ((AdoptionRequest.description,), lambda r: r.description),
+    "status": ((AdoptionRequest.status,), lambda r: r.status.value),
+    "chat_id": ((AdoptionRequest.chat_id,), lambda r: str(r.chat_id) if r.chat_id else None),
+    "created_at": ((AdoptionRequest.created_at,), lambda r: r.created_at),
+    "updated_at": ((AdoptionRequest.updated_at,), lambda r: r.updated_at),
+}
+
+
+def _get_sparse_adoption_requests(db: Session, query, page: PageParams, fields: set[str]) -> dict:
+    columns = fields - {"pet"}
+    query = query.options(*load_options(
+        REQUEST_FIELDS, columns, AdoptionRequest.created_at, AdoptionRequest.adopt_id, AdoptionRequest.pet_id
+    ))
+    if "pet" in fields:
+        query = query.options(contains_eager(AdoptionRequest.pet))
+    requests, next_cursor = paginate(query, page, AdoptionRequest.created_at, AdoptionRequest.adopt_id)
+
+    items = [project(r, REQUEST_FIELDS, columns) for r in requests]
+    if "pet" in fields:
+        for item, r in zip(items, requests):
+            item["pet"] = models.PetResponse.from_orm(r.pet)
+
+    return {"items": items, "next_cursor": next_cursor}
+
+
 def get_all_adoption_requests(
     db: Session,
-    exclude_user_id: str | None = None
-) -> list[models.AdoptionRequestResponse]:
-    """Return all adoption requests, excluding current user's pets and requests."""
+    page: PageParams,
+    exclude_user_id: str | None = None,
+    fields: set[str] | None = None
+) -> dict:
+    """Return a page of adoption requests, excluding current user's pets and requests."""
+    check_fields(REQUEST_FIELDS, fields, extra=("pet",))
+    # The feed already joins Pet to filter on it; contains_eager() fills r.pet from that
+    # same row instead of one Pet query per request.
     query = (
         db.query(AdoptionRequest)
-        .join(Pet, AdoptionRequest.pet_id == Pet.pet_id)
+        .join(AdoptionRequest.pet)
         .filter(Pet.is_adopted == False)  # only available pets
     )
 
@@ -295,24 +341,26 @@ def get_all_adoption_requests(
             )
         )
 
-    requests = query.all()
-    response = []
-
-    for r in requests:
-        pet = db.query(Pet).filter(Pet.pet_id == r.pet_id).first()
-        if not pet:
-            continue
-
-        response.append(
-            models.AdoptionRequestResponse(
-                id=str(r.adopt_id),
-                pet=models.PetResponse.from_orm(pet),
-                requester_id=str(r.requester_id),
-                description=r.description,
-                status=r.status.value,
-                created_at=r.created_at,
-                updated_at=r.updated_at,
-            )
-        )
+    if fields is not None:
+        return _get_sparse_adoption_requests(db, query, page, fields)
+
+    query = query.options(contains_eager(AdoptionRequest.pet))
+    requests, next_cursor = paginate(query, page, AdoptionRequest.created_at, AdoptionRequest.adopt_id)
+    return {"items": [_to_response(r) for r in requests], "next_cursor": next_cursor}
 
-    return response
\ No newline at end of file
+
+def get_adoption_request_changes(current_user: TokenData, db: Session, params: SyncParams) -> dict:
+    # Changes to the public adoption feed (everyone's requests but the caller's own).
+    # Unlike /all this includes requests whose pet has since been adopted, so clients
+    # see them change status; they drop entries that are no longer Pending.
+    query = (
+        db.query(AdoptionRequest)
+        .options(joinedload(AdoptionRequest.pet, innerjoin=True))
+        .filter(AdoptionRequest.requester_id != current_user.get_uuid())
+    )
+    changes = changes_since(
+        query, params, AdoptionRequest.updated_at, AdoptionRequest.adopt_id,
+        exclude_owner_id=current_user.get_uuid(),
+    )
+    changes["upserts"] = [_to_response(r) for r in changes["upserts"]]
+    return changes
@@ -1,4 +1,5 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
+from src.auth.service import get_admin_user
 from src.auth.controller import router as auth_router
 from src.users.controller import router as users_router
 from src.pets.controller import router as pets_router
@@ -12,6 +13,11 @@ from src.stray_map.controller import router as stray_map_router
 from src.leaderboard.controller import router as leaderboard_router
 from src.cart.controller import router as cart_router
 from src.stats import router as stats_router
+from src.metrics import router as metrics_router
+from src.batch.controller import router as batch_router
+from src.export.controller import router as export_router
+from src.search.controller import router as search_router
+from src.media.controller import router as media_router
 
 from src.chat.controller import router as chat_router
 
@@ -30,4 +36,10 @@ def register_routes(app: FastAPI):
     app.include_router(chat_router) 
     app.include_router(leaderboard_router)
     app.include_router(cart_router)
-    app.include_router(stats_router)
\ No newline at end of file
+    app.include_router(stats_router)
+    # Admin-only; metrics.py can't import the auth dependency itself (auth registers metrics).
+    app.include_router(metrics_router, dependencies=[Depends(get_admin_user)])
+    app.include_router(batch_router)
+    app.include_router(export_router)
+    app.include_router(search_router)
+    app.include_router(media_router)
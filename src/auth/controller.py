@@ -2,17 +2,17 @@
 
 from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, Request, status
-from jose import JWTError, jwt
 from datetime import datetime, timedelta, timezone
 from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
 from ..database.core import DbSession
 from ..rate_limiter import limiter
+from .revocation import revoke_user_tokens
 from . import models, service
-from .service import SECRET_KEY, ALGORITHM, create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES
+from .service import create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES
 from src.entities.user import User
 from src.auth.verification import hash_code, generate_code
 
-from src.utils.ses_service import send_verification_code
+from src.outbox.service import enqueue_verification_code, notify_worker
 import os
 
 router = APIRouter(
@@ -28,9 +28,11 @@ from fastapi import File, UploadFile, Form
 from ..entities.user import PreferredSpeciesEnum, PreferredSizeEnum, TemperamentEnum, ActivityLevelEnum
 
 
+# Plain def: bcrypt, the S3 photo upload and the SES send all block, so this runs
+# on the threadpool rather than the event loop.
 @router.post("/", status_code=status.HTTP_201_CREATED)
 @limiter.limit("5/hour")
-async def register_user(
+def register_user(
     request: Request,
     db: DbSession,
     email: str = Form(...),
@@ -80,7 +82,7 @@ async def register_user(
 
 # Login to get JWT token
 @router.post("/token", response_model=models.Token)
-async def login_for_access_token(
+def login_for_access_token(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     db: DbSession
 ):
@@ -107,15 +109,12 @@ from fastapi import Form
 
 # Verify token endpoint (for frontend calls like /auth/verify)
 @router.post("/verify")
-async def verify_token(token: str = Depends(oauth2_scheme)):
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        if not user_id:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
-        return {"valid": True, "user_id": user_id}
-    except JWTError:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token")
+def verify_token(token: str = Depends(oauth2_scheme)):
+    # Same checks as every authenticated route: signature, expiry, deactivation and revocation.
+    token_data = service.verify_token(token)
+    if not token_data.user_id:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
+    return {"valid": True, "user_id": token_data.user_id}
 
 
 
@@ -168,8 +167,9 @@ def resend_code(request: Request, body: models.ResendCodeRequest, db: DbSession)
     user.email_verification_expires_at = datetime.now(timezone.utc) + timedelta(minutes=VERIFY_CODE_TTL_MIN)
     user.email_verification_attempts = 0
     user.is_active = False
+    revoke_user_tokens(user)
+    enqueue_verification_code(db, user.email, code)
     db.commit()
-
-    send_verification_code(user.email, code)
+    notify_worker()
 
     return {"message": "A new verification code has been sent."}
\ No newline at end of file
@@ -0,0 +1,118 @@
+# Password hashing on a dedicated, size-limited process pool.
+#
+# bcrypt costs tens of milliseconds of CPU per call (more with BCRYPT_ROUNDS). Run
+# inline, a login storm ties up every request thread on the worker. Hashes and
+# verifications go to HASH_WORKERS processes instead; they are spawned, not forked,
+# so they do not inherit the app's database connections or threads.
+#
+# At most HASH_QUEUE_MAX calls may be queued or running per API worker. Past that,
+# callers get an immediate 503 with Retry-After instead of waiting in line, so a
+# storm sheds load rather than piling up requests that will time out anyway.
+#
+# HASH_WORKERS=0 hashes inline (development, CLI scripts, tests). Queue depth,
+# completed and failed calls, and rejections are exposed under "password_hashing"
+# at GET /metrics.
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from passlib.context import CryptContext
+
+from ..exceptions import PasswordHashingBusyError
+from ..metrics import register_metrics
+
+
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+HASH_WORKERS = int(os.getenv("HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+HASH_QUEUE_MAX = int(os.getenv("HASH_QUEUE_MAX", str(max(1, HASH_WORKERS) * 8)))
+HASH_RETRY_AFTER_SECONDS = 1
+
+# Also built in each pool process when it imports this module. Hashes made with
+# other cost factors still verify; deprecated="auto" flags them for rehashing.
+bcrypt_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+
+_executor: ProcessPoolExecutor | None = None
+_executor_lock = threading.Lock()
+_slots = threading.BoundedSemaphore(HASH_QUEUE_MAX)
+_stats = {"in_flight": 0, "completed": 0, "failed": 0, "rejected": 0}
+_stats_lock = threading.Lock()
+
+
+def _hash(password: str) -> str:
+    return bcrypt_context.hash(password)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return bcrypt_context.verify(plain_password, hashed_password)
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=HASH_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def _run(fn, *args):
+    if HASH_WORKERS <= 0:
+        return fn(*args)
+
+    if not _slots.acquire(blocking=False):
+        with _stats_lock:
+            _stats["rejected"] += 1
+        raise PasswordHashingBusyError(HASH_RETRY_AFTER_SECONDS)
+
+    with _stats_lock:
+        _stats["in_flight"] += 1
+    outcome = "failed"
+    try:
+        result = _get_executor().submit(fn, *args).result()
+        outcome = "completed"
+        return result
+    except BrokenProcessPool:
+        # A pool process died (e.g. OOM-killed); start a fresh pool for the next caller.
+        logging.error("[Hashing] password hashing pool broke; restarting it")
+        shutdown(wait=False)
+        raise PasswordHashingBusyError(HASH_RETRY_AFTER_SECONDS)
+    finally:
+        with _stats_lock:
+            _stats["in_flight"] -= 1
+            _stats[outcome] += 1
+        _slots.release()
+
+
+def hash_password(password: str) -> str:
+    return _run(_hash, password)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return _run(_verify, plain_password, hashed_password)
+
+
+def shutdown(wait: bool = True) -> None:
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def hashing_status() -> dict:
+    with _stats_lock:
+        return {
+            "workers": HASH_WORKERS,
+            "queue_max": HASH_QUEUE_MAX,
+            "bcrypt_rounds": BCRYPT_ROUNDS,
+            **_stats,
+        }
+
+
+register_metrics("password_hashing", hashing_status)
@@ -26,7 +26,12 @@ class Token(BaseModel):
     token_type: str
     
 class TokenData(BaseModel):
+    # Claims from the access token; is_admin / is_active are as of when it was issued,
+    # and tokens are revoked via token_version when those matter (see revocation.py).
     user_id: str | None = None
+    is_admin: bool = False
+    is_active: bool = True
+    token_version: int = 0
 
     def get_uuid(self) -> UUID | None:
         if self.user_id:
@@ -0,0 +1,117 @@
+# Access-token revocation by user.
+#
+# Tokens carry the user's token_version as the `ver` claim. Changing a password bumps
+# users.token_version, and any token with a lower `ver` is then rejected, without
+# looking the user up on every request. Tokens also carry is_active and is_admin, so
+# any flush that changes either of those on a User bumps the version too.
+#
+# Each worker keeps {user id: current token_version} in memory for users whose version
+# was ever bumped. A bump made by this worker applies as soon as its transaction
+# commits; a rolled-back bump never applies. Bumps made by other
+# workers or tasks are picked up by re-reading recently updated users at most every
+# TOKEN_REVOCATION_REFRESH_SECONDS, so a revoked token stays usable on those for at
+# most that long.
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from ..entities.user import User
+from ..metrics import register_metrics
+
+
+TOKEN_REVOCATION_REFRESH_SECONDS = float(os.getenv("TOKEN_REVOCATION_REFRESH_SECONDS", "30"))
+
+_versions: dict[UUID, int] = {}
+_lock = threading.Lock()
+_next_refresh = 0.0
+_refreshed_since: datetime | None = None
+
+# session.info key: {user id: token_version} bumped in the session's open transaction.
+_PENDING_KEY = "revoked_token_versions"
+
+
+def revoke_user_tokens(user: User) -> None:
+    # Bump the caller's User row; older tokens are rejected here once the caller commits.
+    user.token_version = (user.token_version or 0) + 1
+    session = object_session(user)
+    if session is not None:
+        session.info.setdefault(_PENDING_KEY, {})[user.id] = user.token_version
+
+
+def _claim_refresh() -> bool:
+    # Only one request per interval does the refresh; the others carry on.
+    global _next_refresh
+    with _lock:
+        if time.monotonic() < _next_refresh:
+            return False
+        _next_refresh = time.monotonic() + TOKEN_REVOCATION_REFRESH_SECONDS
+        return True
+
+
+def _refresh() -> None:
+    global _refreshed_since
+    from ..database.core import SessionLocal
+
+    # Overlap the previous read a little so rows committed during it are not missed.
+    started = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(seconds=5)
+    try:
+        with SessionLocal() as db:
+            query = db.query(User.id, User.token_version).filter(User.token_version > 0)
+            if _refreshed_since is not None:
+                query = query.filter(User.updated_at >= _refreshed_since)
+            rows = query.all()
+    except Exception as e:
+        logging.error(f"[Auth] token revocation refresh failed: {e}")
+        return
+
+    with _lock:
+        for user_id, version in rows:
+            _versions[user_id] = max(version, _versions.get(user_id, 0))
+    _refreshed_since = started
+
+
+def is_revoked(user_id: UUID, token_version: int) -> bool:
+    if time.monotonic() >= _next_refresh and _claim_refresh():
+        _refresh()
+    return token_version < _versions.get(user_id, 0)
+
+
+def revocation_status() -> dict:
+    return {"tracked_users": len(_versions), "refresh_seconds": TOKEN_REVOCATION_REFRESH_SECONDS}
+
+
+@event.listens_for(Session, "before_flush")
+def _revoke_on_claim_change(session: Session, flush_context, instances) -> None:
+    for obj in session.dirty:
+        if not isinstance(obj, User):
+            continue
+        attrs = inspect(obj).attrs
+        if attrs.token_version.history.has_changes():
+            continue  # already revoked in this flush
+        if attrs.is_active.history.has_changes() or attrs.is_admin.history.has_changes():
+            revoke_user_tokens(obj)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    with _lock:
+        for user_id, version in pending.items():
+            _versions[user_id] = max(version, _versions.get(user_id, 0))
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+register_metrics("token_revocation", revocation_status)
@@ -1,17 +1,21 @@
 import os
 from datetime import timedelta, datetime, timezone
 from typing import Annotated
-from uuid import UUID, uuid4
+from uuid import UUID
 from fastapi import Depends, HTTPException, status
-from passlib.context import CryptContext
 from jose import JWTError, jwt
 from sqlalchemy.orm import Session
 from src.entities.user import User
+from src.database.ids import uuid7
 from . import models
 from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
-from ..exceptions import AuthenticationError
+from ..exceptions import AuthenticationError, UserNotFoundError
+from ..database.core import DbSession
+from .token_cache import token_cache
+from .revocation import is_revoked
+from . import hashing
 import logging
-from src.utils.ses_service import send_verification_code
+from src.outbox.service import enqueue_verification_code, notify_worker
 from src.auth.verification import generate_code, hash_code
 
 from src.utils.s3_service import upload_image_to_s3
@@ -23,15 +27,15 @@ ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 
 oauth2_bearer = OAuth2PasswordBearer(tokenUrl='auth/token')
-bcrypt_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
 
 
+# bcrypt runs on a bounded process pool and raises a 503 when it is full (see hashing.py).
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return bcrypt_context.verify(plain_password, hashed_password)
+    return hashing.verify_password(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
-    return bcrypt_context.hash(password)
+    return hashing.hash_password(password)
 
 
 def authenticate_user(email: str, password: str, db: Session) -> User | bool:
@@ -45,6 +49,9 @@ def create_access_token(user: User, expires_delta: timedelta) -> str:
     to_encode = {
         "sub": str(user.id),                    
         "email": user.email,                    
+        "is_admin": bool(user.is_admin),
+        "is_active": bool(user.is_active),
+        "ver": user.token_version or 0,
         "exp": datetime.now(timezone.utc) + expires_delta,
     }
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
@@ -53,14 +60,29 @@ def create_access_token(user: User, expires_delta: timedelta) -> str:
 
 
 def verify_token(token: str) -> models.TokenData:
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str | None = payload.get("sub")
-        logging.info(f"Decoded JWT payload: {payload}")
-        return models.TokenData(user_id=user_id)
-    except JWTError as e:
-        logging.warning(f"Token verification failed: {str(e)}")
-        raise AuthenticationError()
+    # Decoded claims are cached until the token expires (see token_cache.py).
+    token_data = token_cache.get(token)
+    if token_data is None:
+        try:
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        except JWTError as e:
+            logging.warning(f"Token verification failed: {str(e)}")
+            raise AuthenticationError()
+        logging.debug(f"Decoded JWT payload: {payload}")
+        token_data = models.TokenData(
+            user_id=payload.get("sub"),
+            # Tokens issued before these claims existed: not admin, version 0.
+            is_admin=payload.get("is_admin", False),
+            is_active=payload.get("is_active", True),
+            token_version=payload.get("ver", 0),
+        )
+        if payload.get("exp") is not None:
+            token_cache.put(token, token_data, float(payload["exp"]))
+
+    # Deactivated users and changed passwords revoke older tokens (see revocation.py).
+    if not token_data.is_active or (token_data.user_id and is_revoked(token_data.get_uuid(), token_data.token_version)):
+        raise AuthenticationError("Token has been revoked")
+    return token_data
 
 
 
@@ -96,7 +118,7 @@ def register_user(
         expires_at = datetime.now(timezone.utc) + timedelta(minutes=VERIFY_CODE_TTL_MIN)
 
         user = User(
-            id=uuid4(),
+            id=uuid7(),
             email=email,
             first_name=first_name,
             last_name=last_name,
@@ -119,11 +141,11 @@ def register_user(
             email_verification_attempts=0,
         )
 
+        # The code email is queued in the same transaction as the user (see src/outbox)
         db.add(user)
+        enqueue_verification_code(db, email, code)
         db.commit()
-
-        # Send code by email
-        send_verification_code(email, code)
+        notify_worker()
 
         return {"message": "Account created. Verification code sent to email."}
 
@@ -139,6 +161,46 @@ def get_current_user(token: Annotated[str, Depends(oauth2_bearer)]) -> models.To
 CurrentUser = Annotated[models.TokenData, Depends(get_current_user)]
 
 
+def get_admin_user(current_user: CurrentUser) -> models.TokenData:
+    # Admin check from the token's is_admin claim; no user lookup.
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    return current_user
+
+AdminUser = Annotated[models.TokenData, Depends(get_admin_user)]
+
+
+class UserLoader:
+    # The caller's User row, loaded on first access to .user and reused after that.
+    # FastAPI resolves a dependency once per request, so every route parameter and
+    # sub-dependency asking for CurrentUserLoader gets this same instance; routes that
+    # never touch .user never query it.
+    def __init__(self, token: models.TokenData, db: Session):
+        self.token = token
+        self._db = db
+        self._user: User | None = None
+
+    @property
+    def user(self) -> User:
+        if self._user is None:
+            user_id = self.token.get_uuid()
+            if user_id is None:
+                raise AuthenticationError("Invalid or missing user in token")
+            # Session.get checks the identity map first, so a row this session already
+            # loaded is not fetched again.
+            user = self._db.get(User, user_id)
+            if user is None:
+                raise UserNotFoundError(user_id)
+            self._user = user
+        return self._user
+
+
+def get_user_loader(current_user: CurrentUser, db: DbSession) -> UserLoader:
+    return UserLoader(current_user, db)
+
+CurrentUserLoader = Annotated[UserLoader, Depends(get_user_loader)]
+
+
 def login_for_access_token(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     db: Session,
@@ -0,0 +1,77 @@
+# Decoded-JWT cache for the CurrentUser dependency.
+#
+# Keyed by the SHA-256 digest of the token, so raw tokens are not kept in memory, and
+# bounded to JWT_CACHE_SIZE entries (least recently used evicted first). An entry lives
+# until the token's own `exp`; after that the token goes back through jwt.decode, which
+# rejects it. Each worker process has its own cache; counters are exposed under
+# "jwt_cache" at GET /metrics.
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from ..metrics import register_metrics
+
+
+JWT_CACHE_SIZE = int(os.getenv("JWT_CACHE_SIZE", "10000"))
+
+
+class TokenCache:
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Any | None:
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, token: str, value: Any, expires_at: float) -> None:
+        if self.max_size <= 0:
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+token_cache = TokenCache(JWT_CACHE_SIZE)
+
+register_metrics("jwt_cache", token_cache.stats)
@@ -0,0 +1,19 @@
+from fastapi import APIRouter
+
+from ..auth.service import CurrentUser
+from ..database.core import DbSession
+from . import models, service
+
+router = APIRouter(
+    prefix="/batch",
+    tags=["Batch"]
+)
+
+
+@router.post("/", response_model=models.BatchResponse)
+def run_batch(payload: models.BatchRequest, db: DbSession, current_user: CurrentUser):
+
+    # Run several whitelisted GET sub-requests under this request's token and DB session.
+    # Each sub-request gets its own status; one failing does not fail the batch.
+
+    return service.run_batch(current_user, db, payload.requests)
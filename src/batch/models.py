@@ -0,0 +1,26 @@
+import os
+from typing import Any, List
+
+from pydantic import BaseModel, Field
+
+
+BATCH_MAX_REQUESTS = int(os.getenv("BATCH_MAX_REQUESTS", "10"))
+
+
+class BatchRequestItem(BaseModel):
+    id: str = Field(..., description="Client-chosen id echoed back in the matching response")
+    path: str = Field(..., description="Whitelisted GET path, optionally with a query string, e.g. /notifications/?limit=5")
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchRequestItem] = Field(..., min_length=1, max_length=BATCH_MAX_REQUESTS)
+
+
+class BatchResponseItem(BaseModel):
+    id: str
+    status: int
+    body: Any = None
+
+
+class BatchResponse(BaseModel):
+    responses: List[BatchResponseItem]
@@ -0,0 +1,102 @@
+import logging
+from typing import Any, Callable, Dict, List
+from urllib.parse import parse_qsl, urlsplit
+
+from fastapi import HTTPException, status
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.orm import Session
+
+from src.auth.models import TokenData
+from src.auth.service import UserLoader
+from src.pagination import DEFAULT_PAGE_SIZE, Page, PageParams
+from src.adoption_reqs import models as adoption_models, service as adoption_service
+from src.leaderboard import models as leaderboard_models, service as leaderboard_service
+from src.notification import models as notification_models, service as notification_service
+from src.recommender.controller import recommend_pets_for_user
+from src.stats import StatsOut, get_stats
+from src.users import models as user_models
+from src.users.controller import get_current_user
+from . import models
+
+
+# Whitelisted sub-requests: path -> (handler(me, db, query), response_model).
+# Handlers call the same controller/service functions as the real routes, so they share
+# their rules and errors; the response_model is applied the way FastAPI would.
+# `me` is one UserLoader for the whole batch, so the caller's row is loaded at most once.
+BatchHandler = Callable[[UserLoader, Session, Dict[str, str]], Any]
+
+_routes: Dict[str, tuple[BatchHandler, Any]] = {}
+
+
+def register_batch_route(path: str, handler: BatchHandler, response_model: Any) -> None:
+    _routes[path] = (handler, TypeAdapter(response_model))
+
+
+def _page(query: Dict[str, str]) -> PageParams:
+    return PageParams(cursor=query.get("cursor"), limit=query.get("limit", DEFAULT_PAGE_SIZE))
+
+
+register_batch_route(
+    "/users/me",
+    lambda me, db, query: get_current_user(me),
+    user_models.UserResponse,
+)
+register_batch_route(
+    "/notifications/",
+    lambda me, db, query: notification_service.get_notifications(me.token, db, _page(query)),
+    Page[notification_models.NotificationResponse],
+)
+register_batch_route(
+    "/recommend/",
+    lambda me, db, query: recommend_pets_for_user(me, int(query.get("top_k", 5)), db),
+    Dict[str, Any],
+)
+register_batch_route(
+    "/api/stats",
+    lambda me, db, query: get_stats(db),
+    StatsOut,
+)
+register_batch_route(
+    "/leaderboard/",
+    lambda me, db, query: leaderboard_service.get_all_users(db, _page(query)),
+    Page[leaderboard_models.LeaderboardResponse],
+)
+register_batch_route(
+    "/adoption_reqs/all",
+    lambda me, db, query: adoption_service.get_all_adoption_requests(db, _page(query), me.token.get_uuid()),
+    Page[adoption_models.AdoptionRequestResponse],
+)
+
+
+def _run_one(me: UserLoader, db: Session, item: models.BatchRequestItem) -> models.BatchResponseItem:
+    url = urlsplit(item.path)
+    route = _routes.get(url.path)
+    if route is None:
+        return models.BatchResponseItem(
+            id=item.id, status=status.HTTP_404_NOT_FOUND, body={"detail": f"{url.path} is not available in a batch"}
+        )
+
+    handler, adapter = route
+    query = dict(parse_qsl(url.query))
+    try:
+        result = handler(me, db, query)
+        body = adapter.dump_python(adapter.validate_python(result, from_attributes=True), mode="json")
+        return models.BatchResponseItem(id=item.id, status=status.HTTP_200_OK, body=body)
+    except HTTPException as e:
+        return models.BatchResponseItem(id=item.id, status=e.status_code, body={"detail": e.detail})
+    except (ValidationError, ValueError) as e:
+        return models.BatchResponseItem(id=item.id, status=422, body={"detail": str(e)})
+    except Exception as e:
+        # Keep the shared session usable for the remaining sub-requests.
+        db.rollback()
+        logging.error(f"Batch sub-request {item.path} failed: {e}")
+        return models.BatchResponseItem(
+            id=item.id, status=status.HTTP_500_INTERNAL_SERVER_ERROR, body={"detail": "Internal server error"}
+        )
+
+
+def run_batch(current_user: TokenData, db: Session, requests: List[models.BatchRequestItem]) -> models.BatchResponse:
+    # Sub-requests run one after another: they share one Session (and so one pooled
+    # connection), and a Session must not be used from several threads at once.
+    me = UserLoader(current_user, db)
+    return models.BatchResponse(responses=[_run_one(me, db, item) for item in requests])
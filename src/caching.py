@@ -0,0 +1,54 @@
+# Conditional GET (ETag / If-None-Match) for read-mostly public routes.
+#
+# The ETag is derived from a cheap "table version" -- row count plus max(updated_at),
+# both answerable from the updated_at index -- for every table the response is built from,
+# plus the path and query string (each page/filter has its own tag). A matching
+# If-None-Match is answered with 304 before the route runs, so the real query and
+# serialization are skipped.
+#
+#   @router.get("/", dependencies=[conditional_get(Product, cache_control="public, max-age=300")])
+
+import hashlib
+
+from fastapi import Depends, Request, Response
+from sqlalchemy import func, select
+
+from .database.core import DbSession
+from .exceptions import NotModifiedError
+
+
+def table_version(db, model) -> tuple:
+    # Inserts and updates move max(updated_at); deletes change the count.
+    count, last_updated = db.execute(
+        select(func.count(), func.max(model.updated_at)).select_from(model)
+    ).one()
+    return count, last_updated.isoformat() if last_updated else None
+
+
+def make_etag(request: Request, versions: list) -> str:
+    key = repr((request.url.path, sorted(request.query_params.multi_items()), versions))
+    # Weak: the same versions always produce the same content, but not byte-for-byte guaranteed.
+    return f'W/"{hashlib.sha256(key.encode()).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison (RFC 9110 13.1.2): ignore the W/ prefix on both sides.
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def conditional_get(*models, cache_control: str):
+    # Dependency for GET routes whose response depends only on `models` and the query string.
+
+    def check(request: Request, response: Response, db: DbSession) -> None:
+        etag = make_etag(request, [table_version(db, model) for model in models])
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise NotModifiedError(headers)
+        response.headers.update(headers)
+
+    return Depends(check)
@@ -7,6 +7,8 @@ from fastapi import Depends
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
+from .pool_metrics import InstrumentedQueuePool, instrument_pre_ping, pool_metrics
+
 load_dotenv()
 
 
@@ -22,6 +24,28 @@ def _build_database_url() -> str:
 DATABASE_URL = _build_database_url()
 
 
+# Pool sizing. Each gunicorn worker (WEB_CONCURRENCY) is its own process with its own
+# pool, and sync routes run on AnyIO's worker threads (ANYIO_THREAD_LIMIT, AnyIO's default
+# is 40), so a worker never needs more connections than it has threads. DB_MAX_CONNECTIONS
+# is this task's share of the server's max_connections, split across the workers.
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+ANYIO_THREAD_LIMIT = int(os.getenv("ANYIO_THREAD_LIMIT", "40"))
+DB_MAX_CONNECTIONS = int(os.getenv("DB_MAX_CONNECTIONS", "100"))
+
+
+def _pool_settings() -> dict[str, int]:
+    per_worker = max(1, DB_MAX_CONNECTIONS // max(1, WEB_CONCURRENCY))
+    # Keep one connection per worker thread; background threads may borrow
+    # from the rest of the worker's budget as overflow.
+    pool_size = int(os.getenv("DB_POOL_SIZE") or min(ANYIO_THREAD_LIMIT, per_worker))
+    max_overflow = int(os.getenv("DB_MAX_OVERFLOW") or max(0, per_worker - pool_size))
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+    }
+
+
 def _build_engine(database_url: str):
     if database_url.startswith("sqlite"):
         return create_engine(
@@ -37,12 +61,16 @@ def _build_engine(database_url: str):
     if sslmode and "sslmode=" not in database_url:
         connect_args["sslmode"] = sslmode
 
-    return create_engine(
+    engine = create_engine(
         database_url,
+        poolclass=InstrumentedQueuePool,
         pool_pre_ping=True,
         pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "300")),
         connect_args=connect_args,
+        **_pool_settings(),
     )
+    instrument_pre_ping(engine)
+    return engine
 
 
 engine = _build_engine(DATABASE_URL)
@@ -60,3 +88,7 @@ def get_db():
         
 DbSession = Annotated[Session, Depends(get_db)]
 
+
+def pool_status() -> dict:
+    return pool_metrics.snapshot(engine.pool)
+
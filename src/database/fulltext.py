@@ -0,0 +1,126 @@
+# Full-text search indexes (see src/search).
+#
+# Postgres: each searchable table gets a stored generated `search_vector` tsvector column,
+# weighted per source column, and a GIN index on it. Postgres keeps the column current on
+# every insert/update, so the ORM never writes it (it is not mapped on the entities).
+#
+# SQLite (tests, local dev): an external-content FTS5 table <table>_fts over the same
+# columns, kept in sync by triggers, ranked with bm25() using the same weights.
+#
+# The DDL runs after create_all creates the table (see searchable()) and from the
+# alembic migration for existing databases. Both paths are idempotent.
+
+import re
+
+from sqlalchemy import Table, column, event, func, literal_column, table as table_clause, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Query as OrmQuery
+
+
+TS_CONFIG = "english"
+
+# Postgres ts_rank's default weights for labels A-D; reused as the bm25 column weights.
+WEIGHTS = {"A": 1.0, "B": 0.4, "C": 0.2, "D": 0.1}
+
+# table -> {column: weight label}
+SEARCH_COLUMNS = {
+    "pets": {"name": "A", "breed": "B", "color": "B", "description": "C"},
+    "lost_found_reports": {"pet_name": "A", "pet_type": "B", "location": "B", "description": "C"},
+    "rescue_reports": {"location": "B", "description": "C"},
+}
+
+MAX_TERMS = 16
+
+_TERM = re.compile(r"[^\W_]+")
+
+
+def search_terms(q: str) -> list[str]:
+    # Words of a free-text query, lowercased. Matching is OR over the terms and rows
+    # matching more (and higher-weighted) terms rank first, so a descriptive query
+    # like "black cat with white paws near the lake" still finds partial matches.
+    return _TERM.findall(q.lower())[:MAX_TERMS]
+
+
+def _postgres_ddl(table: str) -> list[str]:
+    vector = " || ".join(
+        f"setweight(to_tsvector('{TS_CONFIG}', coalesce({name}, '')), '{weight}')"
+        for name, weight in SEARCH_COLUMNS[table].items()
+    )
+    return [
+        f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ({vector}) STORED",
+        f"CREATE INDEX IF NOT EXISTS ix_{table}_search_vector ON {table} USING gin (search_vector)",
+    ]
+
+
+def _sqlite_ddl(table: str) -> list[str]:
+    columns = list(SEARCH_COLUMNS[table])
+    names = ", ".join(columns)
+    new = ", ".join(f"new.{c}" for c in columns)
+    old = ", ".join(f"old.{c}" for c in columns)
+    fts = f"{table}_fts"
+    delete = f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.rowid, {old});"
+    insert = f"INSERT INTO {fts}(rowid, {names}) VALUES (new.rowid, {new});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({names}, content='{table}', tokenize='porter unicode61')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN {insert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN {delete} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {table} BEGIN {delete} {insert} END",
+        # Index rows that existed before the FTS table did.
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+def create_search_index(conn: Connection, table: str) -> None:
+    dialect = conn.dialect.name
+    if dialect == "postgresql":
+        statements = _postgres_ddl(table)
+    elif dialect == "sqlite":
+        statements = _sqlite_ddl(table)
+    else:
+        return
+    for statement in statements:
+        conn.execute(text(statement))
+
+
+def drop_search_index(conn: Connection, table: str) -> None:
+    dialect = conn.dialect.name
+    if dialect == "postgresql":
+        conn.execute(text(f"DROP INDEX IF EXISTS ix_{table}_search_vector"))
+        conn.execute(text(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector"))
+    elif dialect == "sqlite":
+        for suffix in ("ai", "ad", "au"):
+            conn.execute(text(f"DROP TRIGGER IF EXISTS {table}_fts_{suffix}"))
+        conn.execute(text(f"DROP TABLE IF EXISTS {table}_fts"))
+
+
+def searchable(table: Table) -> None:
+    # Called from the entity module: build the search index whenever create_all
+    # creates the table, and drop the SQLite FTS table with it.
+    if table.name not in SEARCH_COLUMNS:
+        raise ValueError(f"no search columns configured for {table.name}")
+    event.listen(table, "after_create", lambda target, conn, **kw: create_search_index(conn, target.name))
+    event.listen(table, "before_drop", lambda target, conn, **kw: drop_search_index(conn, target.name))
+
+
+def ranked(query: OrmQuery, table: str, terms: list[str], limit: int) -> list[tuple]:
+    # Narrow an ORM query over `table` to rows matching any of `terms` and return
+    # up to `limit` (row, rank) pairs, best first. Higher rank is better.
+    dialect = query.session.get_bind().dialect.name
+    if dialect == "postgresql":
+        vector = literal_column(f"{table}.search_vector")
+        tsquery = func.to_tsquery(literal_column(f"'{TS_CONFIG}'::regconfig"), " | ".join(terms))
+        rank = func.ts_rank(vector, tsquery)
+        query = query.filter(vector.op("@@")(tsquery))
+    elif dialect == "sqlite":
+        fts = table_clause(f"{table}_fts", column("rowid"))
+        fts_name = literal_column(fts.name)
+        weights = [WEIGHTS[w] for w in SEARCH_COLUMNS[table].values()]
+        # bm25() is lower-is-better; negate it so both dialects sort rank descending.
+        rank = -func.bm25(fts_name, *weights)
+        query = (
+            query.join(fts, fts.c.rowid == literal_column(f"{table}.rowid"))
+            .filter(fts_name.op("MATCH")(" OR ".join(f'"{term}"' for term in terms)))
+        )
+    else:
+        raise NotImplementedError(f"full-text search is not supported on {dialect}")
+    return [tuple(row) for row in query.add_columns(rank).order_by(rank.desc()).limit(limit).all()]
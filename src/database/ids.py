@@ -0,0 +1,40 @@
+import os
+import threading
+import time
+import uuid
+
+
+# UUIDv7 (RFC 9562): 48-bit unix-ms timestamp, then random bits.
+# Keys generated later sort later, so new rows land on the right-most
+# B-tree page instead of a random one. rand_a is used as a per-ms counter
+# so ids minted by one process stay strictly increasing.
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def uuid7() -> uuid.UUID:
+    global _last_ms, _counter
+
+    now_ms = time.time_ns() // 1_000_000
+    with _lock:
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            # start low in the 12-bit space to leave room for increments
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            _counter += 1
+            if _counter > 0xFFF:
+                # counter exhausted within this ms: borrow the next one
+                _last_ms += 1
+                _counter = 0
+        ms, counter = _last_ms, _counter
+
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = (ms & ((1 << 48) - 1)) << 80
+    value |= 0x7 << 76
+    value |= counter << 64
+    value |= 0b10 << 62
+    value |= rand_b
+    return uuid.UUID(int=value)
@@ -0,0 +1,190 @@
+# Monthly range partitions for the append-only tables (Postgres only).
+#
+# chat_messages is partitioned on created_at and notifications on timestamp (see the
+# entities and the alembic migration). Each month lives in <table>_pYYYYMM, with a
+# <table>_default partition catching anything outside the pre-created range.
+#
+# Run from cron / a scheduled ECS task:
+#   python -m src.database.partitions --months-ahead 3
+#   python -m src.database.partitions --dry-run
+#   python -m src.database.partitions --detach-only   # keep expired partitions as standalone tables
+
+import argparse
+import logging
+import os
+import re
+from datetime import date, datetime, timezone
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+
+# table -> retention in months (0 keeps everything, the default). Retention is opt-in:
+# setting e.g. NOTIFICATIONS_RETENTION_MONTHS=12 drops older months on the next run.
+# Keep chat history unless sure: resolved rescues/adoptions still award leaderboard
+# points from it.
+PARTITIONED_TABLES = {
+    "chat_messages": int(os.getenv("CHAT_MESSAGES_RETENTION_MONTHS", "0")),
+    "notifications": int(os.getenv("NOTIFICATIONS_RETENTION_MONTHS", "0")),
+}
+
+PARTITION_COLUMNS = {
+    "chat_messages": "created_at",
+    "notifications": "timestamp",
+}
+
+MONTHS_AHEAD = int(os.getenv("PARTITION_MONTHS_AHEAD", "3"))
+
+_PARTITION_SUFFIX = re.compile(r"_p(\d{4})(\d{2})$")
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + (month.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_start(value: datetime | date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month.year:04d}{month.month:02d}"
+
+
+def is_partitioned(conn: Connection, table: str) -> bool:
+    return bool(conn.scalar(
+        text("SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = :t"),
+        {"t": table},
+    ))
+
+
+def list_partitions(conn: Connection, table: str) -> dict[str, date]:
+    # Monthly partitions of `table`, by name. The default partition is not included.
+    rows = conn.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits i "
+            "JOIN pg_class parent ON parent.oid = i.inhparent "
+            "JOIN pg_class child ON child.oid = i.inhrelid "
+            "WHERE parent.relname = :t"
+        ),
+        {"t": table},
+    ).scalars()
+    partitions = {}
+    for name in rows:
+        match = _PARTITION_SUFFIX.search(name)
+        if match:
+            partitions[name] = date(int(match.group(1)), int(match.group(2)), 1)
+    return partitions
+
+
+def create_default_partition(conn: Connection, table: str) -> None:
+    conn.execute(text(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT"))
+
+
+def _default_has_rows(conn: Connection, table: str, start: date, end: date) -> bool:
+    exists = conn.scalar(text("SELECT to_regclass(:name)"), {"name": f"{table}_default"})
+    if not exists:
+        return False
+    column = PARTITION_COLUMNS[table]
+    return bool(conn.scalar(
+        text(f"SELECT 1 FROM {table}_default WHERE {column} >= :start AND {column} < :end LIMIT 1"),
+        {"start": start, "end": end},
+    ))
+
+
+def create_month_partition(conn: Connection, table: str, month: date) -> bool:
+    name = partition_name(table, month)
+    if name in list_partitions(conn, table):
+        return False
+
+    start, end = month, add_months(month, 1)
+    create = (
+        f"CREATE TABLE {name} PARTITION OF {table} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+
+    if not _default_has_rows(conn, table, start, end):
+        conn.execute(text(create))
+        return True
+
+    # Rows for this month already landed in the default partition (maintenance fell
+    # behind). Postgres refuses to create the partition while they sit there, so move them.
+    column = PARTITION_COLUMNS[table]
+    bounds = {"start": start, "end": end}
+    conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {table}_default"))
+    conn.execute(text(create))
+    conn.execute(text(f"INSERT INTO {table} SELECT * FROM {table}_default WHERE {column} >= :start AND {column} < :end"), bounds)
+    conn.execute(text(f"DELETE FROM {table}_default WHERE {column} >= :start AND {column} < :end"), bounds)
+    conn.execute(text(f"ALTER TABLE {table} ATTACH PARTITION {table}_default DEFAULT"))
+    logging.warning(f"[Partitions] moved {month:%Y-%m} rows of {table} out of the default partition")
+    return True
+
+
+def ensure_partitions(conn: Connection, table: str, first_month: date, last_month: date) -> list[str]:
+    created = []
+    month = first_month
+    while month <= last_month:
+        if create_month_partition(conn, table, month):
+            created.append(partition_name(table, month))
+        month = add_months(month, 1)
+    return created
+
+
+def expired_partitions(conn: Connection, table: str, retention_months: int, today: date) -> list[str]:
+    if retention_months <= 0:
+        return []
+    cutoff = add_months(month_start(today), -retention_months)
+    return sorted(name for name, month in list_partitions(conn, table).items() if month < cutoff)
+
+
+def detach_partition(conn: Connection, table: str, name: str, drop: bool) -> None:
+    conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+    if drop:
+        conn.execute(text(f"DROP TABLE {name}"))
+
+
+def run_maintenance(engine, months_ahead: int = MONTHS_AHEAD, detach_only: bool = False, dry_run: bool = False) -> None:
+    today = datetime.now(timezone.utc).date()
+    this_month = month_start(today)
+
+    for table, retention in PARTITIONED_TABLES.items():
+        with engine.begin() as conn:
+            if not is_partitioned(conn, table):
+                logging.warning(f"[Partitions] {table} is not partitioned; run the alembic migrations first")
+                continue
+
+            if dry_run:
+                existing = list_partitions(conn, table)
+                wanted = [partition_name(table, add_months(this_month, i)) for i in range(months_ahead + 1)]
+                missing = [name for name in wanted if name not in existing]
+                logging.info(f"[Partitions] {table}: would create {missing}")
+                logging.info(f"[Partitions] {table}: would remove {expired_partitions(conn, table, retention, today)}")
+                continue
+
+            created = ensure_partitions(conn, table, this_month, add_months(this_month, months_ahead))
+            create_default_partition(conn, table)
+            logging.info(f"[Partitions] {table}: created {created or 'nothing'}")
+
+            for name in expired_partitions(conn, table, retention, today):
+                detach_partition(conn, table, name, drop=not detach_only)
+                logging.info(f"[Partitions] {table}: {'detached' if detach_only else 'dropped'} {name}")
+
+
+def main() -> None:
+    from .core import engine
+    from ..logging import LogLevels, configure_logging
+
+    parser = argparse.ArgumentParser(description="Pre-create monthly partitions and apply retention")
+    parser.add_argument("--months-ahead", type=int, default=MONTHS_AHEAD)
+    parser.add_argument("--detach-only", action="store_true", help="detach expired partitions without dropping them")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    configure_logging(LogLevels.info)
+    if engine.dialect.name != "postgresql":
+        raise SystemExit("Partition maintenance needs a Postgres DATABASE_URL")
+    run_maintenance(engine, args.months_ahead, args.detach_only, args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
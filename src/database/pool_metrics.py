@@ -0,0 +1,111 @@
+import logging
+import os
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+
+POOL_WAIT_WARN_MS = float(os.getenv("DB_POOL_WAIT_WARN_MS", "250"))
+# At most one saturation warning per interval; the rest are counted and reported with it.
+POOL_WARN_INTERVAL_S = float(os.getenv("DB_POOL_WARN_INTERVAL_S", "10"))
+
+
+class PoolMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.slow_checkouts = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.pre_ping_failures = 0
+        self._last_warning = 0.0
+        self._suppressed = 0
+
+    def record_wait(self, pool: QueuePool, wait_ms: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.checkout_timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_total_ms += wait_ms
+            self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+
+            if wait_ms < POOL_WAIT_WARN_MS:
+                return
+            self.slow_checkouts += 1
+
+            now = time.monotonic()
+            if now - self._last_warning < POOL_WARN_INTERVAL_S:
+                self._suppressed += 1
+                return
+            suppressed, self._suppressed = self._suppressed, 0
+            self._last_warning = now
+
+        logging.warning(
+            f"[DB pool] checkout waited {wait_ms:.0f} ms "
+            f"(in use {pool.checkedout()}, pool size {pool.size()}, overflow {max(0, pool.overflow())}, "
+            f"timed out: {timed_out}, {suppressed} similar warnings suppressed)"
+        )
+
+    def record_pre_ping_failure(self) -> None:
+        with self._lock:
+            self.pre_ping_failures += 1
+
+    def snapshot(self, pool) -> dict:
+        with self._lock:
+            waits = self.checkouts + self.checkout_timeouts
+            data = {
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.checkout_timeouts,
+                "slow_checkouts": self.slow_checkouts,
+                "checkout_wait_avg_ms": round(self.wait_total_ms / waits, 3) if waits else 0.0,
+                "checkout_wait_max_ms": round(self.wait_max_ms, 3),
+                "pre_ping_failures": self.pre_ping_failures,
+            }
+        if isinstance(pool, QueuePool):
+            data.update({
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                # QueuePool.overflow() counts down from -pool_size until the pool is full.
+                "overflow": max(0, pool.overflow()),
+            })
+        return data
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(QueuePool):
+    # QueuePool that times how long each checkout waits for a free connection.
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            pool_metrics.record_wait(self, (time.perf_counter() - started) * 1000, timed_out=True)
+            raise
+        pool_metrics.record_wait(self, (time.perf_counter() - started) * 1000)
+        return conn
+
+
+def instrument_pre_ping(engine) -> None:
+    # Count failed pool_pre_ping checks (stale connections replaced on checkout).
+    dialect = engine.dialect
+    do_ping = dialect.do_ping
+
+    def counting_do_ping(dbapi_connection):
+        try:
+            alive = do_ping(dbapi_connection)
+        except Exception:
+            pool_metrics.record_pre_ping_failure()
+            raise
+        if not alive:
+            pool_metrics.record_pre_ping_failure()
+        return alive
+
+    dialect.do_ping = counting_do_ping
@@ -1,9 +1,12 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, String, DateTime, ForeignKey, Enum, event
 from sqlalchemy.dialects.postgresql import UUID
-import uuid
+from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 import enum
 from ..database.core import Base
+from ..database.ids import uuid7
+from .pet import Pet
+from .tombstone import tombstone_recorder
 
 class AdoptionStatus(enum.Enum):
     Pending = "Pending"
@@ -14,7 +17,7 @@ class AdoptionStatus(enum.Enum):
 class AdoptionRequest(Base):
     __tablename__ = "adoption_requests"
 
-    adopt_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    adopt_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     pet_id = Column(UUID(as_uuid=True), ForeignKey("pets.pet_id"), nullable=False)
     requester_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     chat_id = Column(UUID(as_uuid=True), ForeignKey("chats.chat_id"), nullable=True) 
@@ -22,8 +25,15 @@ class AdoptionRequest(Base):
     status = Column(Enum(AdoptionStatus), nullable=False, default=AdoptionStatus.Pending)
 
     created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc),
+    updated_at = Column(DateTime, nullable=False, index=True, default=lambda: datetime.now(timezone.utc),
                         onupdate=lambda: datetime.now(timezone.utc))
 
+    # Listings load it in the same query: contains_eager() where Pet is already
+    # joined, joinedload() otherwise (see adoption_reqs/service.py).
+    pet = relationship(Pet)
+
     def __repr__(self):
         return f"<AdoptionRequest(pet_id='{self.pet_id}', requester_id='{self.requester_id}', status='{self.status.value}')>"
+
+
+event.listen(AdoptionRequest, "after_delete", tombstone_recorder("requester_id"))
@@ -1,10 +1,10 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum as SqlEnum, Text
+from sqlalchemy import DDL, Column, String, DateTime, ForeignKey, Enum as SqlEnum, Index, Text, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from enum import Enum
-import uuid
 from datetime import datetime, timezone
 from ..database.core import Base
+from ..database.ids import uuid7
 
 class ChatTypeEnum(str, Enum):
     Rescue = "rescue"
@@ -14,7 +14,7 @@ class ChatTypeEnum(str, Enum):
 
 class Chat(Base):
     __tablename__ = "chats"
-    chat_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    chat_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     chat_type = Column(SqlEnum(ChatTypeEnum), nullable=False, default=ChatTypeEnum.Generic)
     related_entity_id = Column(UUID(as_uuid=True), nullable=True)
     creator_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -25,7 +25,7 @@ class Chat(Base):
 
 class ChatMember(Base):
     __tablename__ = "chat_members"
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     chat_id = Column(UUID(as_uuid=True), ForeignKey("chats.chat_id"), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     joined_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
@@ -34,10 +34,26 @@ class ChatMember(Base):
 
 class ChatMessage(Base):
     __tablename__ = "chat_messages"
-    message_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Range-partitioned by month on created_at in Postgres (see database/partitions.py),
+    # so the partition key has to be part of the primary key.
+    __table_args__ = (
+        Index("ix_chat_messages_chat_id_created_at", "chat_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    message_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     chat_id = Column(UUID(as_uuid=True), ForeignKey("chats.chat_id"), nullable=False)
     sender_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     content = Column(Text, nullable=False)
-    created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, primary_key=True, nullable=False, default=lambda: datetime.now(timezone.utc))
 
     chat = relationship("Chat", back_populates="messages")
+
+
+# A partitioned table accepts no rows until it has a partition; the default one keeps
+# create_all() databases writable until the maintenance command adds monthly ones.
+event.listen(
+    ChatMessage.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS chat_messages_default PARTITION OF chat_messages DEFAULT").execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,35 @@
+from sqlalchemy import Column, String, Text, DateTime, Integer, Index
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime, timezone
+from ..database.core import Base
+from ..database.ids import uuid7
+
+
+# EmailOutbox.status values
+OUTBOX_PENDING = "pending"
+OUTBOX_SENT = "sent"
+OUTBOX_FAILED = "failed"  # gave up after EMAIL_MAX_ATTEMPTS
+
+
+class EmailOutbox(Base):
+    # Transactional outbox: an email is written here in the same transaction as the
+    # change that triggers it, and delivered afterwards by src/outbox/worker.py.
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    to_address = Column(String, nullable=False)
+    subject = Column(String, nullable=False)
+    body_text = Column(Text, nullable=False)
+    body_html = Column(Text, nullable=True)
+    status = Column(String(16), nullable=False, default=OUTBOX_PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+    sent_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<EmailOutbox(to_address='{self.to_address}', status='{self.status}')>"
@@ -1,15 +1,15 @@
-import uuid
 from datetime import datetime, timezone
 from sqlalchemy import Column, String, Integer, DateTime, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from ..database.core import Base
+from ..database.ids import uuid7
 from sqlalchemy.ext.hybrid import hybrid_property
 
 class LeaderboardUser(Base):
     __tablename__ = "leaderboard_users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
 
     score = Column(Integer, nullable=False, default=0)
@@ -20,6 +20,8 @@ class LeaderboardUser(Base):
     map_contributions = Column(Integer, nullable=False, default=0)
     avatar = Column(String, nullable=True)
     created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+    updated_at = Column(DateTime, nullable=False, index=True, default=lambda: datetime.now(timezone.utc),
+                        onupdate=lambda: datetime.now(timezone.utc))
     
 
     # Relationship to user
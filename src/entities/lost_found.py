@@ -1,10 +1,12 @@
 
-from sqlalchemy import Column, String, DateTime, Float, ForeignKey, Enum as SqlEnum
+from sqlalchemy import Column, String, DateTime, Float, ForeignKey, Enum as SqlEnum, event
 from sqlalchemy.dialects.postgresql import UUID
 from enum import Enum
-import uuid
 from datetime import datetime, timezone
 from ..database.core import Base
+from ..database.fulltext import searchable
+from ..database.ids import uuid7
+from .tombstone import tombstone_recorder
 from sqlalchemy.orm import relationship
 
 
@@ -24,7 +26,7 @@ class PetGenderEnum(str, Enum):
 class LostFoundReport(Base):
     __tablename__ = "lost_found_reports"
 
-    report_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    report_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     user = relationship("User", backref="lost_found_reports")
 
@@ -40,8 +42,12 @@ class LostFoundReport(Base):
     chat_id = Column(UUID(as_uuid=True), ForeignKey("chats.chat_id"), nullable=True)
 
     created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc),
+    updated_at = Column(DateTime, nullable=False, index=True, default=lambda: datetime.now(timezone.utc),
                         onupdate=lambda: datetime.now(timezone.utc))
 
     def __repr__(self):
         return f"<LostFoundReport(report_id='{self.report_id}', pet_name='{self.pet_name}', status='{self.status.value}')>"
+
+
+event.listen(LostFoundReport, "after_delete", tombstone_recorder("user_id"))
+searchable(LostFoundReport.__table__)
@@ -1,19 +1,31 @@
 # src/entities/notification.py
-from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean
+from sqlalchemy import DDL, Column, String, DateTime, ForeignKey, Boolean, Index, event
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime, timezone
-import uuid
 from ..database.core import Base
+from ..database.ids import uuid7
 
 class Notification(Base):
     __tablename__ = "notifications"
+    # Range-partitioned by month on timestamp in Postgres (see database/partitions.py)
+    __table_args__ = (
+        Index("ix_notifications_user_id_timestamp", "user_id", "timestamp"),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
+    )
 
-    notif_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    notif_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     message = Column(String, nullable=False)
     notif_type = Column(String, nullable=True)  # "rescue" or "lostpet"
     chat_id = Column(UUID(as_uuid=True), ForeignKey("chats.chat_id"), nullable=True)
     report_id = Column(UUID(as_uuid=True), nullable=True)
     viewed = Column(Boolean, default=False)
-    timestamp = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    timestamp = Column(DateTime, primary_key=True, nullable=False, default=lambda: datetime.now(timezone.utc))
+
+
+event.listen(
+    Notification.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS notifications_default PARTITION OF notifications DEFAULT").execute_if(dialect="postgresql"),
+)
 
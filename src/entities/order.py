@@ -1,9 +1,9 @@
 from sqlalchemy import Column, String, DateTime, Numeric, ForeignKey, Integer, Boolean
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-import uuid
 from datetime import datetime, timezone
 from ..database.core import Base
+from ..database.ids import uuid7
 
 
 
@@ -12,7 +12,7 @@ class Order(Base):
     __tablename__ = "orders"
 
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     buyer_name = Column(String, nullable=True)
     buyer_phone = Column(String, nullable=True)
     total_amount = Column(Numeric(10,2), nullable=False, default=0)
@@ -27,7 +27,7 @@ class OrderItem(Base):
     __tablename__ = "order_items"
 
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     order_id = Column(UUID(as_uuid=True), ForeignKey("orders.id"), nullable=False)
     product_id = Column(UUID(as_uuid=True), nullable=False)
     product_name = Column(String, nullable=False)
@@ -1,10 +1,14 @@
 
-from sqlalchemy import JSON, Column, String, Boolean, DateTime, ForeignKey, Enum, Integer
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Enum, Integer, Index, event, false
 from sqlalchemy.dialects.postgresql import UUID
-import uuid
+from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 import enum
 from ..database.core import Base
+from ..database.fulltext import searchable
+from ..database.ids import uuid7
+from .pet_image import PetImage
+from .tombstone import tombstone_recorder
 
 
 
@@ -45,7 +49,7 @@ class PetActivityLevelEnum(enum.Enum):
 class Pet(Base):
     __tablename__ = "pets"
 
-    pet_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    pet_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
 
     name = Column(String, nullable=False)
@@ -64,9 +68,50 @@ class Pet(Base):
     description = Column(String, nullable=True)
     is_adopted = Column(Boolean, nullable=False, default=False)
     created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    updated_at = Column(DateTime, nullable=False, index=True, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
     # image_url = Column(String, nullable=True)
-    images = Column(JSON, default=list)  # Add this
+    # Photos live in pet_images (see pets/service.add_pet_image), loaded for a whole page
+    # of pets with one extra SELECT ... WHERE pet_id IN (...).
+    image_rows = relationship(
+        PetImage,
+        order_by=(PetImage.position, PetImage.image_id),
+        cascade="all, delete-orphan",
+        lazy="selectin",
+    )
+
+    @property
+    def images(self) -> list[str]:
+        return [image.url for image in self.image_rows]
+
+    @property
+    def image_variants(self) -> list:
+        return [image.variants for image in self.image_rows]
 
     def __repr__(self):
         return f"<Pet(name='{self.name}', species='{self.species.value}', adopted={self.is_adopted})>"
+
+
+event.listen(Pet, "after_delete", tombstone_recorder("user_id"))
+searchable(Pet.__table__)
+
+
+# Partial indexes for GET /pets/browse (see pets/service.browse_pets). Only listings
+# that are still up for adoption are indexed, and each ends with (created_at, pet_id),
+# the browse sort and cursor key, so a filter on the leading columns is a single
+# ordered range scan. pet_id alone is not creation order: rows from before UUIDv7
+# keep their uuid4 ids. Gender and age ranges are not selective enough on their own;
+# they are applied as filters on top of the closest index. Keep in sync with alembic
+# 7d41b2e8c6a3.
+BROWSE_INDEXES = {
+    "ix_pets_browse": ("created_at", "pet_id"),
+    "ix_pets_browse_species": ("species", "created_at", "pet_id"),
+    "ix_pets_browse_species_size": ("species", "size", "created_at", "pet_id"),
+    "ix_pets_browse_species_temperament": ("species", "temperament", "created_at", "pet_id"),
+    "ix_pets_browse_species_activity_level": ("species", "activity_level", "created_at", "pet_id"),
+    "ix_pets_browse_species_age": ("species", "age", "created_at", "pet_id"),
+}
+
+BROWSE_INDEX_WHERE = Pet.is_adopted == false()
+
+for name, columns in BROWSE_INDEXES.items():
+    Index(name, *(Pet.__table__.c[c] for c in columns), postgresql_where=BROWSE_INDEX_WHERE, sqlite_where=BROWSE_INDEX_WHERE)
@@ -0,0 +1,28 @@
+from sqlalchemy import JSON, Column, String, DateTime, ForeignKey, Integer, Index
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime, timezone
+from ..database.core import Base
+from ..database.ids import uuid7
+
+
+class PetImage(Base):
+    # One uploaded photo of a pet. Pet.images is the list of these URLs in display
+    # order (position, then image_id for rows appended concurrently with the same
+    # position). `variants` is the {"thumb": url, "medium": url} map of the resized
+    # copies (see src/media/variants.py), stored when the image is added. It is None for
+    # images without variants and for rows the migration backfilled; responses derive
+    # those from the URL (fill_variants) until `python -m src.media --pet-images` runs.
+    __tablename__ = "pet_images"
+    __table_args__ = (
+        Index("ix_pet_images_pet_id_position", "pet_id", "position", "image_id"),
+    )
+
+    image_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    pet_id = Column(UUID(as_uuid=True), ForeignKey("pets.pet_id", ondelete="CASCADE"), nullable=False)
+    position = Column(Integer, nullable=False, default=0)
+    url = Column(String, nullable=False)
+    variants = Column(JSON(none_as_null=True), nullable=True)
+    created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self):
+        return f"<PetImage(pet_id='{self.pet_id}', position={self.position}, url='{self.url}')>"
@@ -3,8 +3,8 @@ from sklearn import base
 from sqlalchemy import Column, String, Integer, Numeric, Boolean, DateTime, Text
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime, timezone
-import uuid
 from ..database.core import Base
+from ..database.ids import uuid7
 
 
 
@@ -12,7 +12,7 @@ class Product(Base):
     __tablename__ = "products"
 
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     price = Column(Numeric(10, 2), nullable=False)
@@ -22,6 +22,8 @@ class Product(Base):
     affiliated_url = Column(String, nullable=True) # external link
     is_active = Column(Boolean, nullable=False, default=True)
     created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+    updated_at = Column(DateTime, nullable=False, index=True, default=lambda: datetime.now(timezone.utc),
+                        onupdate=lambda: datetime.now(timezone.utc))
 
 
 def __repr__(self):
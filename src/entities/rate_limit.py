@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, Integer, Float
+from ..database.core import Base
+
+
+class RateLimitWindow(Base):
+    # Counters for the "database://" rate limit storage (see src/rate_limiter.py).
+    # One row per key and window; expires_at is a Unix timestamp.
+    __tablename__ = "rate_limit_windows"
+
+    key = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+    expires_at = Column(Float, nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<RateLimitWindow(key='{self.key}', count={self.count})>"
@@ -1,11 +1,13 @@
 
 # src/entities/rescue_rep.py
-from sqlalchemy import Column, String, DateTime, Float, ForeignKey, Enum as SqlEnum
+from sqlalchemy import Column, String, DateTime, Float, ForeignKey, Enum as SqlEnum, event
 from sqlalchemy.dialects.postgresql import UUID
 from enum import Enum
-import uuid
 from datetime import datetime, timezone
 from ..database.core import Base
+from ..database.fulltext import searchable
+from ..database.ids import uuid7
+from .tombstone import tombstone_recorder
 from sqlalchemy.orm import relationship
 
 class RescueStatusEnum(str, Enum):
@@ -23,7 +25,7 @@ class RescueAlertTypeEnum(str, Enum):
 class RescueReport(Base):
     __tablename__ = "rescue_reports"
 
-    report_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    report_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     user = relationship("User", backref="rescue_reports")  
     description = Column(String, nullable=True)
@@ -35,7 +37,11 @@ class RescueReport(Base):
     alert_type = Column(SqlEnum(RescueAlertTypeEnum), nullable=False, default=RescueAlertTypeEnum.Medium)
     chat_id = Column(UUID(as_uuid=True), ForeignKey("chats.chat_id"), nullable=True)
     created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    updated_at = Column(DateTime, nullable=False, index=True, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
 
     def __repr__(self):
         return f"<RescueReport(report_id='{self.report_id}', status='{self.status.value}', chat_id='{self.chat_id}')>"
+
+
+event.listen(RescueReport, "after_delete", tombstone_recorder("user_id"))
+searchable(RescueReport.__table__)
@@ -0,0 +1,44 @@
+from sqlalchemy import Column, String, DateTime, Index, insert
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime, timezone
+from ..database.core import Base
+from ..database.ids import uuid7
+
+
+class Tombstone(Base):
+    # One row per deleted record of a synced table, so delta-sync clients
+    # (see src/sync.py) learn about deletions. owner_id is the user the deleted row
+    # belonged to; feeds that only show a user's own rows filter on it, so nobody
+    # learns the ids of other users' deletions. Pruned after TOMBSTONE_RETENTION_DAYS.
+    __tablename__ = "tombstones"
+    __table_args__ = (
+        Index("ix_tombstones_table_name_deleted_at", "table_name", "deleted_at", "id"),
+        Index("ix_tombstones_table_name_owner_id_deleted_at", "table_name", "owner_id", "deleted_at", "id"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    table_name = Column(String, nullable=False)
+    row_id = Column(UUID(as_uuid=True), nullable=False)
+    owner_id = Column(UUID(as_uuid=True), nullable=True)
+    deleted_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self):
+        return f"<Tombstone(table_name='{self.table_name}', row_id='{self.row_id}')>"
+
+
+def tombstone_recorder(owner_key: str):
+    # after_delete listener for a synced entity; owner_key names its owning user column:
+    #   event.listen(Pet, "after_delete", tombstone_recorder("user_id"))
+    # It runs inside the deleting flush, so the tombstone commits (or rolls back)
+    # together with the delete. Bulk query.delete() bypasses it.
+    def record_tombstone(mapper, connection, target) -> None:
+        connection.execute(
+            insert(Tombstone).values(
+                id=uuid7(),
+                table_name=mapper.local_table.name,
+                row_id=mapper.primary_key_from_instance(target)[0],
+                owner_id=getattr(target, owner_key),
+                deleted_at=datetime.now(timezone.utc),
+            )
+        )
+    return record_tombstone
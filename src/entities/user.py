@@ -1,9 +1,10 @@
 
-import uuid
 import enum
+from datetime import datetime, timezone
 from sqlalchemy import Column, String, Integer, Enum, Boolean, DateTime
 from sqlalchemy.dialects.postgresql import UUID
 from ..database.core import Base
+from ..database.ids import uuid7
 
 
 class PreferredSpeciesEnum(enum.Enum):
@@ -34,7 +35,7 @@ class TemperamentEnum(enum.Enum):
 class User(Base):
     __tablename__ = 'users'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     email = Column(String, unique=True, nullable=False)
     first_name = Column(String, nullable=False)
     last_name = Column(String, nullable=False)
@@ -52,6 +53,8 @@ class User(Base):
 
     is_admin = Column(Boolean, default=False, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
+    # Carried in access tokens as `ver`; bumping it revokes older tokens (see src/auth/revocation.py).
+    token_version = Column(Integer, default=0, server_default="0", nullable=False)
     # fcm_token = Column(String, nullable=True)
 
 
@@ -60,5 +63,9 @@ class User(Base):
     email_verification_expires_at = Column(DateTime(timezone=True), nullable=True)
     email_verification_attempts = Column(Integer, default=0, nullable=False)
 
+    # Bumped on every profile change; part of the leaderboard's ETag (names and avatars are shown there).
+    updated_at = Column(DateTime, nullable=True, index=True, default=lambda: datetime.now(timezone.utc),
+                        onupdate=lambda: datetime.now(timezone.utc))
+
     def __repr__(self):
         return f"<User(email='{self.email}', first_name='{self.first_name}', last_name='{self.last_name}')>"
@@ -0,0 +1,12 @@
+# Deployment environment, from APP_ENV: "production" (set in the ECS task definition)
+# or "development" (the default, for local runs and tests). Production refuses the
+# development-only fallbacks, such as per-worker rate limits and console email.
+
+import os
+
+
+APP_ENV = os.getenv("APP_ENV", "development").strip().lower()
+
+
+def is_production() -> bool:
+    return APP_ENV == "production"
@@ -30,6 +30,11 @@ class PetAlreadyAdoptedError(PetError):
         super().__init__(status_code=400, detail=message)
 
 
+class InvalidAgeRangeError(PetError):
+    def __init__(self, min_age: int, max_age: int):
+        super().__init__(status_code=400, detail=f"min_age ({min_age}) must not be greater than max_age ({max_age})")
+
+
 
 # User Exceptions
 
@@ -62,6 +67,16 @@ class AuthenticationError(HTTPException):
         super().__init__(status_code=401, detail=message)
 
 
+class PasswordHashingBusyError(HTTPException):
+    # Password hashing pool is full; shed the request instead of queueing it.
+    def __init__(self, retry_after: int):
+        super().__init__(
+            status_code=503,
+            detail="Too many sign-in requests right now; please retry shortly",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
 
 # Adoption Request Exceptions
 
@@ -186,4 +201,70 @@ class ChatNotFoundError(ChatError):
 class ChatMemberExistsError(ChatError):
     def __init__(self):
         message = "User is already a member of the chat"
-        super().__init__(status_code=400, detail=message)
\ No newline at end of file
+        super().__init__(status_code=400, detail=message)
+
+
+# Pagination Exceptions
+
+class InvalidCursorError(HTTPException):
+    def __init__(self):
+        super().__init__(status_code=400, detail="Invalid pagination cursor")
+
+
+# Caching Exceptions
+
+class NotModifiedError(HTTPException):
+    # 304 for a conditional GET whose If-None-Match still matches; sent without a body.
+    def __init__(self, headers: dict):
+        super().__init__(status_code=304, headers=headers)
+
+
+# Sync Exceptions
+
+class SyncCursorExpiredError(HTTPException):
+    def __init__(self):
+        super().__init__(status_code=410, detail="Sync cursor expired; start a full sync without `since`")
+
+
+# Sparse Fieldset Exceptions
+
+class InvalidFieldsError(HTTPException):
+    def __init__(self, unknown: list[str], allowed: list[str]):
+        message = f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(allowed)}"
+        super().__init__(status_code=400, detail=message)
+
+
+# Search Exceptions
+
+class InvalidSearchQueryError(HTTPException):
+    def __init__(self):
+        super().__init__(status_code=400, detail="Search query must contain at least one word")
+
+
+# Upload Exceptions
+
+class InvalidUploadError(HTTPException):
+    def __init__(self, message: str):
+        super().__init__(status_code=400, detail=message)
+
+
+class UploadNotFoundError(HTTPException):
+    def __init__(self):
+        super().__init__(status_code=404, detail="Uploaded object not found; upload the file before confirming")
+
+
+class UploadNotAllowedError(HTTPException):
+    def __init__(self, message: str = "Not allowed to upload for this target"):
+        super().__init__(status_code=403, detail=message)
+
+
+# Export Exceptions
+
+class ExportUnavailableError(HTTPException):
+    def __init__(self):
+        super().__init__(status_code=503, detail="Export requires pyarrow; install it with `pip install pyarrow`")
+
+
+class ExportInProgressError(HTTPException):
+    def __init__(self):
+        super().__init__(status_code=409, detail="An export is already running")
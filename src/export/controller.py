@@ -0,0 +1,23 @@
+from fastapi import APIRouter, BackgroundTasks, status
+
+from ..auth.service import AdminUser
+from ..exceptions import ExportInProgressError
+from . import models, service
+
+router = APIRouter(
+    prefix="/admin/export",
+    tags=["Admin"]
+)
+
+
+@router.post("/", response_model=models.ExportAccepted, status_code=status.HTTP_202_ACCEPTED)
+def start_export(payload: models.ExportRequest, background_tasks: BackgroundTasks, current_user: AdminUser):
+
+    # Export tables to EXPORT_DIR after the response is sent (see src/export/service.py).
+
+    service.ensure_available()
+    if service.export_running():
+        raise ExportInProgressError()
+    tables = payload.tables or list(service.EXPORT_TABLES)
+    background_tasks.add_task(service.run_export, tables, payload.format, payload.full)
+    return {"tables": tables, "format": payload.format, "full": payload.full}
@@ -0,0 +1,29 @@
+import enum
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ExportTable(str, enum.Enum):
+    rescue_reports = "rescue_reports"
+    lost_found_reports = "lost_found_reports"
+    adoption_requests = "adoption_requests"
+    orders = "orders"
+    leaderboard_users = "leaderboard_users"
+
+
+class ExportFormat(str, enum.Enum):
+    parquet = "parquet"
+    arrow = "arrow"  # Arrow IPC file
+
+
+class ExportRequest(BaseModel):
+    tables: Optional[List[ExportTable]] = Field(None, description="Tables to export; all of them when omitted")
+    format: ExportFormat = ExportFormat.parquet
+    full: bool = Field(False, description="Ignore the saved watermarks and export every row")
+
+
+class ExportAccepted(BaseModel):
+    tables: List[ExportTable]
+    format: ExportFormat
+    full: bool
@@ -0,0 +1,253 @@
+# Columnar export of operational tables for analytics, so analysts stop paging
+# through the public list routes:
+#   python -m src.export                        # every table, incremental, Parquet
+#   python -m src.export orders --format arrow
+#   python -m src.export rescue_reports --full  # ignore the saved watermark
+# Admins can also start one with POST /admin/export.
+#
+# Each table is read over a server-side cursor (stream_results + yield_per) in
+# EXPORT_BATCH_SIZE rows and written one record batch at a time, so memory is
+# bounded by the batch size rather than the table size.
+#
+# Incremental tables only export rows whose watermark column moved past the last
+# successful export. The watermark is saved in EXPORT_DIR/_watermarks.json once the
+# file is complete; a failed export leaves no file and the old watermark in place.
+# Rows touched in the last EXPORT_LAG_SECONDS are left for the next run, so a
+# transaction committing late cannot fall behind the watermark.
+# Snapshot tables (the leaderboard) are exported in full every run, with snapshot_at.
+#
+# pyarrow (in requirements.txt) is only imported when an export runs, so API workers
+# that never export don't load it.
+
+import argparse
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from sqlalchemy import Boolean, DateTime, Float, Integer, Numeric, Table, select
+from sqlalchemy import Enum as SqlEnum
+from sqlalchemy.engine import Engine
+
+from ..database.core import engine as default_engine
+from ..entities.adoption_req import AdoptionRequest
+from ..entities.leaderboard import LeaderboardUser
+from ..entities.lost_found import LostFoundReport
+from ..entities.order import Order
+from ..entities.rescue_rep import RescueReport
+from ..exceptions import ExportInProgressError, ExportUnavailableError
+from .models import ExportFormat, ExportTable
+
+
+EXPORT_DIR = Path(os.getenv("EXPORT_DIR", "exports"))
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "10000"))
+EXPORT_LAG_SECONDS = float(os.getenv("EXPORT_LAG_SECONDS", "2"))
+
+# table -> (mapped table, watermark column name or None for a full snapshot).
+# Orders are never updated after checkout apart from sent_to_whatsapp, so created_at
+# is their watermark.
+EXPORT_TABLES: dict[ExportTable, tuple[Table, Optional[str]]] = {
+    ExportTable.rescue_reports: (RescueReport.__table__, "updated_at"),
+    ExportTable.lost_found_reports: (LostFoundReport.__table__, "updated_at"),
+    ExportTable.adoption_requests: (AdoptionRequest.__table__, "updated_at"),
+    ExportTable.orders: (Order.__table__, "created_at"),
+    ExportTable.leaderboard_users: (LeaderboardUser.__table__, None),
+}
+
+EXTENSIONS = {ExportFormat.parquet: "parquet", ExportFormat.arrow: "arrow"}
+
+_WATERMARKS_FILE = "_watermarks.json"
+
+# One export at a time per process: concurrent runs would race on the watermarks.
+_export_lock = threading.Lock()
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401  (submodules used as pyarrow.ipc / pyarrow.parquet)
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise ExportUnavailableError()
+    return pyarrow
+
+
+def ensure_available() -> None:
+    _pyarrow()
+
+
+def export_running() -> bool:
+    return _export_lock.locked()
+
+
+def _utcnow() -> datetime:
+    # Timestamps are stored as naive UTC (DateTime columns without time zone).
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _column_type(pa, column) -> tuple[Any, Callable[[Any], Any]]:
+    # Arrow type for a column, plus a converter for its Python values.
+    # UUIDs and enums are exported as strings.
+    kind = column.type
+    identity = lambda value: value
+    if isinstance(kind, SqlEnum):
+        return pa.string(), lambda value: value.value if isinstance(value, Enum) else value
+    if isinstance(kind, DateTime):
+        return pa.timestamp("us"), identity
+    if isinstance(kind, Boolean):
+        return pa.bool_(), identity
+    if isinstance(kind, Integer):
+        return pa.int64(), identity
+    if isinstance(kind, Float):
+        return pa.float64(), identity
+    if isinstance(kind, Numeric):
+        return pa.decimal128(kind.precision or 38, kind.scale or 0), lambda value: None if value is None else Decimal(value)
+    return pa.string(), lambda value: None if value is None else str(value)
+
+
+def load_watermarks(export_dir: Path = EXPORT_DIR) -> dict[str, str]:
+    path = export_dir / _WATERMARKS_FILE
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def _save_watermark(export_dir: Path, table: ExportTable, watermark: datetime) -> None:
+    watermarks = load_watermarks(export_dir)
+    watermarks[table.value] = watermark.isoformat()
+    path = export_dir / _WATERMARKS_FILE
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(watermarks, indent=2, sort_keys=True))
+    tmp.replace(path)
+
+
+def export_table(
+    table: ExportTable,
+    fmt: ExportFormat = ExportFormat.parquet,
+    full: bool = False,
+    export_dir: Path = EXPORT_DIR,
+    bind: Engine = default_engine,
+) -> Optional[Path]:
+    # Export one table; returns the written file, or None if nothing changed.
+    pa = _pyarrow()
+    source, watermark_name = EXPORT_TABLES[table]
+    now = _utcnow()
+
+    columns = list(source.columns)
+    fields, converters = [], []
+    for column in columns:
+        arrow_type, convert = _column_type(pa, column)
+        fields.append(pa.field(column.name, arrow_type, nullable=column.nullable))
+        converters.append(convert)
+    if watermark_name is None:
+        fields.append(pa.field("snapshot_at", pa.timestamp("us"), nullable=False))
+    schema = pa.schema(fields)
+
+    query = select(*columns)
+    since = None
+    if watermark_name is not None:
+        watermark_column = source.c[watermark_name]
+        query = query.where(watermark_column <= now - timedelta(seconds=EXPORT_LAG_SECONDS))
+        saved = None if full else load_watermarks(export_dir).get(table.value)
+        if saved:
+            since = datetime.fromisoformat(saved)
+            query = query.where(watermark_column > since)
+        query = query.order_by(watermark_column, *source.primary_key.columns)
+        watermark_index = columns.index(watermark_column)
+    else:
+        query = query.order_by(*source.primary_key.columns)
+
+    target_dir = export_dir / table.value
+    target_dir.mkdir(parents=True, exist_ok=True)
+    target = target_dir / f"{table.value}-{now:%Y%m%dT%H%M%S%f}.{EXTENSIONS[fmt]}"
+    partial = target.with_name(target.name + ".part")
+
+    writer = None
+    rows_written = 0
+    watermark = since
+    try:
+        with bind.connect() as conn:
+            result = conn.execution_options(stream_results=True, yield_per=EXPORT_BATCH_SIZE).execute(query)
+            for rows in result.partitions():
+                arrays = [
+                    pa.array([convert(row[i]) for row in rows], type=fields[i].type)
+                    for i, convert in enumerate(converters)
+                ]
+                if watermark_name is None:
+                    arrays.append(pa.array([now] * len(rows), type=pa.timestamp("us")))
+                else:
+                    watermark = rows[-1][watermark_index]
+                batch = pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+                if writer is None:
+                    if fmt == ExportFormat.parquet:
+                        writer = pa.parquet.ParquetWriter(partial, schema, compression="zstd")
+                    else:
+                        writer = pa.ipc.new_file(partial, schema)
+                writer.write_batch(batch)
+                rows_written += len(rows)
+        if writer is not None:
+            writer.close()
+            writer = None
+    except Exception:
+        if writer is not None:
+            writer.close()
+        partial.unlink(missing_ok=True)
+        raise
+
+    if rows_written == 0:
+        logging.info(f"[Export] {table.value}: no changes since {since}")
+        return None
+
+    partial.replace(target)
+    if watermark_name is not None:
+        _save_watermark(export_dir, table, watermark)
+    logging.info(f"[Export] {table.value}: wrote {rows_written} rows to {target}")
+    return target
+
+
+def run_export(
+    tables: Optional[list[ExportTable]] = None,
+    fmt: ExportFormat = ExportFormat.parquet,
+    full: bool = False,
+    export_dir: Path = EXPORT_DIR,
+) -> dict[ExportTable, Optional[Path]]:
+    if not _export_lock.acquire(blocking=False):
+        raise ExportInProgressError()
+    try:
+        results = {}
+        for table in tables or list(EXPORT_TABLES):
+            try:
+                results[table] = export_table(table, fmt, full, export_dir)
+            except Exception as e:
+                # Keep going: one failing table should not hold back the others.
+                logging.error(f"[Export] {table.value} failed: {e}")
+                results[table] = None
+        return results
+    finally:
+        _export_lock.release()
+
+
+def main() -> None:
+    from ..logging import LogLevels, configure_logging
+
+    parser = argparse.ArgumentParser(description="Export operational tables to Parquet / Arrow")
+    parser.add_argument("tables", nargs="*", choices=[t.value for t in ExportTable], help="tables to export (default: all)")
+    parser.add_argument("--format", choices=[f.value for f in ExportFormat], default=ExportFormat.parquet.value)
+    parser.add_argument("--full", action="store_true", help="ignore the saved watermarks and export every row")
+    parser.add_argument("--dir", type=Path, default=EXPORT_DIR, help=f"output directory (default: {EXPORT_DIR})")
+    args = parser.parse_args()
+
+    configure_logging(LogLevels.info)
+    try:
+        ensure_available()
+    except ExportUnavailableError as e:
+        parser.error(e.detail)
+
+    tables = [ExportTable(t) for t in args.tables] or None
+    run_export(tables, ExportFormat(args.format), args.full, args.dir)
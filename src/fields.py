@@ -0,0 +1,59 @@
+# Sparse fieldsets: ?fields=reportId,pet_name,photo on list routes.
+#
+# A feature describes its response fields once, as
+#   {response field: (attributes/loader options to load, getter)}
+# and the same map drives both the SQL projection (load_only / joinedload) and the
+# serialized item, so unrequested columns are neither selected nor sent.
+# Getters must only touch what their own entry loads, or the ORM lazy-loads it per row.
+
+from typing import Annotated, Any, Callable, Optional
+
+from fastapi import Depends, Query
+from sqlalchemy.orm import load_only
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+
+from .exceptions import InvalidFieldsError
+
+
+FieldMap = dict[str, tuple[tuple, Callable[[Any], Any]]]
+
+
+def get_fields(
+    fields: Optional[str] = Query(None, description="Comma-separated response fields to return, e.g. fields=reportId,pet_name,photo"),
+) -> Optional[set[str]]:
+    if not fields:
+        return None
+    return {name.strip() for name in fields.split(",") if name.strip()} or None
+
+
+Fields = Annotated[Optional[set[str]], Depends(get_fields)]
+
+
+def check_fields(field_map: FieldMap, fields: Optional[set[str]], extra: tuple = ()) -> None:
+    if fields is None:
+        return
+    allowed = set(field_map) | set(extra)
+    unknown = fields - allowed
+    if unknown:
+        raise InvalidFieldsError(sorted(unknown), sorted(allowed))
+
+
+def load_options(field_map: FieldMap, fields: set[str], *always) -> list:
+    # Loader options for the requested fields. `always` are columns the query needs
+    # regardless (sort key / cursor columns, foreign keys used by the caller).
+    columns, options = list(always), []
+    for name in fields:
+        for target in field_map[name][0]:
+            # Compare by identity: == on mapped attributes builds SQL expressions.
+            group = columns if isinstance(target, InstrumentedAttribute) else options
+            if not any(target is seen for seen in group):
+                group.append(target)
+    return [load_only(*columns), *options]
+
+
+def project(obj: Any, field_map: FieldMap, fields: Optional[set[str]]) -> dict:
+    return {
+        name: getter(obj)
+        for name, (_, getter) in field_map.items()
+        if fields is None or name in fields
+    }
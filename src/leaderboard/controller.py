@@ -1,16 +1,22 @@
 from fastapi import APIRouter, status
-from typing import List
 from uuid import UUID
 
 from ..database.core import DbSession
 from . import models
 from . import service
+from ..caching import conditional_get
+from ..entities.leaderboard import LeaderboardUser
+from ..entities.user import User
+from ..pagination import Page, Pagination
 
 router = APIRouter(
     prefix="/leaderboard",
     tags=["Leaderboard"]
 )
 
+# Names and avatars come from users, so a profile change also invalidates the list.
+LIST_CACHE_CONTROL = "public, max-age=15"
+
 
 
 
@@ -19,9 +25,9 @@ def create_leaderboard_entry(db: DbSession, entry: models.LeaderboardCreate):
     return service.create_user_entry(db, entry)
 
 
-@router.get("/", response_model=List[models.LeaderboardResponse])
-def get_leaderboard(db: DbSession):
-    return service.get_all_users(db)
+@router.get("/", response_model=Page[models.LeaderboardResponse], dependencies=[conditional_get(LeaderboardUser, User, cache_control=LIST_CACHE_CONTROL)])
+def get_leaderboard(db: DbSession, page: Pagination):
+    return service.get_all_users(db, page)
 
 
 @router.get("/{user_id}", response_model=models.LeaderboardResponse)
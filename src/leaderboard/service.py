@@ -4,6 +4,8 @@ from fastapi import HTTPException, status
 from . import models
 from src.entities.leaderboard import LeaderboardUser
 from src.entities.user import User
+from src.pagination import PageParams, paginate
+from sqlalchemy import and_, or_
 import logging
 
 
@@ -25,12 +27,24 @@ def create_user_entry(db: Session, data: models.LeaderboardCreate) -> Leaderboar
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def get_all_users(db: Session) -> list[models.LeaderboardResponse]:
-    entries = db.query(LeaderboardUser).join(User).order_by(LeaderboardUser.score.desc()).all()
-    
+def get_all_users(db: Session, page: PageParams) -> dict:
+    query = db.query(LeaderboardUser).join(User)
+    entries, next_cursor = paginate(query, page, LeaderboardUser.score, LeaderboardUser.id)
+
+    # Rank of the first row on this page = number of entries ahead of it + 1
+    first_rank = 1
+    if entries:
+        first = entries[0]
+        first_rank = db.query(LeaderboardUser).filter(
+            or_(
+                LeaderboardUser.score > first.score,
+                and_(LeaderboardUser.score == first.score, LeaderboardUser.id > first.id),
+            )
+        ).count() + 1
+
     # Compute rank dynamically
     response = []
-    for index, entry in enumerate(entries, start=1):
+    for index, entry in enumerate(entries, start=first_rank):
         response.append(models.LeaderboardResponse(
             id=entry.id,
             user_id=entry.user_id,
@@ -44,7 +58,7 @@ def get_all_users(db: Session) -> list[models.LeaderboardResponse]:
             avatar=entry.avatar,
             rank=index
         ))
-    return response
+    return {"items": response, "next_cursor": next_cursor}
 
 
 def get_user_entry(db: Session, user_id: UUID) -> models.LeaderboardResponse:
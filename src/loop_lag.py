@@ -0,0 +1,65 @@
+# Event-loop lag monitor, for catching blocking calls in async code.
+#
+# Off unless LOOP_LAG_WARN_MS is set (e.g. LOOP_LAG_WARN_MS=50 in development or
+# staging). A heartbeat task sleeps LOOP_LAG_INTERVAL_MS and measures how late it
+# wakes up; waking more than LOOP_LAG_WARN_MS late means something held the loop.
+# asyncio debug mode is switched on with the same threshold, so asyncio also logs
+# which task did the blocking ("Executing <Task ... coro=<register_user() ...>> took
+# 0.312 seconds"). Debug mode slows the loop down, so leave it off in production.
+#
+# Counters are exposed under "event_loop" at GET /metrics.
+
+import asyncio
+import logging
+import os
+
+from .metrics import register_metrics
+
+
+LOOP_LAG_WARN_MS = float(os.getenv("LOOP_LAG_WARN_MS", "0"))
+LOOP_LAG_INTERVAL_MS = float(os.getenv("LOOP_LAG_INTERVAL_MS", "100"))
+
+_stats = {"checks": 0, "stalls": 0, "max_lag_ms": 0.0, "last_stall_ms": 0.0}
+_task: asyncio.Task | None = None
+
+
+def loop_lag_status() -> dict:
+    return {"warn_ms": LOOP_LAG_WARN_MS, **_stats}
+
+
+async def _watch(interval: float, warn_ms: float) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        await asyncio.sleep(interval)
+        lag_ms = (loop.time() - started - interval) * 1000
+        _stats["checks"] += 1
+        _stats["max_lag_ms"] = max(_stats["max_lag_ms"], round(lag_ms, 1))
+        if lag_ms >= warn_ms:
+            _stats["stalls"] += 1
+            _stats["last_stall_ms"] = round(lag_ms, 1)
+            logging.warning(f"[LoopLag] event loop blocked for ~{lag_ms:.0f} ms (threshold {warn_ms:.0f} ms)")
+
+
+def start_loop_lag_monitor() -> None:
+    global _task
+    if LOOP_LAG_WARN_MS <= 0 or _task is not None:
+        return
+    loop = asyncio.get_running_loop()
+    loop.set_debug(True)
+    loop.slow_callback_duration = LOOP_LAG_WARN_MS / 1000
+    _task = loop.create_task(_watch(LOOP_LAG_INTERVAL_MS / 1000, LOOP_LAG_WARN_MS))
+    register_metrics("event_loop", loop_lag_status)
+    logging.info(f"[LoopLag] monitoring event loop, warning above {LOOP_LAG_WARN_MS:.0f} ms")
+
+
+async def stop_loop_lag_monitor() -> None:
+    global _task
+    if _task is None:
+        return
+    _task.cancel()
+    try:
+        await _task
+    except asyncio.CancelledError:
+        pass
+    _task = None
@@ -5,6 +5,12 @@ from src.utils.s3_service import upload_image_to_s3
 from ..database.core import DbSession
 from . import models, service
 from ..auth.service import CurrentUser
+from ..pagination import Page, Pagination
+from ..responses import ORJSONResponse
+from ..sync import ChangeSet, Sync
+from ..fields import Fields
+from ..streaming import StreamFormat
+from fastapi.responses import StreamingResponse
 import logging
 
 router = APIRouter(
@@ -32,9 +38,23 @@ def create_report(db: DbSession, payload: models.LostFoundCreate, current_user:
     return service.create_lost_pet_report(current_user, db, payload)
 
 
-@router.get("/", response_model=List[models.LostFoundResponse])
-def list_reports(db: DbSession, current_user: CurrentUser):
-    return service.get_lost_pets(current_user, db)
+@router.get("/", response_model=Page[models.LostFoundResponse], response_class=ORJSONResponse)
+def list_reports(db: DbSession, current_user: CurrentUser, page: Pagination, fields: Fields):
+    # Service output is already shaped like the response model (narrowed to `fields`
+    # when given); skip revalidation.
+    return ORJSONResponse(service.get_lost_pets(current_user, db, page, fields))
+
+
+@router.get("/changes", response_model=ChangeSet[models.LostFoundResponse])
+def list_report_changes(db: DbSession, current_user: CurrentUser, sync: Sync):
+    # Delta sync: reports created, updated or deleted since the cursor (see src/sync.py).
+    return service.get_lost_pet_changes(current_user, db, sync)
+
+
+@router.get("/stream", response_class=StreamingResponse)
+def stream_reports(current_user: CurrentUser, fields: Fields, format: StreamFormat = Query(StreamFormat.json)):
+    # Every report in one response, written incrementally (see src/streaming.py).
+    return service.stream_lost_pets(current_user, format, fields)
 
 
 @router.get("/{report_id}", response_model=models.LostFoundResponse)
@@ -60,7 +80,7 @@ def get_by_chat(chat_id: UUID, db: DbSession, current_user: CurrentUser):
     return service.get_lost_pet_by_chat(current_user, db, chat_id)
 
 @router.post("/upload-s3")
-async def upload_s3_image(
+def upload_s3_image(
     file: UploadFile ,
     folder: str ,     # default folder for existing callers
     current_user: CurrentUser ,
@@ -72,6 +92,8 @@ async def upload_s3_image(
     try:
         url = upload_image_to_s3(file, folder=folder)
         return {"url": url}
+    except HTTPException:
+        raise
     except Exception as e:
         logging.error(f"S3 upload failed: {e}")
         raise HTTPException(
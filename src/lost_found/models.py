@@ -1,6 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, computed_field
 from uuid import UUID
-from typing import Optional
+from typing import Dict, Optional
+from src.media.variants import variant_urls
 
 
 class LostFoundBase(BaseModel):
@@ -40,5 +41,11 @@ class LostFoundResponse(LostFoundBase):
     userLastName: Optional[str] = None
     userFullName: Optional[str] = None
 
+    @computed_field
+    @property
+    def photo_variants(self) -> Optional[Dict[str, str]]:
+        # thumb/medium URLs for photo, when it is one of our uploads
+        return variant_urls(self.photo)
+
     class Config:
         orm_mode = True
@@ -1,12 +1,19 @@
-from uuid import uuid4, UUID
+from uuid import UUID
 from datetime import datetime, timezone
 from sqlalchemy.orm import Session, joinedload
 from fastapi import HTTPException
 from . import models
 from src.entities.lost_found import LostFoundReport, LostFoundStatusEnum
+from src.database.ids import uuid7
 from src.entities.chat import Chat, ChatMember, ChatTypeEnum
 from src.entities.leaderboard import LeaderboardUser
 from src.exceptions import LostFoundCreationError, LostFoundNotFoundError, AuthorizationError
+from src.pagination import PageParams, paginate
+from src.sync import SyncParams, changes_since
+from src.fields import FieldMap, check_fields, load_options, project
+from src.streaming import StreamFormat, stream_query
+from src.entities.user import User
+from src.media.variants import variant_urls
 import logging
 from math import radians, sin, cos, sqrt, atan2
 
@@ -23,7 +30,7 @@ def haversine(lat1, lon1, lat2, lon2):
 def create_lost_pet_report(current_user, db: Session, payload: models.LostFoundCreate) -> models.LostFoundResponse:
     try:
         report = LostFoundReport(**payload.model_dump(exclude={"chat_id"}))
-        report.report_id = uuid4()
+        report.report_id = uuid7()
         report.user_id = current_user.get_uuid()
         report.created_at = datetime.now(timezone.utc)
         report.updated_at = datetime.now(timezone.utc)
@@ -81,29 +88,62 @@ def create_lost_pet_report(current_user, db: Session, payload: models.LostFoundC
         raise LostFoundCreationError(str(e))
 
 
-def get_lost_pets(current_user, db: Session):
-    reports = db.query(LostFoundReport).options(joinedload(LostFoundReport.user)).all()
-    results = []
-    for r in reports:
-        u = r.user
-        results.append({
-            "reportId": r.report_id,
-            "userId": r.user_id,
-            "userFirstName": u.first_name if u else "Unknown",
-            "userLastName": u.last_name if u else "Unknown",
-            "userFullName": f"{u.first_name} {u.last_name}" if u else "Unknown",
-            "pet_name": r.pet_name,
-            "pet_type": r.pet_type,
-            "gender": r.gender.value if hasattr(r.gender, "value") else r.gender,
-            "description": r.description,
-            "location": r.location,
-            "latitude": r.latitude,
-            "longitude": r.longitude,
-            "photo": r.photo,
-            "status": r.status.value if hasattr(r.status, "value") else r.status,
-            "chatId": r.chat_id
-        })
-    return results
+_REPORTER = joinedload(LostFoundReport.user).load_only(User.first_name, User.last_name)
+
+# LostFoundResponse field -> (what to load, value). Drives sparse ?fields= lists (see src/fields.py).
+REPORT_FIELDS: FieldMap = {
+    "reportId": ((LostFoundReport.report_id,), lambda r: r.report_id),
+    "userId": ((LostFoundReport.user_id,), lambda r: r.user_id),
+    "userFirstName": ((_REPORTER,), lambda r: r.user.first_name if r.user else "Unknown"),
+    "userLastName": ((_REPORTER,), lambda r: r.user.last_name if r.user else "Unknown"),
+    "userFullName": ((_REPORTER,), lambda r: f"{r.user.first_name} {r.user.last_name}" if r.user else "Unknown"),
+    "pet_name": ((LostFoundReport.pet_name,), lambda r: r.pet_name),
+    "pet_type": ((LostFoundReport.pet_type,), lambda r: r.pet_type),
+    "gender": ((LostFoundReport.gender,), lambda r: r.gender.value if hasattr(r.gender, "value") else r.gender),
+    "description": ((LostFoundReport.description,), lambda r: r.description),
+    "location": ((LostFoundReport.location,), lambda r: r.location),
+    "latitude": ((LostFoundReport.latitude,), lambda r: r.latitude),
+    "longitude": ((LostFoundReport.longitude,), lambda r: r.longitude),
+    "photo": ((LostFoundReport.photo,), lambda r: r.photo),
+    "photo_variants": ((LostFoundReport.photo,), lambda r: variant_urls(r.photo)),
+    "status": ((LostFoundReport.status,), lambda r: r.status.value if hasattr(r.status, "value") else r.status),
+    "chatId": ((LostFoundReport.chat_id,), lambda r: r.chat_id),
+}
+
+
+def _report_item(r: LostFoundReport, fields: set[str] | None = None) -> dict:
+    return project(r, REPORT_FIELDS, fields)
+
+
+def _lost_pets_query(db: Session, fields: set[str] | None):
+    query = db.query(LostFoundReport)
+    if fields is None:
+        return query.options(joinedload(LostFoundReport.user))
+    return query.options(*load_options(REPORT_FIELDS, fields, LostFoundReport.created_at, LostFoundReport.report_id))
+
+
+def get_lost_pets(current_user, db: Session, page: PageParams, fields: set[str] | None = None):
+    check_fields(REPORT_FIELDS, fields)
+    query = _lost_pets_query(db, fields)
+    reports, next_cursor = paginate(query, page, LostFoundReport.created_at, LostFoundReport.report_id)
+    return {"items": [_report_item(r, fields) for r in reports], "next_cursor": next_cursor}
+
+
+def stream_lost_pets(current_user, fmt: StreamFormat, fields: set[str] | None = None):
+    # Every report, newest first, without materializing the list (see src/streaming.py).
+    check_fields(REPORT_FIELDS, fields)
+    return stream_query(
+        lambda db: _lost_pets_query(db, fields).order_by(LostFoundReport.created_at.desc(), LostFoundReport.report_id.desc()),
+        lambda r: _report_item(r, fields),
+        fmt,
+    )
+
+
+def get_lost_pet_changes(current_user, db: Session, params: SyncParams):
+    query = db.query(LostFoundReport).options(joinedload(LostFoundReport.user))
+    changes = changes_since(query, params, LostFoundReport.updated_at, LostFoundReport.report_id)
+    changes["upserts"] = [_report_item(r) for r in changes["upserts"]]
+    return changes
 
 
 def get_lost_pet_by_id(current_user, db: Session, report_id: UUID):
@@ -2,17 +2,32 @@ import os
 import importlib
 import pkgutil
 
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.staticfiles import StaticFiles
+from slowapi import _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
 
 from .api import register_routes
-from .database.core import Base, engine
+from .database.core import ANYIO_THREAD_LIMIT, Base, engine
 from .logging import LogLevels, configure_logging
+from . import rate_limiter
+from .rate_limiter import limiter
+from .loop_lag import start_loop_lag_monitor, stop_loop_lag_monitor
+from .auth import hashing
+from .outbox import worker as outbox_worker
+from .media import variants as media_variants
+from .media.storage import LOCAL_MEDIA_PATH, LocalStorage, get_storage, storage_name
 
 configure_logging(LogLevels.info)
 
 app = FastAPI()
 
+# slowapi looks the limiter up on app.state; the handler turns RateLimitExceeded into a 429.
+app.state.limiter = limiter
+app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+
 
 app.add_middleware(
     CORSMiddleware,
@@ -25,6 +40,10 @@ app.add_middleware(
 # from fastapi.staticfiles import StaticFiles
 # app.mount("/static", StaticFiles(directory="static"), name="static")
 
+# Uploads stored with MEDIA_STORAGE=local are served from here (see src/media/storage.py).
+if storage_name() == LocalStorage.name:
+    app.mount(LOCAL_MEDIA_PATH, StaticFiles(directory=get_storage().root, check_dir=False), name="media")
+
 
 
 @app.get("/health")
@@ -32,6 +51,38 @@ def health():
     return {"status": "ok"}
 
 
+@app.on_event("startup")
+def _startup_check_rate_limits() -> None:
+    rate_limiter.check_config()
+
+
+@app.on_event("startup")
+async def _startup_thread_limit() -> None:
+    # Sync routes run on AnyIO's threadpool; keep it in step with the DB pool sizing.
+    to_thread.current_default_thread_limiter().total_tokens = ANYIO_THREAD_LIMIT
+
+
+@app.on_event("startup")
+async def _startup_loop_lag_monitor() -> None:
+    # No-op unless LOOP_LAG_WARN_MS is set (see src/loop_lag.py).
+    start_loop_lag_monitor()
+
+
+@app.on_event("shutdown")
+async def _shutdown_loop_lag_monitor() -> None:
+    await stop_loop_lag_monitor()
+
+
+@app.on_event("shutdown")
+def _shutdown_hashing_pool() -> None:
+    hashing.shutdown()
+
+
+@app.on_event("shutdown")
+def _shutdown_media_pool() -> None:
+    media_variants.shutdown()
+
+
 @app.on_event("startup")
 def _startup_db_init() -> None:
     auto_create = os.getenv("AUTO_CREATE_TABLES", "false").strip().lower() in {"1", "true", "yes", "on"}
@@ -46,4 +97,16 @@ def _startup_db_init() -> None:
 
     Base.metadata.create_all(bind=engine)
 
+
+@app.on_event("startup")
+def _startup_email_outbox() -> None:
+    # Background sender for queued emails; EMAIL_OUTBOX_WORKER=false when it runs separately.
+    outbox_worker.start_worker()
+
+
+@app.on_event("shutdown")
+def _shutdown_email_outbox() -> None:
+    outbox_worker.stop_worker()
+
+
 register_routes(app)
\ No newline at end of file
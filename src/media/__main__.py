@@ -0,0 +1,4 @@
+from .variants import main
+
+
+main()
@@ -0,0 +1,62 @@
+import tempfile
+import time
+
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+
+from ..auth.service import CurrentUser
+from ..database.core import DbSession
+from ..exceptions import InvalidUploadError
+from . import models, service, uploads
+from .storage import LocalStorage, get_storage
+
+router = APIRouter(
+    prefix="/uploads",
+    tags=["Uploads"]
+)
+
+
+@router.post("/presign", response_model=models.PresignedUpload)
+def presign_upload(db: DbSession, request: models.PresignUploadRequest, current_user: CurrentUser):
+    # Where to send a file directly to storage, bypassing the API (see media/service.py).
+    return service.presign_upload(db, current_user, request)
+
+
+@router.post("/confirm", response_model=models.ConfirmedUpload)
+def confirm_upload(db: DbSession, request: models.ConfirmUploadRequest, current_user: CurrentUser):
+    # Attach a finished direct upload to its pet / report / product / profile.
+    return service.confirm_upload(db, current_user, request.upload_token)
+
+
+@router.post("/files", response_model=models.UploadFilesResponse)
+async def upload_files(request: Request, purpose: models.UploadPurpose, current_user: CurrentUser):
+    # Several files in one multipart/form-data body, streamed to storage as they arrive
+    # (see media/uploads.py). Returns the stored URLs with a result per file; attach them
+    # with the usual create/update endpoints.
+    return await uploads.upload_files(request, current_user, purpose)
+
+
+@router.put("/local/{upload_token}", status_code=status.HTTP_204_NO_CONTENT, include_in_schema=False)
+async def receive_local_upload(upload_token: str, request: Request):
+    # Stands in for the bucket's presigned PUT when MEDIA_STORAGE=local. The body is
+    # streamed to a spooled temp file and cut off as soon as it passes the size limit.
+    storage = get_storage()
+    if not isinstance(storage, LocalStorage):
+        raise HTTPException(status_code=404, detail="Not Found")
+    claims = service.decode_upload_token(upload_token)
+    if time.time() > claims["upload_exp"]:
+        raise InvalidUploadError("Upload URL has expired")
+    if request.headers.get("content-type") != claims["ct"]:
+        raise InvalidUploadError("Content-Type does not match the presigned upload")
+
+    size = 0
+    with tempfile.SpooledTemporaryFile(max_size=1024 * 1024) as body:
+        async for chunk in request.stream():
+            size += len(chunk)
+            if size > claims["max"]:
+                raise InvalidUploadError(f"File is larger than {claims['max']} bytes")
+            body.write(chunk)
+        if size == 0:
+            raise InvalidUploadError("Empty upload")
+        body.seek(0)
+        await run_in_threadpool(storage.put, claims["key"], body, claims["ct"])
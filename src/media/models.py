@@ -0,0 +1,76 @@
+import enum
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class UploadPurpose(str, enum.Enum):
+    pet_image = "pet_image"                # appended to the pet's images (target_id: pet_id)
+    lost_found_photo = "lost_found_photo"  # LostFoundReport.photo (target_id: report_id)
+    rescue_photo = "rescue_photo"          # RescueReport.photo (target_id: report_id)
+    product_image = "product_image"        # Product.image_url (target_id: product id; admins only)
+    profile_photo = "profile_photo"        # the caller's User.profile_photo_url (no target_id)
+
+
+class UploadMethod(str, enum.Enum):
+    post = "post"  # form POST; the size range is enforced by the storage
+    put = "put"    # raw PUT of exactly `size` bytes
+
+
+class PresignUploadRequest(BaseModel):
+    purpose: UploadPurpose
+    target_id: Optional[UUID] = None
+    content_type: str = Field(..., examples=["image/jpeg"])
+    size: int = Field(..., gt=0, description="File size in bytes")
+    method: UploadMethod = UploadMethod.post
+
+
+class PresignedUpload(BaseModel):
+    # Send the file to `url` with `method`: for POST, a multipart form with `fields`
+    # followed by the file as "file"; for PUT, the raw bytes with `headers`.
+    # Then call POST /uploads/confirm with upload_token.
+    upload_token: str
+    key: str
+    method: str
+    url: str
+    fields: Dict[str, str] = {}
+    headers: Dict[str, str] = {}
+    max_bytes: int
+    expires_at: datetime
+
+
+class UploadFileStatus(str, enum.Enum):
+    stored = "stored"
+    failed = "failed"
+
+
+class UploadedFile(BaseModel):
+    index: int               # position among the files of the request
+    field: str               # form field name
+    filename: Optional[str] = None
+    status: UploadFileStatus
+    size: int                # bytes received
+    parts: int               # parts written to the storage
+    url: Optional[str] = None
+    variants: Optional[Dict[str, str]] = None
+    error: Optional[str] = None
+
+
+class UploadFilesResponse(BaseModel):
+    purpose: UploadPurpose
+    stored: int
+    failed: int
+    files: List[UploadedFile]
+
+
+class ConfirmUploadRequest(BaseModel):
+    upload_token: str
+
+
+class ConfirmedUpload(BaseModel):
+    purpose: UploadPurpose
+    target_id: Optional[UUID] = None
+    url: str
+    variants: Optional[Dict[str, str]] = None
@@ -0,0 +1,250 @@
+# Stored uploads: server-side (store_image) and direct-to-storage (presign/confirm).
+#
+# Direct uploads keep file bytes off the API workers:
+#   1. POST /uploads/presign   -> a presigned POST (or PUT) for a fresh key, limited to
+#                                 UPLOAD_CONTENT_TYPES and MEDIA_MAX_UPLOAD_BYTES, and a
+#                                 signed upload token naming the key, purpose and target
+#   2. the client sends the file straight to the storage
+#   3. POST /uploads/confirm   -> checks the object landed within the limits and attaches
+#                                 its URL to the target (pet, report, product, profile)
+#                                 (a repeated confirm for a URL the target already has
+#                                 is a no-op)
+# The token is signed with a key derived from SECRET_KEY, so it is never accepted as an
+# access token, and only the user it was issued to can confirm it. Objects that are
+# uploaded but never confirmed are not referenced anywhere; expire them with a bucket
+# lifecycle rule on the upload folders if that matters.
+
+import hashlib
+import logging
+import os
+import re
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import BinaryIO, Callable, Optional
+from uuid import UUID
+
+from jose import JWTError, jwt
+from sqlalchemy.orm import Session, object_session
+
+from src.auth.models import TokenData
+from src.auth.service import ALGORITHM, SECRET_KEY
+from src.entities.lost_found import LostFoundReport
+from src.entities.pet import Pet
+from src.entities.product import Product
+from src.entities.rescue_rep import RescueReport
+from src.entities.user import User
+from src.pets.service import add_pet_image
+from src.exceptions import (
+    InvalidUploadError,
+    LostFoundNotFoundError,
+    PetNotFoundError,
+    RescueReportNotFoundError,
+    StoreItemNotFoundError,
+    UploadNotAllowedError,
+    UploadNotFoundError,
+    UserNotFoundError,
+)
+from . import models
+from .storage import get_storage
+from .variants import schedule_variants, variant_urls
+
+
+MEDIA_MAX_UPLOAD_BYTES = int(os.getenv("MEDIA_MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+MEDIA_PRESIGN_EXPIRES_SECONDS = int(os.getenv("MEDIA_PRESIGN_EXPIRES_SECONDS", "900"))
+# How long after the upload URL expires the upload can still be confirmed.
+MEDIA_CONFIRM_GRACE_SECONDS = int(os.getenv("MEDIA_CONFIRM_GRACE_SECONDS", "3600"))
+
+# content type -> extension of the stored object
+UPLOAD_CONTENT_TYPES = {
+    "image/jpeg": "jpg",
+    "image/png": "png",
+    "image/webp": "webp",
+    "image/gif": "gif",
+    "image/heic": "heic",
+}
+
+UPLOAD_FOLDERS = {
+    models.UploadPurpose.pet_image: "pet_images",
+    models.UploadPurpose.lost_found_photo: "lost_found",
+    models.UploadPurpose.rescue_photo: "rescues",
+    models.UploadPurpose.product_image: "products",
+    models.UploadPurpose.profile_photo: "users",
+}
+
+_EXTENSION = re.compile(r"^[a-z0-9]{1,8}$")
+
+
+def new_key(folder: str, filename: Optional[str]) -> str:
+    extension = (filename or "").rsplit(".", 1)[-1].lower() if "." in (filename or "") else ""
+    if not _EXTENSION.match(extension):
+        extension = "bin"
+    return f"{folder.strip('/')}/{uuid.uuid4()}.{extension}"
+
+
+def store_image(fileobj: BinaryIO, filename: Optional[str], content_type: Optional[str], folder: str) -> str:
+    # Store an uploaded original and queue its variants; returns the original's URL.
+    fileobj.seek(0, os.SEEK_END)
+    if fileobj.tell() > MEDIA_MAX_UPLOAD_BYTES:
+        raise InvalidUploadError(f"File is larger than {MEDIA_MAX_UPLOAD_BYTES} bytes")
+    fileobj.seek(0)
+    storage = get_storage()
+    key = new_key(folder, filename)
+    storage.put(key, fileobj, content_type or "application/octet-stream")
+    logging.info(f"[Media] stored {key}")
+    schedule_variants(key)
+    return storage.url(key)
+
+
+# Upload targets: load (and authorize) the entity, then attach the URL to it.
+
+def _require_target(target_id: Optional[UUID]) -> UUID:
+    if target_id is None:
+        raise InvalidUploadError("target_id is required for this purpose")
+    return target_id
+
+
+def _own_pet(db: Session, current_user: TokenData, target_id: Optional[UUID]) -> Pet:
+    pet_id = _require_target(target_id)
+    pet = db.query(Pet).filter(Pet.pet_id == pet_id, Pet.user_id == current_user.get_uuid()).first()
+    if not pet:
+        raise PetNotFoundError(pet_id)
+    return pet
+
+
+def _own_lost_found_report(db: Session, current_user: TokenData, target_id: Optional[UUID]) -> LostFoundReport:
+    report_id = _require_target(target_id)
+    report = db.query(LostFoundReport).filter(
+        LostFoundReport.report_id == report_id, LostFoundReport.user_id == current_user.get_uuid()
+    ).first()
+    if not report:
+        raise LostFoundNotFoundError(report_id)
+    return report
+
+
+def _own_rescue_report(db: Session, current_user: TokenData, target_id: Optional[UUID]) -> RescueReport:
+    report_id = _require_target(target_id)
+    report = db.query(RescueReport).filter(
+        RescueReport.report_id == report_id, RescueReport.user_id == current_user.get_uuid()
+    ).first()
+    if not report:
+        raise RescueReportNotFoundError(report_id)
+    return report
+
+
+def _product(db: Session, current_user: TokenData, target_id: Optional[UUID]) -> Product:
+    if not current_user.is_admin:
+        raise UploadNotAllowedError("Only admins can upload product images")
+    product_id = _require_target(target_id)
+    product = db.get(Product, product_id)
+    if not product:
+        raise StoreItemNotFoundError(product_id)
+    return product
+
+
+def _self(db: Session, current_user: TokenData, target_id: Optional[UUID]) -> User:
+    user = db.get(User, current_user.get_uuid())
+    if not user:
+        raise UserNotFoundError(current_user.get_uuid())
+    return user
+
+
+# Attaching returns False when the target already has the URL, so a replayed
+# confirm neither writes nor re-queues variants.
+
+def _append_pet_image(pet: Pet, url: str) -> bool:
+    return add_pet_image(object_session(pet), pet, url)
+
+
+def _set_attr(name: str) -> Callable:
+    def attach(target, url: str) -> bool:
+        if getattr(target, name) == url:
+            return False
+        setattr(target, name, url)
+        return True
+    return attach
+
+
+UPLOAD_TARGETS = {
+    models.UploadPurpose.pet_image: (_own_pet, _append_pet_image),
+    models.UploadPurpose.lost_found_photo: (_own_lost_found_report, _set_attr("photo")),
+    models.UploadPurpose.rescue_photo: (_own_rescue_report, _set_attr("photo")),
+    models.UploadPurpose.product_image: (_product, _set_attr("image_url")),
+    models.UploadPurpose.profile_photo: (_self, _set_attr("profile_photo_url")),
+}
+
+
+def _token_key() -> str:
+    return hashlib.sha256(f"upload-token:{SECRET_KEY}".encode()).hexdigest()
+
+
+def decode_upload_token(token: str) -> dict:
+    try:
+        claims = jwt.decode(token, _token_key(), algorithms=[ALGORITHM])
+    except JWTError as e:
+        raise InvalidUploadError("Invalid or expired upload token") from e
+    if claims.get("typ") != "upload":
+        raise InvalidUploadError("Invalid or expired upload token")
+    return claims
+
+
+def presign_upload(db: Session, current_user: TokenData, request: models.PresignUploadRequest) -> dict:
+    extension = UPLOAD_CONTENT_TYPES.get(request.content_type)
+    if extension is None:
+        raise InvalidUploadError(f"Unsupported content type; allowed: {', '.join(UPLOAD_CONTENT_TYPES)}")
+    if request.size > MEDIA_MAX_UPLOAD_BYTES:
+        raise InvalidUploadError(f"File is larger than {MEDIA_MAX_UPLOAD_BYTES} bytes")
+
+    load_target, _ = UPLOAD_TARGETS[request.purpose]
+    load_target(db, current_user, request.target_id)
+
+    key = f"{UPLOAD_FOLDERS[request.purpose]}/{uuid.uuid4()}.{extension}"
+    now = datetime.now(timezone.utc)
+    expires_at = now + timedelta(seconds=MEDIA_PRESIGN_EXPIRES_SECONDS)
+    token = jwt.encode({
+        "typ": "upload",
+        "key": key,
+        "purpose": request.purpose.value,
+        "target": str(request.target_id) if request.target_id else None,
+        "owner": current_user.user_id,
+        "ct": request.content_type,
+        "max": MEDIA_MAX_UPLOAD_BYTES,
+        "upload_exp": int(expires_at.timestamp()),
+        "exp": expires_at + timedelta(seconds=MEDIA_CONFIRM_GRACE_SECONDS),
+    }, _token_key(), algorithm=ALGORITHM)
+
+    target = get_storage().presign_upload(
+        key, request.content_type, request.size, MEDIA_MAX_UPLOAD_BYTES,
+        MEDIA_PRESIGN_EXPIRES_SECONDS, request.method.value, token,
+    )
+    logging.info(f"[Media] presigned {key} for user {current_user.user_id}")
+    return {**target, "upload_token": token, "key": key, "max_bytes": MEDIA_MAX_UPLOAD_BYTES, "expires_at": expires_at}
+
+
+def confirm_upload(db: Session, current_user: TokenData, upload_token: str) -> dict:
+    claims = decode_upload_token(upload_token)
+    if claims.get("owner") != current_user.user_id:
+        raise UploadNotAllowedError("This upload was issued to another user")
+
+    storage = get_storage()
+    key = claims["key"]
+    info = storage.stat(key)
+    if info is None:
+        raise UploadNotFoundError()
+    if info.size > claims["max"] or (info.content_type and info.content_type != claims["ct"]):
+        # The storage enforces these too; never attach an object that slipped past it.
+        storage.delete(key)
+        raise InvalidUploadError("Uploaded file does not match the presigned limits")
+
+    purpose = models.UploadPurpose(claims["purpose"])
+    target_id = UUID(claims["target"]) if claims.get("target") else None
+    load_target, attach = UPLOAD_TARGETS[purpose]
+    url = storage.url(key)
+    result = {"purpose": purpose, "target_id": target_id, "url": url, "variants": variant_urls(url)}
+    if not attach(load_target(db, current_user, target_id), url):
+        logging.info(f"[Media] {key} already confirmed as {purpose.value}")
+        return result
+    db.commit()
+    logging.info(f"[Media] confirmed {key} as {purpose.value} for user {current_user.user_id}")
+
+    schedule_variants(key)
+    return result
@@ -0,0 +1,269 @@
+# Object storage for uploaded media, picked with MEDIA_STORAGE:
+#   s3    - the AWS_S3_BUCKET_NAME bucket (default). Without a bucket, storing or reading
+#           objects raises, rather than quietly writing to the container's disk.
+#   local - files under MEDIA_LOCAL_ROOT, served by the app at /media (only when set
+#           explicitly; tests and local development)
+# Objects are addressed by key ("pets/<uuid>.jpg"); url() is the public URL clients get,
+# and key_for_url() maps one of our URLs back to its key (None for foreign URLs).
+# presign_upload() lets a client upload straight to the store (see src/media/service.py);
+# start_multipart() writes one object from parts sent concurrently (see src/media/uploads.py).
+
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import BinaryIO, Iterator, NamedTuple, Optional
+
+
+MEDIA_LOCAL_ROOT = Path(os.getenv("MEDIA_LOCAL_ROOT", "media"))
+LOCAL_MEDIA_PATH = "/media"
+# Stands in for the bucket's presigned upload endpoint (see src/media/controller.py).
+LOCAL_UPLOAD_PATH = "/uploads/local"
+# Public base URL for object keys, e.g. a CloudFront domain in front of the bucket.
+MEDIA_PUBLIC_BASE_URL = os.getenv("MEDIA_PUBLIC_BASE_URL")
+
+
+class ObjectInfo(NamedTuple):
+    size: int
+    content_type: Optional[str]
+
+
+class MultipartWriter:
+    # One object written as numbered parts, possibly from several threads at once.
+    # Every part but the last has the part_size given to start_multipart().
+
+    def upload_part(self, number: int, data: bytes) -> None:
+        raise NotImplementedError
+
+    def complete(self) -> None:
+        raise NotImplementedError
+
+    def abort(self) -> None:
+        raise NotImplementedError
+
+
+class Storage:
+    name = "base"
+    base_url = ""
+
+    def put(self, key: str, fileobj: BinaryIO, content_type: str) -> None:
+        raise NotImplementedError
+
+    def get(self, key: str) -> bytes:
+        raise NotImplementedError
+
+    def exists(self, key: str) -> bool:
+        return self.stat(key) is not None
+
+    def stat(self, key: str) -> Optional[ObjectInfo]:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def list_keys(self, prefix: str) -> Iterator[str]:
+        raise NotImplementedError
+
+    def presign_upload(self, key: str, content_type: str, size: int, max_bytes: int, expires_in: int, method: str, token: str) -> dict:
+        # {"method", "url", "fields", "headers"} for a client-side upload of `key`.
+        # `token` is the app's signed upload token, for backends the app receives itself.
+        raise NotImplementedError
+
+    def start_multipart(self, key: str, content_type: str, part_size: int) -> MultipartWriter:
+        raise NotImplementedError
+
+    def url(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+
+    def key_for_url(self, url: Optional[str]) -> Optional[str]:
+        if not url or not self.base_url or not url.startswith(self.base_url + "/"):
+            return None
+        return url[len(self.base_url) + 1:]
+
+
+class S3MultipartWriter(MultipartWriter):
+    def __init__(self, client, bucket: str, key: str, content_type: str):
+        self.client, self.bucket, self.key = client, bucket, key
+        self.upload_id = client.create_multipart_upload(Bucket=bucket, Key=key, ContentType=content_type)["UploadId"]
+        self.etags: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def upload_part(self, number: int, data: bytes) -> None:
+        response = self.client.upload_part(
+            Bucket=self.bucket, Key=self.key, UploadId=self.upload_id, PartNumber=number, Body=data
+        )
+        with self._lock:
+            self.etags[number] = response["ETag"]
+
+    def complete(self) -> None:
+        parts = [{"PartNumber": n, "ETag": etag} for n, etag in sorted(self.etags.items())]
+        self.client.complete_multipart_upload(
+            Bucket=self.bucket, Key=self.key, UploadId=self.upload_id, MultipartUpload={"Parts": parts}
+        )
+
+    def abort(self) -> None:
+        self.client.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self.upload_id)
+
+
+class S3Storage(Storage):
+    name = "s3"
+
+    def __init__(self):
+        from ..utils.s3_service import AWS_REGION, BUCKET_NAME
+
+        # A missing bucket only fails the operations that need it, so the app still
+        # starts and serves everything but uploads.
+        self.bucket = BUCKET_NAME
+        base_url = MEDIA_PUBLIC_BASE_URL or (f"https://{BUCKET_NAME}.s3.{AWS_REGION}.amazonaws.com" if BUCKET_NAME else "")
+        self.base_url = base_url.rstrip("/")
+
+    @property
+    def client(self):
+        from ..utils.s3_service import get_s3_client
+
+        if not self.bucket:
+            raise RuntimeError("AWS_S3_BUCKET_NAME is not set (or set MEDIA_STORAGE=local)")
+        return get_s3_client()
+
+    def put(self, key: str, fileobj: BinaryIO, content_type: str) -> None:
+        self.client.upload_fileobj(fileobj, self.bucket, key, ExtraArgs={"ContentType": content_type})
+
+    def get(self, key: str) -> bytes:
+        return self.client.get_object(Bucket=self.bucket, Key=key)["Body"].read()
+
+    def stat(self, key: str) -> Optional[ObjectInfo]:
+        from botocore.exceptions import ClientError
+
+        try:
+            head = self.client.head_object(Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+        return ObjectInfo(head["ContentLength"], head.get("ContentType"))
+
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=key)
+
+    def list_keys(self, prefix: str) -> Iterator[str]:
+        for page in self.client.get_paginator("list_objects_v2").paginate(Bucket=self.bucket, Prefix=prefix):
+            for item in page.get("Contents", []):
+                yield item["Key"]
+
+    def presign_upload(self, key: str, content_type: str, size: int, max_bytes: int, expires_in: int, method: str, token: str) -> dict:
+        if method == "put":
+            # S3 checks the signed Content-Type and Content-Length headers.
+            url = self.client.generate_presigned_url(
+                "put_object",
+                Params={"Bucket": self.bucket, "Key": key, "ContentType": content_type, "ContentLength": size},
+                ExpiresIn=expires_in,
+            )
+            return {"method": "PUT", "url": url, "fields": {}, "headers": {"Content-Type": content_type, "Content-Length": str(size)}}
+        # POST policy: S3 rejects other content types and bodies outside 1..max_bytes.
+        post = self.client.generate_presigned_post(
+            self.bucket,
+            key,
+            Fields={"Content-Type": content_type},
+            Conditions=[{"Content-Type": content_type}, ["content-length-range", 1, max_bytes]],
+            ExpiresIn=expires_in,
+        )
+        return {"method": "POST", "url": post["url"], "fields": post["fields"], "headers": {}}
+
+    def start_multipart(self, key: str, content_type: str, part_size: int) -> MultipartWriter:
+        # S3 needs parts of at least 5 MB (except the last); see MEDIA_UPLOAD_PART_SIZE.
+        return S3MultipartWriter(self.client, self.bucket, key, content_type)
+
+
+class LocalMultipartWriter(MultipartWriter):
+    def __init__(self, path: Path, part_size: int):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path, self.part_size = path, part_size
+        self.partial = path.with_name(f".{path.name}.{uuid.uuid4().hex}.part")
+        self.fd = os.open(self.partial, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+
+    def upload_part(self, number: int, data: bytes) -> None:
+        # Parts land at their own offset, so they can be written in any order.
+        os.pwrite(self.fd, data, (number - 1) * self.part_size)
+
+    def complete(self) -> None:
+        os.close(self.fd)
+        self.partial.replace(self.path)
+
+    def abort(self) -> None:
+        os.close(self.fd)
+        self.partial.unlink(missing_ok=True)
+
+
+class LocalStorage(Storage):
+    name = "local"
+
+    def __init__(self, root: Path = MEDIA_LOCAL_ROOT):
+        self.root = root.resolve()
+        self.base_url = (MEDIA_PUBLIC_BASE_URL or LOCAL_MEDIA_PATH).rstrip("/")
+
+    def path(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        if not path.is_relative_to(self.root):
+            raise ValueError(f"Invalid media key {key!r}")
+        return path
+
+    def put(self, key: str, fileobj: BinaryIO, content_type: str) -> None:
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so readers never see a partial file.
+        partial = path.with_name(f".{path.name}.{threading.get_ident()}.part")
+        with partial.open("wb") as f:
+            shutil.copyfileobj(fileobj, f)
+        partial.replace(path)
+
+    def get(self, key: str) -> bytes:
+        return self.path(key).read_bytes()
+
+    def stat(self, key: str) -> Optional[ObjectInfo]:
+        path = self.path(key)
+        if not path.is_file():
+            return None
+        # The filesystem keeps no content type. PUT /uploads/local/... already rejected any
+        # Content-Type other than the presigned one, so confirm only checks the size.
+        return ObjectInfo(path.stat().st_size, None)
+
+    def delete(self, key: str) -> None:
+        self.path(key).unlink(missing_ok=True)
+
+    def list_keys(self, prefix: str) -> Iterator[str]:
+        for path in sorted(self.root.rglob("*")):
+            key = path.relative_to(self.root).as_posix()
+            if path.is_file() and key.startswith(prefix) and not path.name.startswith("."):
+                yield key
+
+    def presign_upload(self, key: str, content_type: str, size: int, max_bytes: int, expires_in: int, method: str, token: str) -> dict:
+        # The app receives the upload itself, as a raw PUT body, whichever method was asked for.
+        return {"method": "PUT", "url": f"{LOCAL_UPLOAD_PATH}/{token}", "fields": {}, "headers": {"Content-Type": content_type}}
+
+    def start_multipart(self, key: str, content_type: str, part_size: int) -> MultipartWriter:
+        return LocalMultipartWriter(self.path(key), part_size)
+
+
+STORAGES = {
+    S3Storage.name: S3Storage,
+    LocalStorage.name: LocalStorage,
+}
+
+def storage_name() -> str:
+    return os.getenv("MEDIA_STORAGE") or S3Storage.name
+
+
+_storage: Optional[Storage] = None
+_storage_lock = threading.Lock()
+
+
+def get_storage() -> Storage:
+    global _storage
+    with _storage_lock:
+        if _storage is None:
+            name = storage_name()
+            if name not in STORAGES:
+                raise ValueError(f"Unknown MEDIA_STORAGE {name!r}; expected one of {', '.join(STORAGES)}")
+            _storage = STORAGES[name]()
+        return _storage
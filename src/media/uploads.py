@@ -0,0 +1,269 @@
+# Streaming multi-file uploads: POST /uploads/files with a multipart/form-data body.
+#
+# The body is parsed as it arrives; nothing is buffered beyond the part being sent:
+#   - each file is cut into MEDIA_UPLOAD_PART_SIZE parts as its bytes come in and the
+#     parts go to the storage (S3 multipart upload, or offset writes on the local disk)
+#     while the rest of the body is still being read. Files smaller than one part are
+#     stored with a single put.
+#   - at most MEDIA_UPLOAD_CONCURRENCY parts (across all files of the request) are in
+#     flight; reading the body waits for a free slot, so a fast client cannot make the
+#     worker hold more than (MEDIA_UPLOAD_CONCURRENCY + 1) parts in memory.
+#   - a file is rejected the moment it passes MEDIA_MAX_UPLOAD_BYTES (its partial upload
+#     is aborted and its remaining bytes are discarded); files past MEDIA_UPLOAD_MAX_FILES
+#     or with an unsupported Content-Type are discarded without touching the storage.
+# One bad file never fails the others: the response has a result per file, in order,
+# with how many bytes and parts were stored and the error, if any.
+
+import asyncio
+import io
+import logging
+import os
+from typing import Optional
+
+import python_multipart
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import parse_options_header
+
+from src.auth.models import TokenData
+from src.exceptions import InvalidUploadError
+from . import models
+from .service import MEDIA_MAX_UPLOAD_BYTES, UPLOAD_CONTENT_TYPES, UPLOAD_FOLDERS, new_key
+from .storage import MultipartWriter, Storage, get_storage
+from .variants import schedule_variants, variant_urls
+
+
+# S3 rejects multipart parts under 5 MB (other than the last one).
+MEDIA_UPLOAD_PART_SIZE = max(5 * 1024 * 1024, int(os.getenv("MEDIA_UPLOAD_PART_SIZE", str(8 * 1024 * 1024))))
+MEDIA_UPLOAD_CONCURRENCY = max(1, int(os.getenv("MEDIA_UPLOAD_CONCURRENCY", "4")))
+MEDIA_UPLOAD_MAX_FILES = int(os.getenv("MEDIA_UPLOAD_MAX_FILES", "10"))
+
+
+class _File:
+    def __init__(self, index: int, field: str, filename: Optional[str], content_type: Optional[str]):
+        self.index, self.field, self.filename, self.content_type = index, field, filename, content_type
+        self.key: Optional[str] = None
+        self.writer: Optional[MultipartWriter] = None
+        self.buffer = bytearray()
+        self.size = 0
+        self.parts = 0
+        self.parts_stored = 0
+        self.tasks: list[asyncio.Task] = []
+        self.error: Optional[str] = None
+        self.url: Optional[str] = None
+
+    def result(self) -> dict:
+        return {
+            "index": self.index,
+            "field": self.field,
+            "filename": self.filename,
+            "status": models.UploadFileStatus.failed if self.error else models.UploadFileStatus.stored,
+            "size": self.size,
+            "parts": self.parts_stored,
+            "url": self.url,
+            "variants": variant_urls(self.url) if self.url else None,
+            "error": self.error,
+        }
+
+
+class StreamingUpload:
+    def __init__(self, storage: Storage, folder: str):
+        self.storage, self.folder = storage, folder
+        self.slots = asyncio.Semaphore(MEDIA_UPLOAD_CONCURRENCY)
+        self.files: list[_File] = []
+        self.finishing: list[asyncio.Task] = []
+        # Parser callbacks are synchronous; they queue events that run() then awaits.
+        self._events: list[tuple] = []
+        self._headers: dict[bytes, bytes] = {}
+        self._header_field = b""
+        self._header_value = b""
+
+    # python_multipart callbacks
+
+    def on_part_begin(self) -> None:
+        self._headers = {}
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = self._header_value = b""
+
+    def on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        filename = options.get(b"filename")
+        content_type = self._headers.get(b"content-type")
+        self._events.append((
+            "begin",
+            options.get(b"name", b"").decode("latin-1"),
+            filename.decode("utf-8", "replace") if filename is not None else None,
+            content_type.decode("latin-1").split(";")[0].strip().lower() if content_type else None,
+        ))
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        self._events.append(("data", data[start:end]))
+
+    def on_part_end(self) -> None:
+        self._events.append(("end",))
+
+    # streaming
+
+    async def run(self, request: Request) -> list[dict]:
+        content_type, options = parse_options_header(request.headers.get("content-type", ""))
+        boundary = options.get(b"boundary")
+        if content_type != b"multipart/form-data" or not boundary:
+            raise InvalidUploadError("Expected a multipart/form-data body")
+
+        parser = python_multipart.MultipartParser(boundary, {
+            "on_part_begin": self.on_part_begin,
+            "on_part_data": self.on_part_data,
+            "on_part_end": self.on_part_end,
+            "on_header_field": self.on_header_field,
+            "on_header_value": self.on_header_value,
+            "on_header_end": self.on_header_end,
+            "on_headers_finished": self.on_headers_finished,
+        })
+        current: Optional[_File] = None
+        try:
+            async for chunk in request.stream():
+                try:
+                    parser.write(chunk)
+                except MultipartParseError as e:
+                    raise InvalidUploadError("Malformed multipart body") from e
+                events, self._events = self._events, []
+                for event in events:
+                    if event[0] == "begin":
+                        current = self._begin(*event[1:])
+                    elif event[0] == "data":
+                        if current is not None:
+                            await self._data(current, event[1])
+                    elif current is not None:
+                        self.finishing.append(asyncio.create_task(self._finish(current)))
+                        current = None
+            parser.finalize()
+            if current is not None:
+                raise InvalidUploadError("Multipart body ended in the middle of a file")
+            await asyncio.gather(*self.finishing)
+        except BaseException:
+            # Malformed body, client gone or request cancelled: drop every unfinished upload.
+            await self._abort_all()
+            raise
+
+        if not self.files:
+            raise InvalidUploadError("No files in the request")
+        return [f.result() for f in self.files]
+
+    def _begin(self, field: str, filename: Optional[str], content_type: Optional[str]) -> Optional[_File]:
+        if filename is None:
+            return None  # a plain form field; nothing to store
+        f = _File(len(self.files), field, filename, content_type)
+        self.files.append(f)
+        extension = UPLOAD_CONTENT_TYPES.get(content_type or "")
+        if len(self.files) > MEDIA_UPLOAD_MAX_FILES:
+            f.error = f"Too many files; at most {MEDIA_UPLOAD_MAX_FILES} per request"
+        elif extension is None:
+            f.error = f"Unsupported content type; allowed: {', '.join(UPLOAD_CONTENT_TYPES)}"
+        else:
+            f.key = new_key(self.folder, f"upload.{extension}")
+        return f
+
+    async def _data(self, f: _File, data: bytes) -> None:
+        f.size += len(data)
+        if f.error:
+            return
+        if f.size > MEDIA_MAX_UPLOAD_BYTES:
+            f.error = f"File is larger than {MEDIA_MAX_UPLOAD_BYTES} bytes"
+            f.buffer = bytearray()
+            return
+        f.buffer += data
+        while len(f.buffer) >= MEDIA_UPLOAD_PART_SIZE:
+            part = bytes(f.buffer[:MEDIA_UPLOAD_PART_SIZE])
+            del f.buffer[:MEDIA_UPLOAD_PART_SIZE]
+            await self._send_part(f, part)
+
+    async def _send_part(self, f: _File, data: bytes) -> None:
+        # Waiting for a slot here is what holds back reading the request body.
+        await self.slots.acquire()
+        try:
+            if f.writer is None:
+                f.writer = await run_in_threadpool(
+                    self.storage.start_multipart, f.key, f.content_type, MEDIA_UPLOAD_PART_SIZE
+                )
+        except Exception as e:
+            self.slots.release()
+            self._failed(f, e)
+            return
+        f.parts += 1
+        f.tasks.append(asyncio.create_task(self._upload_part(f, f.parts, data)))
+
+    async def _upload_part(self, f: _File, number: int, data: bytes) -> None:
+        try:
+            await run_in_threadpool(f.writer.upload_part, number, data)
+            f.parts_stored += 1
+            logging.debug(f"[Media] {f.key}: part {number} stored")
+        except Exception as e:
+            self._failed(f, e)
+        finally:
+            self.slots.release()
+
+    async def _finish(self, f: _File) -> None:
+        if not f.error and f.size == 0:
+            f.error = "Empty file"
+        if not f.error:
+            if f.writer is None:
+                await self._put_whole(f)
+            elif f.buffer:
+                await self._send_part(f, bytes(f.buffer))
+        f.buffer = bytearray()
+        await asyncio.gather(*f.tasks)
+
+        writer, f.writer = f.writer, None
+        try:
+            if writer is not None:
+                await run_in_threadpool(writer.abort if f.error else writer.complete)
+        except Exception as e:
+            self._failed(f, e)
+        if f.error:
+            logging.info(f"[Media] upload #{f.index} ({f.filename}) failed: {f.error}")
+            return
+        f.url = self.storage.url(f.key)
+        logging.info(f"[Media] stored {f.key} ({f.size} bytes, {max(1, f.parts)} parts)")
+        await run_in_threadpool(schedule_variants, f.key)
+
+    async def _put_whole(self, f: _File) -> None:
+        async with self.slots:
+            try:
+                await run_in_threadpool(self.storage.put, f.key, io.BytesIO(bytes(f.buffer)), f.content_type)
+                f.parts_stored = 1
+            except Exception as e:
+                self._failed(f, e)
+
+    def _failed(self, f: _File, error: Exception) -> None:
+        logging.warning(f"[Media] storing {f.key} failed: {error}")
+        f.error = f.error or "Could not store the file"
+
+    async def _abort_all(self) -> None:
+        tasks = [*self.finishing, *(task for f in self.files for task in f.tasks)]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for f in self.files:
+            writer, f.writer = f.writer, None
+            if writer is not None:
+                try:
+                    await run_in_threadpool(writer.abort)
+                except Exception as e:
+                    logging.warning(f"[Media] could not abort {f.key}: {e}")
+
+
+async def upload_files(request: Request, current_user: TokenData, purpose: models.UploadPurpose) -> dict:
+    upload = StreamingUpload(get_storage(), UPLOAD_FOLDERS[purpose])
+    files = await upload.run(request)
+    stored = sum(1 for f in files if f["status"] == models.UploadFileStatus.stored)
+    logging.info(f"[Media] user {current_user.user_id} uploaded {stored}/{len(files)} files as {purpose.value}")
+    return {"purpose": purpose, "stored": stored, "failed": len(files) - stored, "files": files}
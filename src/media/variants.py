@@ -0,0 +1,268 @@
+# Resized variants of uploaded images, made off the request path.
+#
+# For every stored original "<folder>/<uuid>.<ext>" this writes, next to it,
+#   <folder>/<uuid>_thumb.webp    longest side MEDIA_THUMB_SIZE (list cards)
+#   <folder>/<uuid>_medium.webp   longest side MEDIA_MEDIUM_SIZE (detail screens)
+# re-encoded as WebP, with the EXIF orientation applied and all EXIF (GPS, camera)
+# dropped. Images are never upscaled.
+#
+# Resizing is CPU-bound, so it runs on MEDIA_WORKERS spawned processes; the upload
+# returns as soon as the original is stored. Variant URLs are derived from the original
+# URL (variant_urls), so responses can expose them straight away. They may 404 for a
+# moment after an upload, or for originals stored before this existed; clients fall
+# back to the original. At most MEDIA_QUEUE_MAX jobs are queued per API worker; past
+# that, jobs are dropped (and logged) rather than slowing uploads down.
+#
+# Regenerate missing variants with: python -m src.media --prefix pets/
+# Store variant URLs on pet_images rows that have none: python -m src.media --pet-images
+# MEDIA_WORKERS=0 renders inline (development, tests). Counters are exposed under
+# "media_variants" at GET /metrics.
+
+import argparse
+import io
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from ..metrics import register_metrics
+from .storage import get_storage
+
+
+VARIANTS = {
+    "thumb": int(os.getenv("MEDIA_THUMB_SIZE", "320")),
+    "medium": int(os.getenv("MEDIA_MEDIUM_SIZE", "1024")),
+}
+VARIANT_QUALITY = int(os.getenv("MEDIA_VARIANT_QUALITY", "80"))
+VARIANT_EXTENSION = "webp"
+VARIANT_CONTENT_TYPE = "image/webp"
+
+# Originals Pillow can decode; anything else is stored as-is without variants.
+IMAGE_EXTENSIONS = {"jpg", "jpeg", "png", "webp", "gif", "bmp", "tif", "tiff"}
+
+MEDIA_WORKERS = int(os.getenv("MEDIA_WORKERS", "1"))
+MEDIA_QUEUE_MAX = int(os.getenv("MEDIA_QUEUE_MAX", str(max(1, MEDIA_WORKERS) * 32)))
+
+_executor: ProcessPoolExecutor | None = None
+_executor_lock = threading.Lock()
+_slots = threading.BoundedSemaphore(MEDIA_QUEUE_MAX)
+_stats = {"in_flight": 0, "completed": 0, "failed": 0, "dropped": 0}
+_stats_lock = threading.Lock()
+
+
+def _split(key: str) -> tuple[str, str]:
+    stem, _, extension = key.rpartition(".")
+    if not stem or "/" in extension:
+        return key, ""
+    return stem, extension.lower()
+
+
+def variant_key(key: str, name: str) -> str:
+    return f"{_split(key)[0]}_{name}.{VARIANT_EXTENSION}"
+
+
+def is_variant_key(key: str) -> bool:
+    stem, extension = _split(key)
+    return extension == VARIANT_EXTENSION and any(stem.endswith(f"_{name}") for name in VARIANTS)
+
+
+def has_variants(key: str) -> bool:
+    return _split(key)[1] in IMAGE_EXTENSIONS and not is_variant_key(key)
+
+
+def variant_urls(url: Optional[str]) -> Optional[dict[str, str]]:
+    # {"thumb": url, "medium": url} for an original in our storage, else None.
+    storage = get_storage()
+    key = storage.key_for_url(url)
+    if key is None or not has_variants(key):
+        return None
+    return {name: storage.url(variant_key(key, name)) for name in VARIANTS}
+
+
+def fill_variants(urls: list[str], stored: list) -> list[Optional[dict[str, str]]]:
+    # Per image: the variant URLs stored with it, else derived from its URL (rows
+    # backfilled before `python -m src.media --pet-images` ran).
+    stored = list(stored or []) + [None] * (len(urls) - len(stored or []))
+    return [variants if variants is not None else variant_urls(url) for url, variants in zip(urls, stored)]
+
+
+def render_variants(data: bytes) -> dict[str, bytes]:
+    from PIL import Image, ImageOps
+
+    with Image.open(io.BytesIO(data)) as original:
+        # Let JPEG decode at a reduced scale when the largest variant allows it.
+        largest = max(VARIANTS.values())
+        original.draft("RGB", (largest, largest))
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "RGBA"):
+            has_alpha = "A" in image.getbands() or "transparency" in image.info
+            image = image.convert("RGBA" if has_alpha else "RGB")
+
+        variants = {}
+        for name, size in VARIANTS.items():
+            resized = image.copy()
+            resized.thumbnail((size, size), Image.Resampling.LANCZOS)
+            out = io.BytesIO()
+            # No exif= argument, so no EXIF is written. The colour profile is kept.
+            resized.save(out, format="WEBP", quality=VARIANT_QUALITY, icc_profile=original.info.get("icc_profile"))
+            variants[name] = out.getvalue()
+    return variants
+
+
+def generate_variants(key: str) -> list[str]:
+    # Runs in a pool process (or inline): read the original back from storage and
+    # write each variant next to it. Returns the variant keys.
+    storage = get_storage()
+    written = []
+    for name, data in render_variants(storage.get(key)).items():
+        target = variant_key(key, name)
+        storage.put(target, io.BytesIO(data), VARIANT_CONTENT_TYPE)
+        written.append(target)
+    return written
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=MEDIA_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def _finished(key: str, future: Future) -> None:
+    _slots.release()
+    # Cancelled when the pool shuts down with jobs still queued.
+    error = None if future.cancelled() else future.exception()
+    with _stats_lock:
+        _stats["in_flight"] -= 1
+        _stats["dropped" if future.cancelled() else "failed" if error else "completed"] += 1
+    if isinstance(error, BrokenProcessPool):
+        # A pool process died (e.g. OOM-killed on a huge image); start a fresh pool next time.
+        logging.error(f"[Media] variant pool broke on {key}; restarting it")
+        shutdown(wait=False)
+    elif error:
+        logging.warning(f"[Media] could not make variants of {key}: {error}")
+
+
+def schedule_variants(key: str) -> None:
+    if not has_variants(key):
+        return
+
+    if MEDIA_WORKERS <= 0:
+        try:
+            generate_variants(key)
+        except Exception as e:
+            logging.warning(f"[Media] could not make variants of {key}: {e}")
+        return
+
+    if not _slots.acquire(blocking=False):
+        with _stats_lock:
+            _stats["dropped"] += 1
+        logging.warning(f"[Media] variant queue full; skipped {key} (regenerate with python -m src.media)")
+        return
+
+    with _stats_lock:
+        _stats["in_flight"] += 1
+    try:
+        future = _get_executor().submit(generate_variants, key)
+    except Exception:
+        _slots.release()
+        with _stats_lock:
+            _stats["in_flight"] -= 1
+            _stats["dropped"] += 1
+        logging.exception(f"[Media] could not queue variants of {key}")
+        return
+    future.add_done_callback(lambda f: _finished(key, f))
+
+
+def shutdown(wait: bool = True) -> None:
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def variants_status() -> dict:
+    with _stats_lock:
+        return {
+            "workers": MEDIA_WORKERS,
+            "queue_max": MEDIA_QUEUE_MAX,
+            **_stats,
+        }
+
+
+register_metrics("media_variants", variants_status)
+
+
+def refill_pet_images(force: bool = False, batch_size: int = 500) -> None:
+    # After the pet_images migration (which leaves variants NULL) or a change of
+    # MEDIA_PUBLIC_BASE_URL: store variant_urls() on each row, in keyset batches.
+    from ..database.core import SessionLocal
+    from ..entities.pet import PetImage
+
+    if not get_storage().base_url:
+        # Every URL would look foreign and get no variants.
+        raise RuntimeError("media storage is not configured (AWS_S3_BUCKET_NAME or MEDIA_STORAGE=local)")
+    updated = 0
+    last = None
+    with SessionLocal() as db:
+        while True:
+            query = db.query(PetImage)
+            if not force:
+                query = query.filter(PetImage.variants.is_(None))
+            if last is not None:
+                query = query.filter(PetImage.image_id > last)
+            rows = query.order_by(PetImage.image_id).limit(batch_size).all()
+            if not rows:
+                break
+            for row in rows:
+                variants = variant_urls(row.url)
+                if variants != row.variants:
+                    row.variants = variants
+                    updated += 1
+            db.commit()
+            last = rows[-1].image_id
+    logging.info(f"[Media] stored variant URLs on {updated} pet images")
+
+
+def main() -> None:
+    from ..logging import LogLevels, configure_logging
+
+    parser = argparse.ArgumentParser(description="Generate missing image variants")
+    parser.add_argument("--prefix", default="", help="only originals whose key starts with this, e.g. pets/")
+    parser.add_argument("--force", action="store_true", help="regenerate variants that already exist")
+    parser.add_argument(
+        "--pet-images", action="store_true",
+        help="instead, store variant URLs on pet_images rows without them (with --force, all rows)",
+    )
+    args = parser.parse_args()
+
+    configure_logging(LogLevels.info)
+    if args.pet_images:
+        refill_pet_images(force=args.force)
+        return
+    storage = get_storage()
+    made = failed = 0
+    for key in storage.list_keys(args.prefix):
+        if not has_variants(key):
+            continue
+        if not args.force and all(storage.exists(variant_key(key, name)) for name in VARIANTS):
+            continue
+        try:
+            generate_variants(key)
+            made += 1
+        except Exception as e:
+            failed += 1
+            logging.warning(f"[Media] could not make variants of {key}: {e}")
+    logging.info(f"[Media] generated variants for {made} originals ({failed} failed)")
+
+
+if __name__ == "__main__":
+    main()
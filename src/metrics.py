@@ -0,0 +1,25 @@
+# Process-local operational metrics, exposed as JSON at GET /metrics.
+# Each gunicorn worker reports its own numbers. Admins only (see api.py).
+
+from typing import Callable
+
+from fastapi import APIRouter
+
+from .database.core import pool_status
+
+
+router = APIRouter(tags=["metrics"])
+
+_sources: dict[str, Callable[[], dict]] = {}
+
+
+def register_metrics(name: str, source: Callable[[], dict]) -> None:
+    _sources[name] = source
+
+
+register_metrics("db_pool", pool_status)
+
+
+@router.get("/metrics")
+def get_metrics() -> dict:
+    return {name: source() for name, source in _sources.items()}
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, status, Form
-from typing import List
 from uuid import UUID
 from ..database.core import DbSession
 from ..auth.service import CurrentUser
+from ..pagination import Page, Pagination
 from . import models, service
 from .nearby_notifs import generate_nearby_notifications
 import threading
@@ -24,9 +24,9 @@ def mark_viewed(notif_id: UUID, db: DbSession, current_user: CurrentUser):
 def create_notification(db: DbSession, notif: models.NotificationCreate, current_user: CurrentUser):
     return service.create_notification(current_user, db, notif)
 
-@router.get("/", response_model=List[models.NotificationResponse])
-def get_notifications(db: DbSession, current_user: CurrentUser):
-    return service.get_notifications(current_user, db)
+@router.get("/", response_model=Page[models.NotificationResponse])
+def get_notifications(db: DbSession, current_user: CurrentUser, page: Pagination):
+    return service.get_notifications(current_user, db, page)
 
 @router.get("/{notif_id}", response_model=models.NotificationResponse)
 def get_notification(db: DbSession, notif_id: UUID, current_user: CurrentUser):
@@ -14,6 +14,7 @@ from fastapi import HTTPException
 from src.auth.models import TokenData
 # from . import models
 from src.exceptions import NotificationNotFoundError, NotificationCreationError
+from src.pagination import PageParams, paginate
 import logging
 
 def create_notification_if_not_exists(
@@ -88,8 +89,10 @@ def mark_notification_viewed(db: Session, notif_id: UUID, user_id: UUID):
     return notif
 
 
-def get_notifications(current_user: TokenData, db: Session):
-    return db.query(Notification).filter(Notification.user_id == current_user.get_uuid()).all()
+def get_notifications(current_user: TokenData, db: Session, page: PageParams):
+    query = db.query(Notification).filter(Notification.user_id == current_user.get_uuid())
+    notifs, next_cursor = paginate(query, page, Notification.timestamp, Notification.notif_id)
+    return {"items": notifs, "next_cursor": next_cursor}
 
 
 def get_notification_by_id(current_user: TokenData, db: Session, notif_id: UUID):
@@ -0,0 +1,4 @@
+from .worker import main
+
+
+main()
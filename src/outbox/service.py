@@ -0,0 +1,28 @@
+from sqlalchemy.orm import Session
+
+from ..entities.email_outbox import EmailOutbox
+from . import worker
+
+
+def enqueue_email(db: Session, to_address: str, subject: str, body_text: str, body_html: str | None = None) -> EmailOutbox:
+    # Adds the email to the caller's transaction; nothing is sent unless it commits.
+    # Call notify_worker() after the commit to deliver it without waiting for the next poll.
+    message = EmailOutbox(to_address=to_address, subject=subject, body_text=body_text, body_html=body_html)
+    db.add(message)
+    return message
+
+
+def enqueue_verification_code(db: Session, to_address: str, code: str) -> EmailOutbox:
+    body_text = f"Your verification code is: {code}\nThis code expires soon."
+    body_html = f"""
+    <html><body>
+      <p>Your verification code is:</p>
+      <h2>{code}</h2>
+      <p>This code expires soon.</p>
+    </body></html>
+    """
+    return enqueue_email(db, to_address, "Your verification code", body_text, body_html)
+
+
+def notify_worker() -> None:
+    worker.wake()
@@ -0,0 +1,81 @@
+# Email transports for the outbox worker, picked with EMAIL_TRANSPORT:
+#   ses     - Amazon SES
+#   console - log that a message was sent, without its body (default outside production)
+#   file    - append each message as a JSON line to EMAIL_FILE_PATH (tests, staging)
+# With APP_ENV=production EMAIL_TRANSPORT must be set; there is no fallback.
+# A transport raises on failure; the worker retries with backoff.
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+from ..entities.email_outbox import EmailOutbox
+from ..environment import is_production
+
+
+EMAIL_FILE_PATH = Path(os.getenv("EMAIL_FILE_PATH", "outbox_emails.jsonl"))
+
+
+class EmailTransport:
+    name = "base"
+
+    def send(self, message: EmailOutbox) -> None:
+        raise NotImplementedError
+
+
+class SesTransport(EmailTransport):
+    name = "ses"
+
+    def send(self, message: EmailOutbox) -> None:
+        from ..utils.ses_service import send_email
+
+        send_email(message.to_address, message.subject, message.body_text, message.body_html)
+
+
+class ConsoleTransport(EmailTransport):
+    name = "console"
+
+    def send(self, message: EmailOutbox) -> None:
+        # Bodies carry verification codes; they never go to the logs.
+        logging.info(f"[Email] {message.id} to={message.to_address} subject={message.subject!r}")
+
+
+class FileTransport(EmailTransport):
+    name = "file"
+
+    def __init__(self, path: Path = EMAIL_FILE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def send(self, message: EmailOutbox) -> None:
+        line = json.dumps({
+            "id": str(message.id),
+            "to": message.to_address,
+            "subject": message.subject,
+            "text": message.body_text,
+            "html": message.body_html,
+            "sent_at": datetime.now(timezone.utc).isoformat(),
+        })
+        with self._lock, self.path.open("a") as f:
+            f.write(line + "\n")
+
+
+TRANSPORTS = {
+    SesTransport.name: SesTransport,
+    ConsoleTransport.name: ConsoleTransport,
+    FileTransport.name: FileTransport,
+}
+
+
+def get_transport(name: str | None = None) -> EmailTransport:
+    name = name or os.getenv("EMAIL_TRANSPORT")
+    if not name:
+        if is_production():
+            raise RuntimeError(f"EMAIL_TRANSPORT is not set; expected one of {', '.join(TRANSPORTS)}")
+        name = ConsoleTransport.name
+    if name not in TRANSPORTS:
+        raise ValueError(f"Unknown EMAIL_TRANSPORT {name!r}; expected one of {', '.join(TRANSPORTS)}")
+    return TRANSPORTS[name]()
@@ -0,0 +1,179 @@
+# Outbox delivery: sends queued emails (src/entities/email_outbox.py) in batches.
+#
+# Each API worker process runs one sender thread (EMAIL_OUTBOX_WORKER=true, the
+# default); it can also run on its own:
+#   python -m src.outbox              # loop until interrupted
+#   python -m src.outbox --once       # deliver one batch and exit
+#   python -m src.outbox --prune      # delete sent emails older than EMAIL_OUTBOX_RETENTION_DAYS
+#
+# A batch is claimed with SELECT ... FOR UPDATE SKIP LOCKED on Postgres, so several
+# senders never pick the same row. A failed send is retried after
+# EMAIL_RETRY_BASE_SECONDS * 2^(attempts - 1), capped at EMAIL_RETRY_MAX_SECONDS,
+# and marked failed after EMAIL_MAX_ATTEMPTS. Delivery is at-least-once: a crash
+# between the send and the commit sends that email again.
+#
+# Bodies hold verification codes, so they are cleared as soon as a row is sent or
+# given up on; only the envelope (recipient, subject, status) stays until pruning.
+
+import argparse
+import logging
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+
+from ..entities.email_outbox import EmailOutbox, OUTBOX_FAILED, OUTBOX_PENDING, OUTBOX_SENT
+from ..metrics import register_metrics
+from .transports import EmailTransport, get_transport
+
+
+EMAIL_OUTBOX_WORKER = os.getenv("EMAIL_OUTBOX_WORKER", "true").strip().lower() in {"1", "true", "yes", "on"}
+EMAIL_BATCH_SIZE = int(os.getenv("EMAIL_BATCH_SIZE", "50"))
+EMAIL_POLL_SECONDS = float(os.getenv("EMAIL_POLL_SECONDS", "5"))
+EMAIL_MAX_ATTEMPTS = int(os.getenv("EMAIL_MAX_ATTEMPTS", "8"))
+EMAIL_RETRY_BASE_SECONDS = float(os.getenv("EMAIL_RETRY_BASE_SECONDS", "10"))
+EMAIL_RETRY_MAX_SECONDS = float(os.getenv("EMAIL_RETRY_MAX_SECONDS", "3600"))
+EMAIL_OUTBOX_RETENTION_DAYS = int(os.getenv("EMAIL_OUTBOX_RETENTION_DAYS", "7"))
+
+_wake = threading.Event()
+_stop = threading.Event()
+_thread: threading.Thread | None = None
+_stats = {"sent": 0, "retried": 0, "failed": 0}
+
+
+def _utcnow() -> datetime:
+    # Timestamps are stored as naive UTC (DateTime columns without time zone).
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def retry_delay(attempts: int) -> timedelta:
+    return timedelta(seconds=min(EMAIL_RETRY_BASE_SECONDS * 2 ** (attempts - 1), EMAIL_RETRY_MAX_SECONDS))
+
+
+def _clear_body(message: EmailOutbox) -> None:
+    message.body_text = ""
+    message.body_html = None
+
+
+def deliver_batch(db: Session, transport: EmailTransport, batch_size: int = EMAIL_BATCH_SIZE) -> int:
+    # Send up to batch_size due emails; returns how many were attempted.
+    now = _utcnow()
+    messages = (
+        db.query(EmailOutbox)
+        .filter(EmailOutbox.status == OUTBOX_PENDING, EmailOutbox.next_attempt_at <= now)
+        .order_by(EmailOutbox.next_attempt_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    for message in messages:
+        message.attempts += 1
+        try:
+            transport.send(message)
+        except Exception as e:
+            message.last_error = str(e)[:1000]
+            if message.attempts >= EMAIL_MAX_ATTEMPTS:
+                message.status = OUTBOX_FAILED
+                _clear_body(message)
+                _stats["failed"] += 1
+                logging.error(f"[Outbox] giving up on email {message.id} to {message.to_address}: {e}")
+            else:
+                message.next_attempt_at = now + retry_delay(message.attempts)
+                _stats["retried"] += 1
+                logging.warning(f"[Outbox] email {message.id} failed (attempt {message.attempts}), retrying: {e}")
+        else:
+            message.status = OUTBOX_SENT
+            message.sent_at = _utcnow()
+            message.last_error = None
+            _clear_body(message)
+            _stats["sent"] += 1
+    db.commit()
+    return len(messages)
+
+
+def prune_sent(db: Session, retention_days: int = EMAIL_OUTBOX_RETENTION_DAYS) -> int:
+    cutoff = _utcnow() - timedelta(days=retention_days)
+    deleted = (
+        db.query(EmailOutbox)
+        .filter(EmailOutbox.status == OUTBOX_SENT, EmailOutbox.sent_at < cutoff)
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return deleted
+
+
+def outbox_status() -> dict:
+    return {"worker_running": _thread is not None and _thread.is_alive(), **_stats}
+
+
+def run(transport: EmailTransport, stop: threading.Event) -> None:
+    from ..database.core import SessionLocal
+
+    while not stop.is_set():
+        _wake.clear()
+        try:
+            with SessionLocal() as db:
+                attempted = deliver_batch(db, transport)
+        except Exception as e:
+            logging.error(f"[Outbox] delivery loop error: {e}")
+            attempted = 0
+        if attempted < EMAIL_BATCH_SIZE:
+            # Caught up: sleep until the poll interval passes or a request enqueues mail.
+            _wake.wait(EMAIL_POLL_SECONDS)
+
+
+def wake() -> None:
+    _wake.set()
+
+
+def start_worker() -> None:
+    global _thread
+    if not EMAIL_OUTBOX_WORKER or _thread is not None:
+        return
+    transport = get_transport()
+    _stop.clear()
+    _thread = threading.Thread(target=run, args=(transport, _stop), name="email-outbox", daemon=True)
+    _thread.start()
+    logging.info(f"[Outbox] email sender started ({transport.name} transport)")
+
+
+def stop_worker(timeout: float = 5) -> None:
+    global _thread
+    if _thread is None:
+        return
+    _stop.set()
+    _wake.set()
+    _thread.join(timeout)
+    _thread = None
+
+
+register_metrics("email_outbox", outbox_status)
+
+
+def main() -> None:
+    from ..database.core import SessionLocal
+    from ..logging import LogLevels, configure_logging
+
+    parser = argparse.ArgumentParser(description="Email outbox sender")
+    parser.add_argument("--once", action="store_true", help="deliver one batch and exit")
+    parser.add_argument("--prune", action="store_true", help="delete sent emails past EMAIL_OUTBOX_RETENTION_DAYS and exit")
+    parser.add_argument("--transport", help="override EMAIL_TRANSPORT (ses, console, file)")
+    args = parser.parse_args()
+
+    configure_logging(LogLevels.info)
+    if args.prune:
+        with SessionLocal() as db:
+            logging.info(f"[Outbox] pruned {prune_sent(db)} sent emails older than {EMAIL_OUTBOX_RETENTION_DAYS} days")
+        return
+
+    transport = get_transport(args.transport)
+    if args.once:
+        with SessionLocal() as db:
+            logging.info(f"[Outbox] attempted {deliver_batch(db, transport)} emails")
+        return
+
+    try:
+        run(transport, _stop)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,114 @@
+import base64
+import binascii
+import json
+import os
+import uuid
+from datetime import datetime
+from typing import Annotated, Any, Generic, List, Optional, TypeVar
+
+from fastapi import Depends, Query
+from pydantic import BaseModel, Field
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query as OrmQuery
+
+from .exceptions import InvalidCursorError
+
+
+DEFAULT_PAGE_SIZE = int(os.getenv("PAGE_SIZE_DEFAULT", "20"))
+MAX_PAGE_SIZE = int(os.getenv("PAGE_SIZE_MAX", "100"))
+
+T = TypeVar("T")
+
+
+class PageParams(BaseModel):
+    cursor: Optional[str] = None
+    limit: int = Field(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+
+
+class Page(BaseModel, Generic[T]):
+    # Consistent envelope for every paginated list route.
+    # next_cursor is None on the last page.
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+def get_page_params(
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+) -> PageParams:
+    return PageParams(cursor=cursor, limit=limit)
+
+
+Pagination = Annotated[PageParams, Depends(get_page_params)]
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if hasattr(value, "value"):  # enums
+        return value.value
+    return value
+
+
+def _from_json(column, raw: Any) -> Any:
+    if raw is None:
+        return None
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(raw)
+    if python_type is uuid.UUID:
+        return uuid.UUID(raw)
+    return python_type(raw)
+
+
+def encode_cursor(values: list) -> str:
+    payload = json.dumps([_to_json(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: tuple) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(raw, list) or len(raw) != len(columns):
+            raise ValueError("cursor does not match sort key")
+        return [_from_json(col, value) for col, value in zip(columns, raw)]
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise InvalidCursorError() from e
+
+
+def seek_condition(columns: tuple, values: list, descending: bool):
+    # Row-value comparison (a, b) < (x, y) expanded into
+    # a < x OR (a = x AND b < y), which works on every dialect.
+    clauses = []
+    for i, column in enumerate(columns):
+        equal_prefix = [columns[j] == values[j] for j in range(i)]
+        step = column < values[i] if descending else column > values[i]
+        clauses.append(and_(*equal_prefix, step))
+    return or_(*clauses)
+
+
+def paginate(query: OrmQuery, page: PageParams, *columns, descending: bool = True) -> tuple[list, Optional[str]]:
+
+    # Keyset (seek) pagination over `columns`, which must form a unique sort key
+    # (e.g. created_at + primary key). Returns the page rows and the cursor for
+    # the next page, or None when there are no more rows.
+    # Primary keys are UUIDv7 (see database/ids.py), so the key alone is a valid
+    # time-ordered sort key for rows created since the switch: paginate(q, page, Model.id)
+
+    if page.cursor:
+        values = decode_cursor(page.cursor, columns)
+        query = query.filter(seek_condition(columns, values, descending))
+
+    order = [c.desc() if descending else c.asc() for c in columns]
+    rows = query.order_by(*order).limit(page.limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > page.limit:
+        rows = rows[:page.limit]
+        last = rows[-1]
+        next_cursor = encode_cursor([getattr(last, c.key) for c in columns])
+
+    return rows, next_cursor
@@ -1,11 +1,14 @@
-from fastapi import APIRouter, status
-from typing import List
+from fastapi import APIRouter, Query, status
+from typing import List, Optional
 from uuid import UUID
 
 from ..database.core import DbSession
 from . import models
 from . import service
 from ..auth.service import CurrentUser
+from ..entities.pet import PetActivityLevelEnum, PetGender, PetSizeEnum, PetTemperamentEnum, PetType
+from ..pagination import Page, Pagination
+from ..sync import ChangeSet, Sync
 from src.utils.s3_service import upload_image_to_s3
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
@@ -28,6 +31,32 @@ def get_pets(db: DbSession, current_user: CurrentUser):
     return service.get_pets(current_user, db)
 
 
+@router.get("/changes", response_model=ChangeSet[models.PetResponse])
+def get_pet_changes(db: DbSession, current_user: CurrentUser, sync: Sync):
+    #Delta sync of the current user's pets (see src/sync.py).
+    return service.get_pet_changes(current_user, db, sync)
+
+
+@router.get("/browse", response_model=Page[models.PetResponse])
+def browse_pets(
+    db: DbSession,
+    page: Pagination,
+    species: Optional[PetType] = Query(None),
+    size: Optional[PetSizeEnum] = Query(None),
+    temperament: Optional[PetTemperamentEnum] = Query(None),
+    activity_level: Optional[PetActivityLevelEnum] = Query(None),
+    gender: Optional[PetGender] = Query(None),
+    min_age: Optional[int] = Query(None, ge=0, description="Minimum age in months"),
+    max_age: Optional[int] = Query(None, ge=0, description="Maximum age in months"),
+):
+    #Public listing of pets up for adoption, newest first.
+    filters = models.PetBrowseFilters(
+        species=species, size=size, temperament=temperament, activity_level=activity_level,
+        gender=gender, min_age=min_age, max_age=max_age,
+    )
+    return service.browse_pets(db, filters, page)
+
+
 @router.get("/{pet_id}", response_model=models.PetResponse)
 def get_pet(db: DbSession, pet_id: UUID, current_user: CurrentUser):
     #Get a single pet by ID.
@@ -59,7 +88,7 @@ def upload_pet_image(pet_id: UUID, db: DbSession, current_user: CurrentUser, fil
 
     file_url = upload_image_to_s3(file, folder="pet_images")
 
-    pet.images = pet.images + [file_url] if pet.images else [file_url]
+    service.add_pet_image(db, pet, file_url)
     db.commit()
     db.refresh(pet)
 
@@ -1,8 +1,9 @@
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from src.media.variants import fill_variants
 from src.entities.pet import (
     PetType,
     PetGender,
@@ -70,5 +71,25 @@ class PetResponse(PetBase):
     created_at: datetime
     updated_at: datetime
     # images already present in PetBase
+    # thumb/medium URLs for each entry of images (None where there are none),
+    # stored with each image (see entities/pet_image.py).
+    image_variants: List[Optional[Dict[str, str]]] = Field(default_factory=list)
 
     model_config = ConfigDict(from_attributes=True, use_enum_values=True)
+
+    @model_validator(mode="after")
+    def _derive_missing_variants(self):
+        self.image_variants = fill_variants(self.images, self.image_variants)
+        return self
+
+
+# Filters for the public GET /pets/browse listing
+
+class PetBrowseFilters(BaseModel):
+    species: Optional[PetType] = None
+    size: Optional[PetSizeEnum] = None
+    temperament: Optional[PetTemperamentEnum] = None
+    activity_level: Optional[PetActivityLevelEnum] = None
+    gender: Optional[PetGender] = None
+    min_age: Optional[int] = Field(None, ge=0)  # in months, inclusive
+    max_age: Optional[int] = Field(None, ge=0)
@@ -1,19 +1,25 @@
 from datetime import datetime, timezone
 from uuid import UUID
+from sqlalchemy import false, func, select
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from . import models
 from src.auth.models import TokenData
 from src.entities.pet import Pet
-from src.exceptions import PetCreationError, PetNotFoundError
+from src.entities.pet_image import PetImage
+from src.media.variants import variant_urls
+from src.exceptions import InvalidAgeRangeError, PetCreationError, PetNotFoundError
+from src.pagination import PageParams, paginate
+from src.sync import SyncParams, changes_since
 import logging
 
 
 def create_pet(current_user: TokenData, db: Session, pet: models.PetCreate) -> Pet:
     #Create a new pet for the current user.
     try:
-        new_pet = Pet(**pet.model_dump())
+        new_pet = Pet(**pet.model_dump(exclude={"images"}))
         new_pet.user_id = current_user.get_uuid()
+        set_pet_images(new_pet, pet.images)
         db.add(new_pet)
         db.commit()
         db.refresh(new_pet)
@@ -31,6 +37,32 @@ def get_pets(current_user: TokenData, db: Session) -> list[models.PetResponse]:
     return pets
 
 
+def browse_pets(db: Session, filters: models.PetBrowseFilters, page: PageParams) -> dict:
+    #Public listing of pets still up for adoption, newest first.
+    # `is_adopted == false()` must stay literal so the planner can match the partial
+    # browse indexes in entities/pet.py; (created_at, pet_id) is the sort and cursor key.
+    if filters.min_age is not None and filters.max_age is not None and filters.min_age > filters.max_age:
+        raise InvalidAgeRangeError(filters.min_age, filters.max_age)
+    query = db.query(Pet).filter(Pet.is_adopted == false())
+    for column in ("species", "size", "temperament", "activity_level", "gender"):
+        value = getattr(filters, column)
+        if value is not None:
+            query = query.filter(getattr(Pet, column) == value)
+    if filters.min_age is not None:
+        query = query.filter(Pet.age >= filters.min_age)
+    if filters.max_age is not None:
+        query = query.filter(Pet.age <= filters.max_age)
+    pets, next_cursor = paginate(query, page, Pet.created_at, Pet.pet_id)
+    return {"items": pets, "next_cursor": next_cursor}
+
+
+def get_pet_changes(current_user: TokenData, db: Session, params: SyncParams) -> dict:
+    #Pets of the current user created, updated or deleted since the sync cursor.
+    owner_id = current_user.get_uuid()
+    query = db.query(Pet).filter(Pet.user_id == owner_id)
+    return changes_since(query, params, Pet.updated_at, Pet.pet_id, owner_id=owner_id)
+
+
 def get_pet_by_id(current_user: TokenData, db: Session, pet_id: UUID) -> Pet:
     #Retrieve a single pet by ID.
     pet = db.query(Pet).filter(Pet.pet_id == pet_id).filter(Pet.user_id == current_user.get_uuid()).first()
@@ -44,12 +76,50 @@ def get_pet_by_id(current_user: TokenData, db: Session, pet_id: UUID) -> Pet:
 def update_pet(current_user: TokenData, db: Session, pet_id: UUID, pet_update: models.PetUpdate) -> Pet:
     #Update an existing pet’s details.
     pet_data = pet_update.model_dump(exclude_unset=True)
-    db.query(Pet).filter(Pet.pet_id == pet_id).filter(Pet.user_id == current_user.get_uuid()).update(pet_data)
+    # images live in their own table; null clears them like []
+    replace_images = "images" in pet_data
+    images = pet_data.pop("images", None) or []
+    if pet_data:
+        db.query(Pet).filter(Pet.pet_id == pet_id).filter(Pet.user_id == current_user.get_uuid()).update(pet_data)
+    if replace_images:
+        pet = get_pet_by_id(current_user, db, pet_id)
+        set_pet_images(pet, images)
+        pet.updated_at = datetime.now(timezone.utc)
     db.commit()
     logging.info(f"Successfully updated pet {pet_id} for user {current_user.get_uuid()}")
     return get_pet_by_id(current_user, db, pet_id)
 
 
+def set_pet_images(pet: Pet, urls: list[str]) -> None:
+    #Replace a pet's photo list (create, or PUT with images). Rows of URLs that stay
+    # are kept and renumbered; the rest are deleted with the pet's next flush.
+    existing: dict[str, list[PetImage]] = {}
+    for image in pet.image_rows:
+        existing.setdefault(image.url, []).append(image)
+    rows = []
+    for position, url in enumerate(urls):
+        image = existing[url].pop(0) if existing.get(url) else PetImage(url=url, variants=variant_urls(url))
+        image.position = position
+        rows.append(image)
+    pet.image_rows = rows
+
+
+def add_pet_image(db: Session, pet: Pet, url: str) -> bool:
+    #Append one photo to a pet (uploads). This only inserts a row, with the next
+    # position computed by the INSERT itself, so concurrent uploads to the same pet
+    # each keep their photo. Adding a URL the pet already has does nothing (returns False).
+    if db.query(PetImage.image_id).filter(PetImage.pet_id == pet.pet_id, PetImage.url == url).first():
+        return False
+    next_position = (
+        select(func.coalesce(func.max(PetImage.position) + 1, 0))
+        .where(PetImage.pet_id == pet.pet_id)
+        .scalar_subquery()
+    )
+    db.add(PetImage(pet_id=pet.pet_id, position=next_position, url=url, variants=variant_urls(url)))
+    pet.updated_at = datetime.now(timezone.utc)
+    return True
+
+
 def adopt_pet(current_user: TokenData, db: Session, pet_id: UUID) -> Pet:
     #Mark a pet as adopted
     pet = get_pet_by_id(current_user, db, pet_id)
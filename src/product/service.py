@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from ..entities.product import Product
 from .models import ProductCreate
+from ..pagination import PageParams, paginate
 from uuid import UUID
 from fastapi import HTTPException, status
 
@@ -17,8 +18,10 @@ def create_product(db: Session, product_in: ProductCreate) -> Product:
 
 
 
-def list_products(db: Session):
-    return db.query(Product).filter(Product.is_active == True).all()
+def list_products(db: Session, page: PageParams):
+    query = db.query(Product).filter(Product.is_active == True)
+    products, next_cursor = paginate(query, page, Product.created_at, Product.id)
+    return {"items": products, "next_cursor": next_cursor}
 
 
 
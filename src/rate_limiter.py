@@ -1,5 +1,216 @@
+# Shared rate limiting for the @limiter.limit routes.
+#
+# Counters live in RATE_LIMIT_STORAGE_URI, so every gunicorn worker and ECS task
+# enforces the same limit:
+#   memory://             in-process (default; per worker, for development and tests)
+#   redis://host:6379/0   Redis or any Redis-protocol server
+#   database://           the app's own database, in the rate_limit_windows table
+# With APP_ENV=production the app refuses to start on memory://, since every worker
+# and task would then enforce its own limit.
+#
+# The default sliding-window-counter strategy weights the previous window's count
+# by how much of it still overlaps the sliding window, so a burst cannot double up
+# across a fixed window boundary. Each check is one round trip: a Lua script on
+# Redis, and a single upsert statement on the database.
+#
+# If the shared store is unreachable, checks fall back to in-memory limits rather
+# than failing the request.
+#
+# Limits are keyed by client IP. Behind the ALB every request comes from the load
+# balancer, so when the peer is in TRUSTED_PROXY_IPS (comma-separated addresses or
+# CIDRs, e.g. the VPC CIDR) the client is the last X-Forwarded-For hop that is not a
+# trusted proxy. Earlier hops are whatever the client sent, so they are never used.
+
+import ipaddress
+import os
+import time
+from itertools import count
+
+from fastapi import Request
+from limits.storage import SlidingWindowCounterSupport, Storage
+from limits.storage.base import TimestampedSlidingWindow
 from slowapi import Limiter
 from slowapi.util import get_remote_address
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from .environment import is_production
+
+
+RATE_LIMIT_STORAGE_URI = os.getenv("RATE_LIMIT_STORAGE_URI", "memory://")
+RATE_LIMIT_STRATEGY = os.getenv("RATE_LIMIT_STRATEGY", "sliding-window-counter")
+
+
+def _parse_networks(value: str) -> tuple[list, list[str]]:
+    # (valid networks, invalid entries); invalid ones are reported by check_config().
+    networks, invalid = [], []
+    for entry in (e.strip() for e in value.split(",")):
+        if not entry:
+            continue
+        try:
+            networks.append(ipaddress.ip_network(entry, strict=False))
+        except ValueError:
+            invalid.append(entry)
+    return networks, invalid
+
+
+TRUSTED_PROXY_IPS, _INVALID_PROXY_IPS = _parse_networks(os.getenv("TRUSTED_PROXY_IPS", ""))
+
+# Expired windows are deleted on every Nth acquire, per process.
+_PRUNE_EVERY = 1000
+
+
+class DatabaseStorage(Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow):
+    # limits storage on the app database (Postgres, or SQLite in tests). Every call is a
+    # single autocommit statement; concurrent hits are serialized by the row lock that
+    # ON CONFLICT DO UPDATE takes on the window's row.
+
+    STORAGE_SCHEME = ["database"]
+
+    def __init__(self, uri: str | None = None, wrap_exceptions: bool = False, **options):
+        from .database.core import engine
+
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self.engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+        self._calls = count(1)
+
+    @property
+    def base_exceptions(self):
+        return SQLAlchemyError
+
+    def _execute(self, sql: str, **params):
+        with self.engine.connect() as conn:
+            result = conn.execute(text(sql), params)
+            return result.all() if result.returns_rows else []
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        now = time.time()
+        rows = self._execute(
+            "INSERT INTO rate_limit_windows (key, count, expires_at) VALUES (:key, :amount, :expires_at) "
+            "ON CONFLICT (key) DO UPDATE SET "
+            "count = CASE WHEN rate_limit_windows.expires_at <= :now THEN excluded.count "
+            "ELSE rate_limit_windows.count + excluded.count END, "
+            "expires_at = CASE WHEN rate_limit_windows.expires_at <= :now THEN excluded.expires_at "
+            "ELSE rate_limit_windows.expires_at END "
+            "RETURNING count",
+            key=key, amount=amount, expires_at=now + expiry, now=now,
+        )
+        return rows[0][0]
+
+    def get(self, key: str) -> int:
+        rows = self._execute(
+            "SELECT count FROM rate_limit_windows WHERE key = :key AND expires_at > :now",
+            key=key, now=time.time(),
+        )
+        return rows[0][0] if rows else 0
+
+    def get_expiry(self, key: str) -> float:
+        now = time.time()
+        rows = self._execute(
+            "SELECT expires_at FROM rate_limit_windows WHERE key = :key AND expires_at > :now",
+            key=key, now=now,
+        )
+        return rows[0][0] if rows else now
+
+    def check(self) -> bool:
+        try:
+            self._execute("SELECT 1")
+            return True
+        except SQLAlchemyError:
+            return False
+
+    def reset(self) -> int | None:
+        with self.engine.connect() as conn:
+            return conn.execute(text("DELETE FROM rate_limit_windows")).rowcount
+
+    def clear(self, key: str) -> None:
+        self._execute("DELETE FROM rate_limit_windows WHERE key = :key", key=key)
+
+    def _window_weight(self, expiry: int, now: float) -> float:
+        # Share of the previous window still inside the sliding window.
+        return 1 - (((now - expiry) / expiry) % 1)
+
+    def acquire_sliding_window_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        if amount > limit:
+            return False
+        now = time.time()
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        if next(self._calls) % _PRUNE_EVERY == 0:
+            self._execute("DELETE FROM rate_limit_windows WHERE expires_at < :now", now=now)
+
+        # floor(weighted + amount) <= limit, written as weighted < limit - amount + 1.
+        # The ON CONFLICT branch re-checks against the locked current row, so two racing
+        # hits cannot both take the last slot. No row back means the hit was refused.
+        rows = self._execute(
+            "INSERT INTO rate_limit_windows (key, count, expires_at) "
+            "SELECT :current_key, :amount, :expires_at "
+            "WHERE COALESCE((SELECT p.count FROM rate_limit_windows p "
+            "WHERE p.key = :previous_key AND p.expires_at > :now), 0) * :weight < :limit - :amount + 1 "
+            "ON CONFLICT (key) DO UPDATE SET count = rate_limit_windows.count + excluded.count "
+            "WHERE COALESCE((SELECT p.count FROM rate_limit_windows p "
+            "WHERE p.key = :previous_key AND p.expires_at > :now), 0) * :weight "
+            "+ rate_limit_windows.count < :limit - :amount + 1 "
+            "RETURNING count",
+            current_key=current_key, previous_key=previous_key, amount=amount, limit=limit,
+            weight=self._window_weight(expiry, now), expires_at=now + 2 * expiry, now=now,
+        )
+        return bool(rows)
+
+    def get_sliding_window(self, key: str, expiry: int) -> tuple[int, float, int, float]:
+        now = time.time()
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        rows = dict(self._execute(
+            "SELECT key, count FROM rate_limit_windows WHERE key IN (:previous_key, :current_key) AND expires_at > :now",
+            previous_key=previous_key, current_key=current_key, now=now,
+        ))
+        previous_count, current_count = rows.get(previous_key, 0), rows.get(current_key, 0)
+        previous_ttl = self._window_weight(expiry, now) * expiry if previous_count else 0.0
+        current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+        return previous_count, previous_ttl, current_count, current_ttl
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        previous_key, current_key = self.sliding_window_keys(key, expiry, time.time())
+        self.clear(previous_key)
+        self.clear(current_key)
+
+
+def _is_trusted_proxy(host: str) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in TRUSTED_PROXY_IPS)
+
+
+def client_address(request: Request) -> str:
+    peer = get_remote_address(request)
+    if not _is_trusted_proxy(peer):
+        return peer
+    hops = [hop.strip() for hop in request.headers.get("x-forwarded-for", "").split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not _is_trusted_proxy(hop):
+            return hop
+    # Only proxies in the chain (e.g. an internal health check): fall back to the first.
+    return hops[0] if hops else peer
+
+
+def check_config() -> None:
+    # Called at startup (src/main.py), so a bad deploy fails loudly instead of limiting per worker.
+    if _INVALID_PROXY_IPS:
+        raise RuntimeError(
+            f"TRUSTED_PROXY_IPS has invalid entries {', '.join(map(repr, _INVALID_PROXY_IPS))}; "
+            "expected comma-separated IP addresses or CIDRs such as 10.0.0.0/16"
+        )
+    if is_production() and RATE_LIMIT_STORAGE_URI.startswith("memory://"):
+        raise RuntimeError(
+            "RATE_LIMIT_STORAGE_URI is memory:// with APP_ENV=production; "
+            "set it to a shared store (database:// or redis://host:6379/0)"
+        )
 
 
-limiter = Limiter(key_func=get_remote_address)
\ No newline at end of file
+limiter = Limiter(
+    key_func=client_address,
+    storage_uri=RATE_LIMIT_STORAGE_URI,
+    strategy=RATE_LIMIT_STRATEGY,
+    in_memory_fallback_enabled=RATE_LIMIT_STORAGE_URI != "memory://",
+)
@@ -1,12 +1,11 @@
 
 
 from typing import Any, Dict
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from ..database.core import get_db
-from ..auth.service import CurrentUser
-from ..entities.user import User
+from ..auth.service import CurrentUserLoader
 from .service import get_recommended_pets
 from ..recommender.models import PetResponse
 
@@ -15,33 +14,19 @@ router = APIRouter(prefix="/recommend", tags=["Recommendation"])
 
 @router.get("/", response_model=Dict[str, Any])
 def recommend_pets_for_user(
-    current_user: CurrentUser,
+    me: CurrentUserLoader,
     top_k: int = 5,
     db: Session = Depends(get_db),
 ):
-    # 1Get UUID from token
-    user_uuid = current_user.get_uuid()
-    if user_uuid is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or missing user in token",
-        )
-
-    # Confirm user exists in DB
-    user = db.query(User).filter(User.id == user_uuid).first()
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"User not found with ID: {user_uuid}",
-        )
-
-    # Use UUID when calling service
+    # Loads the caller once (401 / 404 if the token's user is missing); the service reuses it
+    user = me.user
+
     try:
-        results = get_recommended_pets(db, user_uuid, top_k)
+        results = get_recommended_pets(db, user, top_k)
         pet_list = [PetResponse(**pet) for pet in results]
 
         return {
-            "user_id": str(user_uuid),
+            "user_id": str(user.id),
             "recommendations": pet_list,
         }
     except Exception as e:
@@ -4,12 +4,7 @@ from ..entities.user import User
 from ..entities.pet import Pet
 from ..recommender.model import recommend
 
-def get_recommended_pets(db: Session, user_id: str, top_k: int = 5):
-    # Fetch user
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise Exception("User not found")
-
+def get_recommended_pets(db: Session, user: User, top_k: int = 5):
     # Build preference dictionary
     pref = {
         "preferred_species": user.preferred_species.value if user.preferred_species else None,
@@ -23,7 +18,7 @@ def get_recommended_pets(db: Session, user_id: str, top_k: int = 5):
     pets = (
     db.query(Pet)
     .filter(Pet.is_adopted == False)
-    .filter(Pet.user_id != user_id)  # exclude my own pets
+    .filter(Pet.user_id != user.id)  # exclude my own pets
     .all()
 )
     pets_in_db = []
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, status, UploadFile, File, Depends, HTTPException
+from fastapi import APIRouter, status, UploadFile, File, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from typing import List
 from uuid import UUID
 
@@ -6,6 +7,11 @@ from ..database.core import DbSession
 from . import models
 from . import service
 from ..auth.service import CurrentUser
+from ..pagination import Page, Pagination
+from ..responses import ORJSONResponse
+from ..sync import ChangeSet, Sync
+from ..fields import Fields
+from ..streaming import StreamFormat
 from src.utils.s3_service import upload_image_to_s3
 
 router = APIRouter(
@@ -36,12 +42,29 @@ def create_rescue_report(db: DbSession, rescue_report: models.RescueReportCreate
     return service.create_rescue_report(current_user, db, rescue_report)
 
 
-@router.get("/", response_model=List[models.RescueReportResponse])
-def get_rescue_reports(db: DbSession, current_user: CurrentUser):
+@router.get("/", response_model=Page[models.RescueReportResponse], response_class=ORJSONResponse)
+def get_rescue_reports(db: DbSession, current_user: CurrentUser, page: Pagination, fields: Fields):
     
-    #Get all rescue reports created by the current user.
+    #Get a page of rescue reports, newest first.
+    # Service output is already shaped like the response model; skip revalidation.
     
-    return service.get_rescue_reports(current_user, db)
+    return ORJSONResponse(service.get_rescue_reports(current_user, db, page, fields))
+
+
+@router.get("/changes", response_model=ChangeSet[models.RescueReportResponse])
+def get_rescue_report_changes(db: DbSession, current_user: CurrentUser, sync: Sync):
+    
+    # Delta sync: reports created, updated or deleted since the cursor (see src/sync.py).
+    
+    return service.get_rescue_report_changes(current_user, db, sync)
+
+
+@router.get("/stream", response_class=StreamingResponse)
+def stream_rescue_reports(current_user: CurrentUser, fields: Fields, format: StreamFormat = Query(StreamFormat.json)):
+    
+    # Every rescue report in one response, written incrementally (see src/streaming.py).
+    
+    return service.stream_rescue_reports(current_user, format, fields)
 
 
 @router.get("/{report_id}", response_model=models.RescueReportResponse)
@@ -77,7 +100,7 @@ def get_rescue_report_by_chat(chat_id: UUID, db: DbSession, current_user: Curren
     return service.get_rescue_report_by_chat(current_user, db, chat_id)
 
 @router.post("/upload-s3")
-async def upload_rescue_image(
+def upload_rescue_image(
     file: UploadFile,
     current_user: CurrentUser  
 ):
@@ -89,6 +112,8 @@ async def upload_rescue_image(
         # Store rescue photos under 'rescues/' folder 
         url = upload_image_to_s3(file, folder="rescues")
         return {"url": url}
+    except HTTPException:
+        raise
     except Exception as e:
         import logging
         logging.error(f"Rescue image upload failed: {e}")
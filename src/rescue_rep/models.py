@@ -1,7 +1,8 @@
 
-from pydantic import BaseModel
+from pydantic import BaseModel, computed_field
 from uuid import UUID
-from typing import Optional
+from typing import Dict, Optional
+from src.media.variants import variant_urls
 
 class RescueReportBase(BaseModel):
     location: str
@@ -30,6 +31,11 @@ class RescueReportResponse(RescueReportBase):
     userLastName: Optional[str] = None
     userFullName: Optional[str] = None  # Optional combined full name
 
+    @computed_field
+    @property
+    def photo_variants(self) -> Optional[Dict[str, str]]:
+        # thumb/medium URLs for photo, when it is one of our uploads
+        return variant_urls(self.photo)
 
     class Config:
         orm_mode = True
@@ -1,12 +1,14 @@
 
 
-from uuid import uuid4, UUID
+from uuid import UUID
 from datetime import datetime, timezone
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from . import models
 from src.auth.models import TokenData
 from src.entities.rescue_rep import RescueReport, RescueStatusEnum
+from src.media.variants import variant_urls
+from src.database.ids import uuid7
 from src.entities.chat import Chat, ChatTypeEnum, ChatMember
 from src.exceptions import (
     RescueReportCreationError,
@@ -14,6 +16,11 @@ from src.exceptions import (
     AuthorizationError
 )
 from sqlalchemy.orm import joinedload
+from src.pagination import PageParams, paginate
+from src.sync import SyncParams, changes_since
+from src.fields import FieldMap, check_fields, load_options, project
+from src.streaming import StreamFormat, stream_query
+from src.entities.user import User
 from sqlalchemy import func
 from src.entities.chat import ChatMessage
 from src.entities.leaderboard import LeaderboardUser
@@ -30,7 +37,7 @@ def create_rescue_report(
 ) -> models.RescueReportResponse:
     try:
         new_report = RescueReport(**rescue_report.model_dump(exclude={"chat_id"}))
-        new_report.report_id = uuid4()
+        new_report.report_id = uuid7()
         new_report.user_id = current_user.get_uuid()
         new_report.created_at = datetime.now(timezone.utc)
         new_report.updated_at = datetime.now(timezone.utc)
@@ -117,29 +124,62 @@ def get_rescue_report_by_id(
 
 
 
-def get_rescue_reports(current_user, db: Session):
-    # Fetch all rescue reports with user info
-    reports = db.query(RescueReport).options(joinedload(RescueReport.user)).all()
-
-    results = []
-    for r in reports:
-        user = r.user
-        results.append({
-            "reportId": r.report_id,
-            "userId": r.user_id,
-            "userFirstName": user.first_name if user else "Unknown",
-            "userLastName": user.last_name if user else "Unknown",
-            "userFullName": f"{user.first_name} {user.last_name}" if user else "Unknown",
-            "location": r.location,
-            "latitude": r.latitude,
-            "longitude": r.longitude,
-            "photo": r.photo,
-            "status": r.status.value if hasattr(r.status, "value") else r.status,
-            "alert_type": r.alert_type.value if hasattr(r.alert_type, "value") else r.alert_type,
-            "description": r.description,
-            "chatId": r.chat_id
-        })
-    return results
+_REPORTER = joinedload(RescueReport.user).load_only(User.first_name, User.last_name)
+
+# RescueReportResponse field -> (what to load, value). Drives sparse ?fields= lists (see src/fields.py).
+REPORT_FIELDS: FieldMap = {
+    "reportId": ((RescueReport.report_id,), lambda r: r.report_id),
+    "userId": ((RescueReport.user_id,), lambda r: r.user_id),
+    "userFirstName": ((_REPORTER,), lambda r: r.user.first_name if r.user else "Unknown"),
+    "userLastName": ((_REPORTER,), lambda r: r.user.last_name if r.user else "Unknown"),
+    "userFullName": ((_REPORTER,), lambda r: f"{r.user.first_name} {r.user.last_name}" if r.user else "Unknown"),
+    "location": ((RescueReport.location,), lambda r: r.location),
+    "latitude": ((RescueReport.latitude,), lambda r: r.latitude),
+    "longitude": ((RescueReport.longitude,), lambda r: r.longitude),
+    "photo": ((RescueReport.photo,), lambda r: r.photo),
+    "photo_variants": ((RescueReport.photo,), lambda r: variant_urls(r.photo)),
+    "status": ((RescueReport.status,), lambda r: r.status.value if hasattr(r.status, "value") else r.status),
+    "alert_type": ((RescueReport.alert_type,), lambda r: r.alert_type.value if hasattr(r.alert_type, "value") else r.alert_type),
+    "description": ((RescueReport.description,), lambda r: r.description),
+    "chatId": ((RescueReport.chat_id,), lambda r: r.chat_id),
+}
+
+
+def _report_item(r: RescueReport, fields: set[str] | None = None) -> dict:
+    return project(r, REPORT_FIELDS, fields)
+
+
+def _rescue_reports_query(db: Session, fields: set[str] | None):
+    query = db.query(RescueReport)
+    if fields is None:
+        return query.options(joinedload(RescueReport.user))
+    return query.options(*load_options(REPORT_FIELDS, fields, RescueReport.created_at, RescueReport.report_id))
+
+
+def get_rescue_reports(current_user, db: Session, page: PageParams, fields: set[str] | None = None):
+    # Fetch one page of rescue reports with user info (only the requested fields, if any)
+    check_fields(REPORT_FIELDS, fields)
+    query = _rescue_reports_query(db, fields)
+    reports, next_cursor = paginate(query, page, RescueReport.created_at, RescueReport.report_id)
+
+    return {"items": [_report_item(r, fields) for r in reports], "next_cursor": next_cursor}
+
+
+def stream_rescue_reports(current_user, fmt: StreamFormat, fields: set[str] | None = None):
+    # Every rescue report, newest first, without materializing the list (see src/streaming.py).
+    check_fields(REPORT_FIELDS, fields)
+    return stream_query(
+        lambda db: _rescue_reports_query(db, fields).order_by(RescueReport.created_at.desc(), RescueReport.report_id.desc()),
+        lambda r: _report_item(r, fields),
+        fmt,
+    )
+
+
+def get_rescue_report_changes(current_user, db: Session, params: SyncParams):
+    query = db.query(RescueReport).options(joinedload(RescueReport.user))
+    changes = changes_since(query, params, RescueReport.updated_at, RescueReport.report_id)
+    changes["upserts"] = [_report_item(r) for r in changes["upserts"]]
+    return changes
 
 
 
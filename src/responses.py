@@ -0,0 +1,35 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _default(value: Any) -> Any:
+    # Types orjson does not handle natively (UUID, datetime, enums and dataclasses it does).
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ORJSONResponse(JSONResponse):
+    # JSON response rendered with orjson.
+    #
+    # Returning one of these from a route bypasses FastAPI's response_model
+    # validation and jsonable_encoder pass, so only use it for trusted service
+    # output that is already shaped like the declared response_model (keep
+    # response_model on the route for the OpenAPI schema).
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,25 @@
+from typing import List
+
+from fastapi import APIRouter, Query
+
+from ..auth.service import CurrentUser
+from ..database.core import DbSession
+from ..pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from . import models, service
+
+router = APIRouter(
+    prefix="/search",
+    tags=["Search"]
+)
+
+
+@router.get("/", response_model=models.SearchResponse)
+def search(
+    db: DbSession,
+    current_user: CurrentUser,
+    q: str = Query(..., min_length=1, max_length=200, description='Free text, e.g. "black cat with white paws near the lake"'),
+    types: List[models.SearchResultType] = Query([], description="Restrict to these result types; repeat the parameter for several"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+):
+    # Pets, lost/found and rescue reports ranked by relevance to `q`, best first.
+    return service.search(db, q, types, limit)
@@ -0,0 +1,35 @@
+import enum
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, computed_field
+
+from src.media.variants import variant_urls
+
+
+class SearchResultType(str, enum.Enum):
+    pet = "pet"
+    lost_found = "lost_found"
+    rescue = "rescue"
+
+
+class SearchResult(BaseModel):
+    type: SearchResultType
+    id: UUID
+    title: Optional[str] = None
+    description: Optional[str] = None
+    location: Optional[str] = None
+    photo: Optional[str] = None
+    status: Optional[str] = None
+    created_at: datetime
+    rank: float  # higher is better; only comparable within one response
+
+    @computed_field
+    @property
+    def photo_variants(self) -> Optional[Dict[str, str]]:
+        return variant_urls(self.photo)
+
+
+class SearchResponse(BaseModel):
+    items: List[SearchResult]
@@ -0,0 +1,78 @@
+import logging
+from typing import Callable
+
+from sqlalchemy import false
+from sqlalchemy.orm import Query as OrmQuery, Session
+
+from src.database.fulltext import ranked, search_terms
+from src.entities.lost_found import LostFoundReport
+from src.entities.pet import Pet
+from src.entities.rescue_rep import RescueReport
+from src.exceptions import InvalidSearchQueryError
+from . import models
+
+
+def _pet_result(pet: Pet) -> dict:
+    return {
+        "type": models.SearchResultType.pet,
+        "id": pet.pet_id,
+        "title": pet.name,
+        "description": pet.description,
+        "photo": pet.images[0] if pet.images else None,
+        "status": "Adopted" if pet.is_adopted else "Available",
+        "created_at": pet.created_at,
+    }
+
+
+def _lost_found_result(report: LostFoundReport) -> dict:
+    return {
+        "type": models.SearchResultType.lost_found,
+        "id": report.report_id,
+        "title": report.pet_name,
+        "description": report.description,
+        "location": report.location,
+        "photo": report.photo,
+        "status": report.status.value,
+        "created_at": report.created_at,
+    }
+
+
+def _rescue_result(report: RescueReport) -> dict:
+    return {
+        "type": models.SearchResultType.rescue,
+        "id": report.report_id,
+        "title": report.alert_type.value,
+        "description": report.description,
+        "location": report.location,
+        "photo": report.photo,
+        "status": report.status.value,
+        "created_at": report.created_at,
+    }
+
+
+# type -> (table, base query, result builder). Pets are limited to those still up for
+# adoption, as in /pets/browse; reports of every status are searchable.
+SOURCES: dict[models.SearchResultType, tuple[str, Callable[[Session], OrmQuery], Callable]] = {
+    models.SearchResultType.pet: ("pets", lambda db: db.query(Pet).filter(Pet.is_adopted == false()), _pet_result),
+    models.SearchResultType.lost_found: ("lost_found_reports", lambda db: db.query(LostFoundReport), _lost_found_result),
+    models.SearchResultType.rescue: ("rescue_reports", lambda db: db.query(RescueReport), _rescue_result),
+}
+
+
+def search(db: Session, q: str, types: list[models.SearchResultType], limit: int) -> dict:
+    # Ranked full-text search across pets, lost/found and rescue reports (see
+    # src/database/fulltext.py). Each source returns its own top `limit` by rank,
+    # and the merged list is cut to `limit`.
+    terms = search_terms(q)
+    if not terms:
+        raise InvalidSearchQueryError()
+
+    results = []
+    for result_type in types or list(SOURCES):
+        table, base_query, build = SOURCES[result_type]
+        for row, rank in ranked(base_query(db), table, terms, limit):
+            results.append({**build(row), "rank": rank})
+
+    results.sort(key=lambda r: r["rank"], reverse=True)
+    logging.info(f"Search for {len(terms)} terms returned {len(results)} candidates")
+    return {"items": results[:limit]}
@@ -12,15 +12,18 @@ from .entities.stray_map import StrayMapEntry, LocationType
 
 
 from .database.core import get_db  
+from .caching import conditional_get
 
 router = APIRouter(prefix="/api", tags=["stats"])
 
+STATS_CACHE_CONTROL = "public, max-age=60"
+
 class StatsOut(BaseModel):
     rescues: int
     adoptions: int
     located: int
 
-@router.get("/stats", response_model=StatsOut)
+@router.get("/stats", response_model=StatsOut, dependencies=[conditional_get(RescueReport, AdoptionRequest, StrayMapEntry, cache_control=STATS_CACHE_CONTROL)])
 def get_stats(db: Session = Depends(get_db)) -> StatsOut:
     # Rescues resolved rescue reports
     rescues_q = (
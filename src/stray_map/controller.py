@@ -1,9 +1,14 @@
 from fastapi import APIRouter, status, Query
-from typing import List, Optional
+from fastapi.responses import StreamingResponse
+from typing import Optional
 from uuid import UUID
 
 from ..database.core import DbSession
 from ..auth.service import CurrentUser
+from ..caching import conditional_get
+from ..entities.stray_map import StrayMapEntry
+from ..pagination import Page, Pagination
+from ..streaming import StreamFormat
 from . import models, service
 
 router = APIRouter(
@@ -11,14 +16,25 @@ router = APIRouter(
     tags=["Stray Map"]
 )
 
+LIST_CACHE_CONTROL = "public, max-age=30"
+
 @router.post("/", response_model=models.StrayMapResponse, status_code=status.HTTP_201_CREATED)
 def create_stray_entry(db: DbSession, entry: models.StrayMapCreate, current_user: CurrentUser):
     return service.create_entry(current_user, db, entry)
 
 
-@router.get("/", response_model=List[models.StrayMapResponse])
-def get_stray_entries(db: DbSession, location_type: Optional[str] = Query(None, description="Filter by type: rescue_home, stray_animal, vet_center")):
-    return service.get_entries(db, location_type)
+@router.get("/", response_model=Page[models.StrayMapResponse], dependencies=[conditional_get(StrayMapEntry, cache_control=LIST_CACHE_CONTROL)])
+def get_stray_entries(db: DbSession, page: Pagination, location_type: Optional[str] = Query(None, description="Filter by type: rescue_home, stray_animal, vet_center")):
+    return service.get_entries(db, page, location_type)
+
+
+@router.get("/stream", response_class=StreamingResponse)
+def stream_stray_entries(
+    format: StreamFormat = Query(StreamFormat.json),
+    location_type: Optional[str] = Query(None, description="Filter by type: rescue_home, stray_animal, vet_center"),
+):
+    # Every entry in one response, written incrementally (see src/streaming.py).
+    return service.stream_entries(format, location_type)
 
 
 @router.get("/{entry_id}", response_model=models.StrayMapResponse)
@@ -8,6 +8,8 @@ from src.entities.stray_map import StrayMapEntry
 from . import models
 
 from src.entities.leaderboard import LeaderboardUser
+from src.pagination import PageParams, paginate
+from src.streaming import StreamFormat, stream_query
 import logging
 
 
@@ -63,11 +65,26 @@ def create_entry(current_user: TokenData, db: Session, entry_data: models.StrayM
 
 
 
-def get_entries(db: Session, location_type: str | None = None):
+def _entries_query(db: Session, location_type: str | None):
     query = db.query(StrayMapEntry)
     if location_type:
         query = query.filter(StrayMapEntry.location_type == location_type)
-    return query.all()
+    return query
+
+
+def get_entries(db: Session, page: PageParams, location_type: str | None = None):
+    query = _entries_query(db, location_type)
+    entries, next_cursor = paginate(query, page, StrayMapEntry.created_at, StrayMapEntry.id)
+    return {"items": entries, "next_cursor": next_cursor}
+
+
+def stream_entries(fmt: StreamFormat, location_type: str | None = None):
+    # Every entry, newest first, without materializing the list (see src/streaming.py).
+    return stream_query(
+        lambda db: _entries_query(db, location_type).order_by(StrayMapEntry.created_at.desc(), StrayMapEntry.id.desc()),
+        lambda e: models.StrayMapResponse.model_validate(e).model_dump(),
+        fmt,
+    )
 
 
 def get_entry_by_id(db: Session, entry_id: UUID):
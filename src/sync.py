@@ -0,0 +1,185 @@
+# Delta sync ("changes since") for offline-capable clients.
+#
+# GET /<feature>/changes?since=<cursor> returns rows created or updated after the
+# cursor, ordered by updated_at, plus the ids of rows deleted since (from the
+# tombstones table). Without `since` it starts a full sync. Clients store
+# next_cursor and keep calling while has_more is true; next_cursor is always set,
+# so the last one is used for the next poll.
+#
+# The cursor packs two keyset positions: (updated_at, id) in the synced table and
+# (deleted_at, id) in tombstones, plus the user the feed is scoped to. Both scans run
+# on the updated_at / deleted_at indexes, so a sync costs in proportion to what
+# changed since the cursor.
+#
+# Tombstones carry the deleted row's owner. A feed of the caller's own rows passes
+# owner_id, and a feed of everyone else's rows passes exclude_owner_id, so deletions
+# are only reported to clients that could have seen the row. Feeds filter only on
+# the owner, which never changes: a row whose status changes stays in the feed as an
+# upsert (clients hide it themselves), so no row leaves a feed without a tombstone.
+#
+# Rows touched in the last SYNC_LAG_SECONDS are held back until the next poll: a
+# transaction may commit after a later one, and the cursor must not skip past it.
+#
+# Old tombstones are removed by: python -m src.sync --prune-tombstones
+
+import argparse
+import logging
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Annotated, Generic, List, Optional, TypeVar
+
+from fastapi import Depends, Query
+from pydantic import BaseModel, Field
+from sqlalchemy.orm import Query as OrmQuery
+
+from .entities.tombstone import Tombstone
+from .exceptions import InvalidCursorError, SyncCursorExpiredError
+from .pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decode_cursor, encode_cursor, seek_condition
+
+
+SYNC_LAG_SECONDS = float(os.getenv("SYNC_LAG_SECONDS", "2"))
+TOMBSTONE_RETENTION_DAYS = int(os.getenv("TOMBSTONE_RETENTION_DAYS", "30"))
+
+T = TypeVar("T")
+
+
+class SyncParams(BaseModel):
+    since: Optional[str] = None
+    limit: int = Field(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+
+
+class ChangeSet(BaseModel, Generic[T]):
+    upserts: List[T]
+    deletes: List[uuid.UUID]
+    next_cursor: str
+    has_more: bool
+
+
+def get_sync_params(
+    since: Optional[str] = Query(None, description="next_cursor from the previous sync; omit for a full sync"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Max upserts and deletes per call"),
+) -> SyncParams:
+    return SyncParams(since=since, limit=limit)
+
+
+Sync = Annotated[SyncParams, Depends(get_sync_params)]
+
+
+def _utcnow() -> datetime:
+    # Timestamps are stored as naive UTC (DateTime columns without time zone).
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _decode_sync_cursor(cursor: str, row_key: tuple, tombstone_key: tuple) -> list:
+    try:
+        return decode_cursor(cursor, row_key + tombstone_key + (Tombstone.owner_id,))
+    except InvalidCursorError:
+        # Cursors from before tombstones were scoped to an owner have no scope value;
+        # their clients resync once. Anything else is still a 400.
+        decode_cursor(cursor, row_key + tombstone_key)
+        raise SyncCursorExpiredError()
+
+
+def changes_since(
+    query: OrmQuery,
+    params: SyncParams,
+    updated_at_column,
+    id_column,
+    owner_id: uuid.UUID | None = None,
+    exclude_owner_id: uuid.UUID | None = None,
+) -> dict:
+
+    # `query` selects the rows visible to this client; it is narrowed to changes after the
+    # cursor here. owner_id / exclude_owner_id give the same visibility for tombstones.
+    # Returns {"upserts": rows, "deletes": ids, "next_cursor", "has_more"}; callers shape
+    # the rows into their response model.
+
+    db = query.session
+    now = _utcnow()
+    horizon = now - timedelta(seconds=SYNC_LAG_SECONDS)
+    table = id_column.table.name
+    row_key = (updated_at_column, id_column)
+    tombstone_key = (Tombstone.deleted_at, Tombstone.id)
+    scope = owner_id or exclude_owner_id
+
+    query = query.filter(updated_at_column <= horizon)
+    deletes = []
+    more_deletes = False
+
+    if params.since:
+        updated_at, row_id, deleted_at, tombstone_id, cursor_scope = _decode_sync_cursor(
+            params.since, row_key, tombstone_key
+        )
+        if cursor_scope != scope:
+            raise InvalidCursorError()
+        if deleted_at is None or deleted_at < now - timedelta(days=TOMBSTONE_RETENTION_DAYS):
+            # Tombstones this client still needs may already be pruned.
+            raise SyncCursorExpiredError()
+        if updated_at is not None:
+            query = query.filter(seek_condition(row_key, [updated_at, row_id], descending=False))
+
+        tombstone_query = db.query(Tombstone).filter(Tombstone.table_name == table, Tombstone.deleted_at <= horizon)
+        if owner_id is not None:
+            tombstone_query = tombstone_query.filter(Tombstone.owner_id == owner_id)
+        if exclude_owner_id is not None:
+            tombstone_query = tombstone_query.filter(Tombstone.owner_id != exclude_owner_id)
+        tombstones = (
+            tombstone_query
+            .filter(seek_condition(tombstone_key, [deleted_at, tombstone_id], descending=False))
+            .order_by(Tombstone.deleted_at, Tombstone.id)
+            .limit(params.limit + 1)
+            .all()
+        )
+        more_deletes = len(tombstones) > params.limit
+        tombstones = tombstones[:params.limit]
+        deletes = [t.row_id for t in tombstones]
+        if tombstones:
+            deleted_at, tombstone_id = tombstones[-1].deleted_at, tombstones[-1].id
+        elif not more_deletes:
+            deleted_at, tombstone_id = horizon, uuid.UUID(int=0)
+    else:
+        # Full sync: the client has nothing to delete yet, so start the
+        # tombstone position at the horizon.
+        updated_at, row_id = None, None
+        deleted_at, tombstone_id = horizon, uuid.UUID(int=0)
+
+    rows = query.order_by(updated_at_column, id_column).limit(params.limit + 1).all()
+    more_rows = len(rows) > params.limit
+    rows = rows[:params.limit]
+    if rows:
+        updated_at, row_id = getattr(rows[-1], updated_at_column.key), getattr(rows[-1], id_column.key)
+
+    return {
+        "upserts": rows,
+        "deletes": deletes,
+        "next_cursor": encode_cursor([updated_at, row_id, deleted_at, tombstone_id, scope]),
+        "has_more": more_rows or more_deletes,
+    }
+
+
+def prune_tombstones(db, retention_days: int = TOMBSTONE_RETENTION_DAYS) -> int:
+    cutoff = _utcnow() - timedelta(days=retention_days)
+    deleted = db.query(Tombstone).filter(Tombstone.deleted_at < cutoff).delete(synchronize_session=False)
+    db.commit()
+    return deleted
+
+
+def main() -> None:
+    from .database.core import SessionLocal
+    from .logging import LogLevels, configure_logging
+
+    parser = argparse.ArgumentParser(description="Delta-sync maintenance")
+    parser.add_argument("--prune-tombstones", action="store_true", help="delete tombstones past TOMBSTONE_RETENTION_DAYS")
+    args = parser.parse_args()
+
+    configure_logging(LogLevels.info)
+    if not args.prune_tombstones:
+        parser.error("nothing to do")
+
+    with SessionLocal() as db:
+        logging.info(f"[Sync] pruned {prune_tombstones(db)} tombstones older than {TOMBSTONE_RETENTION_DAYS} days")
+
+
+if __name__ == "__main__":
+    main()
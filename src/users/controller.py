@@ -4,7 +4,11 @@ from uuid import UUID
 from ..database.core import DbSession
 from . import models
 from . import service
-from ..auth.service import CurrentUser
+from ..auth.service import AdminUser, CurrentUser, CurrentUserLoader
+from ..pagination import Page, Pagination
+from ..streaming import StreamFormat
+from fastapi import Query
+from fastapi.responses import StreamingResponse
 
 router = APIRouter(
     prefix="/users",
@@ -12,54 +16,50 @@ router = APIRouter(
 )
 
 @router.get("/me", response_model=models.UserResponse)
-def get_current_user(current_user: CurrentUser, db: DbSession):
-    user_uuid = current_user.get_uuid()
-    if user_uuid is None:
-        # token is missing/invalid
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or missing user in token",
-        )
-
-    return service.get_user_by_id(db, user_uuid)
+def get_current_user(me: CurrentUserLoader):
+    return me.user
 
 @router.put("/change-password", status_code=status.HTTP_200_OK)
 def change_password(
     password_change: models.PasswordChange,
     db: DbSession,
-    current_user: CurrentUser
+    me: CurrentUserLoader
 ):
-    service.change_password(db, current_user.get_uuid(), password_change)
+    service.change_password(db, me.user, password_change)
 
 # Update user preferences
 @router.put("/preferences", response_model=models.UserResponse)
 def update_preferences(
     preferences: models.UserPreferenceUpdate,
     db: DbSession,
-    current_user: CurrentUser
+    me: CurrentUserLoader
 ):
-    return service.update_preferences(db, current_user.get_uuid(), preferences)
+    return service.update_preferences(db, me.user, preferences)
 
-@router.get("/", response_model=list[models.UserResponse])
+@router.get("/", response_model=Page[models.UserResponse])
 def get_all_users(
     db: DbSession,
-    current_user: CurrentUser
+    current_user: CurrentUser,
+    page: Pagination
+):
+    return service.get_all_users(db, page)
+
+# Every active user in one streamed response (JSON array or NDJSON)
+@router.get("/stream", response_class=StreamingResponse)
+def stream_users(
+    current_user: CurrentUser,
+    format: StreamFormat = Query(StreamFormat.json)
 ):
-    return service.get_all_users(db)
+    return service.stream_users(format)
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 def soft_delete_user(
     user_id: UUID,
     db: DbSession,
-    current_user: CurrentUser
+    current_user: AdminUser  # only admins can delete
 ):
-    #  ensure only admins can delete
-    me = service.get_user_by_id(db, current_user.get_uuid())
-    if not me.is_admin:
-        raise HTTPException(status_code=403, detail="Not authorized")
-
     # prevent self-deletion 
-    if me.id == user_id:
+    if current_user.get_uuid() == user_id:
         raise HTTPException(status_code=400, detail="You cannot delete yourself")
 
     service.soft_delete_user(db, user_id)
\ No newline at end of file
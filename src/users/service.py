@@ -6,6 +6,9 @@ from . import models
 from src.entities.user import User
 from src.exceptions import UserNotFoundError, InvalidPasswordError, PasswordMismatchError
 from src.auth.service import verify_password, get_password_hash
+from src.auth.revocation import revoke_user_tokens
+from src.pagination import PageParams, paginate
+from src.streaming import StreamFormat, stream_query
 import logging
 
 
@@ -17,9 +20,7 @@ def get_user_by_id(db: Session, user_id: UUID) -> User:
     return user
 
 
-def change_password(db: Session, user_id: UUID, password_change: models.PasswordChange) -> None:
-    user = get_user_by_id(db, user_id)
-
+def change_password(db: Session, user: User, password_change: models.PasswordChange) -> None:
     if not verify_password(password_change.current_password, user.password_hash):
         raise InvalidPasswordError()
 
@@ -27,12 +28,13 @@ def change_password(db: Session, user_id: UUID, password_change: models.Password
         raise PasswordMismatchError()
 
     user.password_hash = get_password_hash(password_change.new_password)
+    # Sign out every existing session; the client logs in again with the new password.
+    revoke_user_tokens(user)
     db.commit()
 
 
 # Update preferences
-def update_preferences(db: Session, user_id: UUID, preferences: models.UserPreferenceUpdate) -> User:
-    user = get_user_by_id(db, user_id)
+def update_preferences(db: Session, user: User, preferences: models.UserPreferenceUpdate) -> User:
     updates = preferences.model_dump(exclude_unset=True)
 
     for key, value in updates.items():
@@ -40,13 +42,24 @@ def update_preferences(db: Session, user_id: UUID, preferences: models.UserPrefe
 
     db.commit()
     db.refresh(user)
-    logging.info(f"Updated preferences for user {user_id}")
+    logging.info(f"Updated preferences for user {user.id}")
     return user
 
-def get_all_users(db: Session) -> list[User]:
-    users = db.query(User).filter(User.is_active == True).all()
+def get_all_users(db: Session, page: PageParams) -> dict:
+    query = db.query(User).filter(User.is_active == True)
+    # users has no created_at; the UUIDv7 primary key alone is the (time-ordered) sort key
+    users, next_cursor = paginate(query, page, User.id)
     logging.info(f"Retrieved active users, count: {len(users)}")
-    return users
+    return {"items": users, "next_cursor": next_cursor}
+
+def stream_users(fmt: StreamFormat):
+    # Every active user, newest first, without materializing the list (see src/streaming.py).
+    logging.info(f"Streaming active users as {fmt.value}")
+    return stream_query(
+        lambda db: db.query(User).filter(User.is_active == True).order_by(User.id.desc()),
+        lambda u: models.UserResponse.model_validate(u, from_attributes=True).model_dump(),
+        fmt,
+    )
 
 def soft_delete_user(db: Session, user_id: UUID) -> None:
     user = get_user_by_id(db, user_id)
@@ -56,5 +69,6 @@ def soft_delete_user(db: Session, user_id: UUID) -> None:
         return
 
     user.is_active = False
+    revoke_user_tokens(user)
     db.commit()
     logging.info(f"Soft-deleted user {user_id}")
\ No newline at end of file
@@ -1,7 +1,7 @@
 import boto3
 from botocore.client import Config
-import uuid
 import os
+import threading
 
 AWS_ACCESS_KEY = os.getenv("AWS_ACCESS_KEY_ID")
 AWS_SECRET_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
@@ -19,23 +19,25 @@ if AWS_ACCESS_KEY and AWS_SECRET_KEY:
     client_kwargs["aws_access_key_id"] = AWS_ACCESS_KEY
     client_kwargs["aws_secret_access_key"] = AWS_SECRET_KEY
 
-s3 = boto3.client("s3", **client_kwargs)
+# Created on first use, so importing this module (and the media pool processes that
+# do) needs no AWS configuration. Clients are thread-safe; creating one is not.
+_s3 = None
+_s3_lock = threading.Lock()
+
+
+def get_s3_client():
+    global _s3
+    with _s3_lock:
+        if _s3 is None:
+            _s3 = boto3.client("s3", **client_kwargs)
+        return _s3
+
 
 def upload_image_to_s3(file, folder="pets"):
-    if not BUCKET_NAME:
-        raise RuntimeError("AWS_S3_BUCKET_NAME is not set")
-
-    file_extension = file.filename.split(".")[-1]
-    unique_filename = f"{folder}/{uuid.uuid4()}.{file_extension}"
-
-    s3.upload_fileobj(
-        file.file,
-        BUCKET_NAME,
-        unique_filename,
-        ExtraArgs={
-            "ContentType": file.content_type,
-            # "ACL": "public-read"
-        }
-    )
-
-    return f"https://{BUCKET_NAME}.s3.{AWS_REGION}.amazonaws.com/{unique_filename}"
+    # Blocking (boto3): call it from plain `def` routes, or wrap it in
+    # run_in_threadpool from async code, never directly on the event loop.
+    # Stores the original in the media storage (S3 unless MEDIA_STORAGE=local) and
+    # queues its thumbnail/medium variants (see src/media/variants.py).
+    from ..media.service import store_image
+
+    return store_image(file.file, file.filename, file.content_type, folder)
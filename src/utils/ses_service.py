@@ -1,40 +1,37 @@
 # src/utils/ses_service.py
+#
+# Thin SES wrapper used by the outbox's SES transport (src/outbox/transports.py).
+# The client is created on first send, so importing this module needs no AWS
+# configuration; a missing SES_FROM_EMAIL only fails the send (and the outbox retries).
 import os
 import boto3
 
 AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
 SES_FROM_EMAIL = os.getenv("SES_FROM_EMAIL")
 
-if not SES_FROM_EMAIL:
-    raise ValueError("SES_FROM_EMAIL environment variable is not set.")
+_ses = None
 
-if not AWS_REGION:
-    raise ValueError("AWS_REGION environment variable is not set.")
 
-ses = boto3.client("ses", region_name=AWS_REGION)
+def get_ses_client():
+    global _ses
+    if _ses is None:
+        _ses = boto3.client("ses", region_name=AWS_REGION)
+    return _ses
 
-if not ses:
-    raise ValueError("Failed to create SES client. Check AWS credentials and configuration.")
 
-def send_verification_code(to_email: str, code: str) -> None:
-    subject = "Your verification code"
-    body_text = f"Your verification code is: {code}\nThis code expires soon."
-    body_html = f"""
-    <html><body>
-      <p>Your verification code is:</p>
-      <h2>{code}</h2>
-      <p>This code expires soon.</p>
-    </body></html>
-    """
+def send_email(to_email: str, subject: str, body_text: str, body_html: str | None = None) -> None:
+    if not SES_FROM_EMAIL:
+        raise ValueError("SES_FROM_EMAIL environment variable is not set.")
 
-    ses.send_email(
+    body = {"Text": {"Data": body_text, "Charset": "UTF-8"}}
+    if body_html:
+        body["Html"] = {"Data": body_html, "Charset": "UTF-8"}
+
+    get_ses_client().send_email(
         Source=SES_FROM_EMAIL,
         Destination={"ToAddresses": [to_email]},
         Message={
             "Subject": {"Data": subject, "Charset": "UTF-8"},
-            "Body": {
-                "Text": {"Data": body_text, "Charset": "UTF-8"},
-                "Html": {"Data": body_html, "Charset": "UTF-8"},
-            },
+            "Body": body,
         },
     )
@@ -0,0 +1,96 @@
+import importlib
+import os
+import pkgutil
+import tempfile
+from datetime import timedelta
+
+import pytest
+
+# src reads its configuration at import time, so the test environment goes first.
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("SES_FROM_EMAIL", "test@example.com")
+os.environ.setdefault("AWS_REGION", "us-east-1")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'test.db')}")
+os.environ.setdefault("MEDIA_STORAGE", "local")
+os.environ.setdefault("MEDIA_LOCAL_ROOT", tempfile.mkdtemp())
+os.environ.setdefault("MEDIA_WORKERS", "0")
+os.environ.setdefault("EMAIL_OUTBOX_WORKER", "false")
+os.environ.setdefault("SYNC_LAG_SECONDS", "0")
+os.environ.setdefault("HASH_WORKERS", "0")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+import src.entities
+from src.auth.service import create_access_token
+from src.database.core import Base, SessionLocal, engine
+from src.entities.user import User
+from src.main import app
+from src.media.storage import get_storage
+from src.rate_limiter import limiter
+
+for module in pkgutil.iter_modules(src.entities.__path__, src.entities.__name__ + "."):
+    importlib.import_module(module.name)
+
+
+@pytest.fixture
+def db():
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def client(db):
+    limiter.reset()
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def make_user(db):
+    def make_user(email: str, is_admin: bool = False) -> User:
+        user = User(
+            email=email, first_name="Test", last_name="User", password_hash="x",
+            is_admin=is_admin, is_email_verified=True,
+        )
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        return user
+    return make_user
+
+
+@pytest.fixture
+def auth_headers():
+    def auth_headers(user: User) -> dict:
+        return {"Authorization": "Bearer " + create_access_token(user, timedelta(minutes=5))}
+    return auth_headers
+
+
+@pytest.fixture
+def media_storage():
+    # The LocalStorage under MEDIA_LOCAL_ROOT; its files are removed after the test.
+    storage = get_storage()
+    yield storage
+    for path in sorted(storage.root.rglob("*"), reverse=True):
+        path.rmdir() if path.is_dir() else path.unlink()
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args):
+        self.count += 1
+
+
+@pytest.fixture
+def count_queries():
+    # Statements sent to the database while the fixture is active.
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter)
+    yield counter
+    event.remove(engine, "before_cursor_execute", counter)
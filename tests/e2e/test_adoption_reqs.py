@@ -0,0 +1,45 @@
+import pytest
+
+
+def create_requests(client, headers, count: int, offset: int = 0) -> None:
+    for i in range(offset, offset + count):
+        response = client.post(
+            "/adoption_reqs/",
+            json={"pet": {"name": f"pet {i}", "species": "Dog"}, "description": "Needs a home"},
+            headers=headers,
+        )
+        assert response.status_code == 201, response.text
+
+
+def items(body: dict) -> list:
+    return body["upserts"] if "upserts" in body else body["items"]
+
+
+@pytest.mark.parametrize("url, owner_reads", [
+    ("/adoption_reqs/all?limit=50", False),
+    ("/adoption_reqs/all?limit=50&fields=id,pet", False),
+    ("/adoption_reqs/mine?limit=50", True),
+    ("/adoption_reqs/?limit=50", True),
+    ("/adoption_reqs/changes?limit=50", False),
+])
+def test_listing_query_count_does_not_grow_with_rows(client, make_user, auth_headers, count_queries, url, owner_reads):
+    owner, reader = make_user("owner@example.com"), make_user("reader@example.com")
+    headers = auth_headers(owner if owner_reads else reader)
+    counts, created = [], 0
+    for total in (5, 50):
+        create_requests(client, auth_headers(owner), total - created, offset=created)
+        created = total
+        count_queries.count = 0
+        response = client.get(url, headers=headers)
+        assert response.status_code == 200, response.text
+        assert len(items(response.json())) == total
+        counts.append(count_queries.count)
+    assert counts[0] == counts[1]
+
+
+def test_listing_includes_pet(client, make_user, auth_headers):
+    owner, reader = make_user("owner@example.com"), make_user("reader@example.com")
+    create_requests(client, auth_headers(owner), 3)
+    response = client.get("/adoption_reqs/all", headers=auth_headers(reader))
+    assert response.status_code == 200
+    assert sorted(item["pet"]["name"] for item in response.json()["items"]) == ["pet 0", "pet 1", "pet 2"]
@@ -0,0 +1,82 @@
+from src.auth import revocation
+from src.auth.revocation import revoke_user_tokens
+from src.auth.service import get_password_hash
+
+
+def test_verify_accepts_a_valid_token(client, make_user, auth_headers):
+    user = make_user("user@example.com")
+    response = client.post("/auth/verify", headers=auth_headers(user))
+    assert response.status_code == 200
+    assert response.json() == {"valid": True, "user_id": str(user.id)}
+
+
+def test_verify_rejects_a_revoked_token(client, db, make_user, auth_headers):
+    user = make_user("user@example.com")
+    headers = auth_headers(user)
+    revoke_user_tokens(user)
+    db.commit()
+    assert client.post("/auth/verify", headers=headers).status_code == 401
+
+
+def test_verify_rejects_a_malformed_token(client):
+    assert client.post("/auth/verify", headers={"Authorization": "Bearer not-a-jwt"}).status_code == 401
+
+
+def test_demoting_an_admin_revokes_their_tokens(client, db, make_user, auth_headers):
+    admin = make_user("admin@example.com", is_admin=True)
+    headers = auth_headers(admin)
+    assert client.get("/metrics", headers=headers).status_code == 200
+
+    admin.is_admin = False
+    db.commit()
+    assert client.get("/metrics", headers=headers).status_code == 401
+
+
+def test_resend_code_revokes_tokens_of_the_deactivated_user(client, db, make_user, auth_headers):
+    user = make_user("user@example.com")
+    user.is_email_verified = False
+    db.commit()
+    headers = auth_headers(user)
+
+    assert client.post("/auth/resend-code", json={"email": user.email}).status_code == 200
+    assert client.post("/auth/verify", headers=headers).status_code == 401
+
+
+def test_password_change_revokes_the_old_token(client, db, make_user, auth_headers):
+    user = make_user("user@example.com")
+    user.password_hash = get_password_hash("old-password")
+    db.commit()
+    headers = auth_headers(user)
+
+    response = client.put("/users/change-password", headers=headers, json={
+        "current_password": "old-password", "new_password": "new-password", "new_password_confirm": "new-password",
+    })
+    assert response.status_code == 200, response.text
+    assert client.get("/users/me", headers=headers).status_code == 401
+    db.refresh(user)
+    assert client.get("/users/me", headers=auth_headers(user)).status_code == 200
+
+
+def test_soft_delete_revokes_only_the_deleted_user(client, make_user, auth_headers):
+    admin = make_user("admin@example.com", is_admin=True)
+    deleted, bystander = make_user("deleted@example.com"), make_user("bystander@example.com")
+    deleted_headers, bystander_headers = auth_headers(deleted), auth_headers(bystander)
+
+    assert client.delete(f"/users/{deleted.id}", headers=auth_headers(admin)).status_code == 204
+    assert client.get("/users/me", headers=deleted_headers).status_code == 401
+    assert client.get("/users/me", headers=bystander_headers).status_code == 200
+
+
+def test_revocation_applies_only_when_the_transaction_commits(client, db, make_user, auth_headers):
+    user = make_user("user@example.com")
+    headers = auth_headers(user)
+
+    revoke_user_tokens(user)
+    db.rollback()
+    assert user.id not in revocation._versions
+    assert client.get("/users/me", headers=headers).status_code == 200
+
+    revoke_user_tokens(user)
+    assert user.id not in revocation._versions  # not committed yet
+    db.commit()
+    assert client.get("/users/me", headers=headers).status_code == 401
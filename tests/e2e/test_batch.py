@@ -0,0 +1,41 @@
+from src.batch import service as batch_service
+from src.batch.models import BATCH_MAX_REQUESTS
+
+
+def run_batch(client, headers, *paths: str):
+    requests = [{"id": str(i), "path": path} for i, path in enumerate(paths)]
+    return client.post("/batch/", json={"requests": requests}, headers=headers)
+
+
+def test_each_sub_request_gets_its_own_status(client, make_user, auth_headers):
+    user = make_user("user@example.com")
+    response = run_batch(
+        client, auth_headers(user),
+        "/users/me", "/notifications/?limit=5", "/not/whitelisted", "/notifications/?cursor=garbage",
+    )
+    assert response.status_code == 200
+    me, notifications, unknown, bad_cursor = response.json()["responses"]
+
+    assert [r["id"] for r in (me, notifications, unknown, bad_cursor)] == ["0", "1", "2", "3"]
+    assert me["status"] == 200 and me["body"]["email"] == "user@example.com"
+    assert notifications["status"] == 200 and notifications["body"]["items"] == []
+    assert unknown["status"] == 404
+    assert bad_cursor["status"] == 400
+
+
+def test_a_crashing_sub_request_does_not_fail_the_others(client, make_user, auth_headers, monkeypatch):
+    def crash(me, db, query):
+        raise RuntimeError("boom")
+
+    monkeypatch.setitem(batch_service._routes, "/crash", (crash, None))
+    response = run_batch(client, auth_headers(make_user("user@example.com")), "/crash", "/users/me")
+    assert response.status_code == 200
+    crashed, me = response.json()["responses"]
+    assert crashed["status"] == 500 and crashed["body"] == {"detail": "Internal server error"}
+    assert me["status"] == 200
+
+
+def test_batch_needs_a_token_and_a_bounded_size(client, make_user, auth_headers):
+    assert run_batch(client, {}, "/users/me").status_code == 401
+    headers = auth_headers(make_user("user@example.com"))
+    assert run_batch(client, headers, *["/users/me"] * (BATCH_MAX_REQUESTS + 1)).status_code == 422
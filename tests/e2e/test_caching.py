@@ -0,0 +1,39 @@
+from src.entities.stray_map import LocationType, StrayMapEntry
+
+
+def add_entry(db, user, name: str) -> StrayMapEntry:
+    entry = StrayMapEntry(user_id=user.id, name=name, latitude=6.9, longitude=79.8, location_type=LocationType.vet_center)
+    db.add(entry)
+    db.commit()
+    return entry
+
+
+def test_matching_if_none_match_returns_304(client, db, make_user):
+    add_entry(db, make_user("user@example.com"), "Clinic")
+    first = client.get("/stray-map/")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"]
+
+    second = client.get("/stray-map/", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.headers["ETag"] == etag
+    assert second.content == b""
+
+
+def test_changes_and_other_queries_get_a_new_etag(client, db, make_user):
+    user = make_user("user@example.com")
+    entry = add_entry(db, user, "Clinic")
+    etag = client.get("/stray-map/").headers["ETag"]
+
+    # Each page / filter has its own tag.
+    assert client.get("/stray-map/?limit=1", headers={"If-None-Match": etag}).status_code == 200
+
+    entry.name = "Clinic (moved)"
+    db.commit()
+    assert client.get("/stray-map/", headers={"If-None-Match": etag}).status_code == 200
+
+    etag = client.get("/stray-map/").headers["ETag"]
+    db.delete(entry)
+    db.commit()
+    assert client.get("/stray-map/", headers={"If-None-Match": etag}).status_code == 200
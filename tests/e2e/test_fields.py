@@ -0,0 +1,38 @@
+import pytest
+
+
+def create_report(client, headers, name: str) -> None:
+    response = client.post(
+        "/lost-found/",
+        json={"pet_name": name, "pet_type": "Dog", "location": "Park", "status": "Lost"},
+        headers=headers,
+    )
+    assert response.status_code == 201, response.text
+
+
+def test_sparse_list_returns_only_requested_fields(client, make_user, auth_headers):
+    headers = auth_headers(make_user("user@example.com"))
+    create_report(client, headers, "Rex")
+
+    response = client.get("/lost-found/?fields=reportId,pet_name,userFullName", headers=headers)
+    assert response.status_code == 200, response.text
+    [item] = response.json()["items"]
+    assert set(item) == {"reportId", "pet_name", "userFullName"}
+    assert item["pet_name"] == "Rex"
+
+    # Without fields= the full item is unchanged.
+    [full] = client.get("/lost-found/", headers=headers).json()["items"]
+    assert {"reportId", "pet_name", "location", "photo_variants", "userFullName"} <= set(full)
+
+
+@pytest.mark.parametrize("url", [
+    "/lost-found/?fields=reportId,password",
+    "/lost-found/stream?fields=password",
+    "/rescue-rep/?fields=password",
+    "/rescue-rep/stream?fields=password",
+    "/adoption_reqs/all?fields=id,password",
+])
+def test_unknown_field_is_rejected(client, make_user, auth_headers, url):
+    response = client.get(url, headers=auth_headers(make_user("user@example.com")))
+    assert response.status_code == 400
+    assert "Unknown fields: password" in response.json()["detail"]
@@ -0,0 +1,50 @@
+import io
+
+from PIL import Image
+
+from src.media import variants
+
+
+def jpeg_with_exif(width: int = 1600, height: int = 1200) -> bytes:
+    # Camera-style JPEG: GPS position, camera model, and an orientation tag saying
+    # it must be rotated 90 degrees to display upright.
+    exif = Image.Exif()
+    exif[0x0110] = "Test Camera"  # Model
+    exif[0x0112] = 6  # Orientation: rotate 90 CW
+    exif.get_ifd(0x8825)[2] = (51.0, 30.0, 0.0)  # GPSLatitude
+    out = io.BytesIO()
+    Image.new("RGB", (width, height), "orange").save(out, format="JPEG", exif=exif)
+    return out.getvalue()
+
+
+def test_upload_writes_resized_webp_variants_without_exif(client, make_user, auth_headers, media_storage):
+    headers = auth_headers(make_user("owner@example.com"))
+    pet_id = client.post("/pets/", json={"name": "Rex"}, headers=headers).json()["pet_id"]
+    response = client.post(
+        f"/pets/{pet_id}/upload-image",
+        files={"file": ("rex.jpg", jpeg_with_exif(), "image/jpeg")},
+        headers=headers,
+    )
+    assert response.status_code == 200, response.text
+    key = media_storage.key_for_url(response.json()["image_url"])
+
+    # The original is kept as uploaded.
+    with Image.open(media_storage.path(key)) as original:
+        assert original.size == (1600, 1200) and original.getexif()[0x0112] == 6
+
+    for name, size in variants.VARIANTS.items():
+        path = media_storage.path(variants.variant_key(key, name))
+        assert path.is_file(), name
+        with Image.open(path) as variant:
+            assert variant.format == "WEBP"
+            # Rotated upright (portrait), longest side capped, aspect ratio kept.
+            assert variant.size == (size * 3 // 4, size)
+            assert not variant.getexif() and "exif" not in variant.info
+
+    # The pet lists the variant URLs, which the app serves from the local storage.
+    pet = client.get(f"/pets/{pet_id}", headers=headers).json()
+    thumb_url = pet["image_variants"][0]["thumb"]
+    assert media_storage.key_for_url(thumb_url) == variants.variant_key(key, "thumb")
+    served = client.get(thumb_url)
+    assert served.status_code == 200 and served.content == media_storage.get(variants.variant_key(key, "thumb"))
+
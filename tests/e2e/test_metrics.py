@@ -0,0 +1,14 @@
+def test_metrics_requires_a_token(client):
+    assert client.get("/metrics").status_code == 401
+
+
+def test_metrics_is_forbidden_for_non_admins(client, make_user, auth_headers):
+    assert client.get("/metrics", headers=auth_headers(make_user("user@example.com"))).status_code == 403
+
+
+def test_metrics_reports_the_db_pool_to_admins(client, make_user, auth_headers):
+    response = client.get("/metrics", headers=auth_headers(make_user("admin@example.com", is_admin=True)))
+    assert response.status_code == 200
+    pool = response.json()["db_pool"]
+    assert {"checkouts", "checkout_timeouts", "checkout_wait_max_ms"} <= pool.keys()
+    assert pool.get("overflow", 0) >= 0
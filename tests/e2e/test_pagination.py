@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+
+from src.entities.stray_map import LocationType, StrayMapEntry
+from src.pagination import encode_cursor
+
+
+def add_entries(db, user, count: int) -> list[StrayMapEntry]:
+    # Pairs share a created_at, so the id tie-breaker is exercised.
+    start = datetime(2026, 1, 1)
+    entries = [
+        StrayMapEntry(
+            user_id=user.id, name=f"entry {i}", latitude=6.9, longitude=79.8,
+            location_type=LocationType.stray_animal, created_at=start + timedelta(minutes=i // 2),
+        )
+        for i in range(count)
+    ]
+    db.add_all(entries)
+    db.commit()
+    return entries
+
+
+def read_all_pages(client, url: str, limit: int) -> list[dict]:
+    items, cursor = [], None
+    while True:
+        response = client.get(url, params={"limit": limit, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200, response.text
+        body = response.json()
+        assert len(body["items"]) <= limit
+        items += body["items"]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return items
+
+
+def test_cursor_round_trip_has_no_duplicates_or_gaps(client, db, make_user):
+    entries = add_entries(db, make_user("user@example.com"), 23)
+
+    items = read_all_pages(client, "/stray-map/", limit=4)
+
+    expected = sorted(entries, key=lambda e: (e.created_at, e.id), reverse=True)
+    assert [item["id"] for item in items] == [str(e.id) for e in expected]
+
+
+def test_last_page_has_no_cursor(client, db, make_user):
+    add_entries(db, make_user("user@example.com"), 4)
+    body = client.get("/stray-map/", params={"limit": 4}).json()
+    assert len(body["items"]) == 4 and body["next_cursor"] is None
+
+
+def test_malformed_cursor_is_a_400(client, db):
+    assert client.get("/stray-map/", params={"cursor": "not-a-cursor"}).status_code == 400
+    # Well-formed, but not the (created_at, id) key of this route.
+    assert client.get("/stray-map/", params={"cursor": encode_cursor(["x"])}).status_code == 400
+    assert client.get("/stray-map/", params={"cursor": encode_cursor(["not a date", "not a uuid"])}).status_code == 400
@@ -0,0 +1,72 @@
+import pytest
+
+
+PETS = [
+    {"name": "puppy", "species": "Dog", "age": 4, "size": "small", "temperament": "playful", "activity_level": "high", "gender": "Male"},
+    {"name": "senior dog", "species": "Dog", "age": 96, "size": "large", "temperament": "calm", "activity_level": "low", "gender": "Female"},
+    {"name": "kitten", "species": "Cat", "age": 3, "size": "small", "temperament": "playful", "activity_level": "high", "gender": "Female"},
+    {"name": "cat", "species": "Cat", "age": 30, "size": "medium", "temperament": "gentle", "activity_level": "moderate", "gender": "Male"},
+    {"name": "unknown age", "species": "Other"},
+]
+
+
+@pytest.fixture
+def pets(client, make_user, auth_headers) -> dict:
+    headers = auth_headers(make_user("owner@example.com"))
+    created = {}
+    for pet in PETS:
+        response = client.post("/pets/", json=pet, headers=headers)
+        assert response.status_code == 201, response.text
+        created[pet["name"]] = response.json()["pet_id"]
+    return created
+
+
+def browse(client, query: str = "") -> list[str]:
+    response = client.get(f"/pets/browse?limit=50&{query}")
+    assert response.status_code == 200, response.text
+    return sorted(pet["name"] for pet in response.json()["items"])
+
+
+@pytest.mark.parametrize("query, names", [
+    ("", ["cat", "kitten", "puppy", "senior dog", "unknown age"]),
+    ("species=Dog", ["puppy", "senior dog"]),
+    ("species=Cat&size=small", ["kitten"]),
+    ("temperament=playful&activity_level=high", ["kitten", "puppy"]),
+    ("gender=Male", ["cat", "puppy"]),
+    ("min_age=12", ["cat", "senior dog"]),
+    ("max_age=12", ["kitten", "puppy"]),
+    ("min_age=3&max_age=4", ["kitten", "puppy"]),
+    ("min_age=5&max_age=5", []),
+])
+def test_browse_filters(client, pets, query, names):
+    assert browse(client, query) == names
+
+
+def test_browse_hides_adopted_pets(client, pets, make_user, auth_headers):
+    owner = auth_headers(make_user("other@example.com"))
+    response = client.post("/pets/", json={"name": "adopted", "species": "Dog"}, headers=owner)
+    assert client.put(f"/pets/{response.json()['pet_id']}/adopt", headers=owner).status_code == 200
+    assert "adopted" not in browse(client)
+
+
+def test_browse_pages_through_filtered_results(client, pets):
+    seen, cursor = [], None
+    while True:
+        response = client.get("/pets/browse", params={"species": "Cat", "limit": 1, **({"cursor": cursor} if cursor else {})})
+        body = response.json()
+        seen += [pet["name"] for pet in body["items"]]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+    assert sorted(seen) == ["cat", "kitten"]
+
+
+def test_browse_rejects_an_inverted_age_range(client):
+    response = client.get("/pets/browse?min_age=10&max_age=2")
+    assert response.status_code == 400
+    assert response.json()["detail"] == "min_age (10) must not be greater than max_age (2)"
+
+
+@pytest.mark.parametrize("query", ["species=Fish", "min_age=-1"])
+def test_browse_validates_filter_values(client, query):
+    assert client.get(f"/pets/browse?{query}").status_code == 422
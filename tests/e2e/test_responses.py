@@ -0,0 +1,45 @@
+import pytest
+
+from src.adoption_reqs.models import AdoptionRequestResponse
+from src.lost_found.models import LostFoundResponse
+from src.media.storage import get_storage
+from src.pagination import Page
+from src.rescue_rep.models import RescueReportResponse
+
+
+PHOTO = get_storage().url("reports/0190aaaa-bbbb-7ccc-8ddd-eeeeffff0000.jpg")
+
+
+def create_lost_found(client, headers) -> None:
+    payload = {"pet_name": "Rex", "pet_type": "Dog", "location": "Park", "latitude": 1.5, "longitude": 2.5, "photo": PHOTO}
+    assert client.post("/lost-found/", json=payload, headers=headers).status_code == 201
+
+
+def create_rescue_report(client, headers) -> None:
+    payload = {"location": "Road", "status": "Pending", "alert_type": "High", "description": "Hurt leg", "photo": PHOTO}
+    assert client.post("/rescue-rep/", json=payload, headers=headers).status_code == 201
+
+
+def create_adoption_request(client, headers) -> None:
+    payload = {"pet": {"name": "Tom", "species": "Cat"}, "description": "Needs a home"}
+    assert client.post("/adoption_reqs/", json=payload, headers=headers).status_code == 201
+
+
+@pytest.mark.parametrize("url, model, create", [
+    ("/lost-found/", LostFoundResponse, create_lost_found),
+    ("/rescue-rep/", RescueReportResponse, create_rescue_report),
+    ("/adoption_reqs/all", AdoptionRequestResponse, create_adoption_request),
+])
+def test_orjson_routes_match_their_response_model(client, make_user, auth_headers, url, model, create):
+    # These routes skip response_model validation; their output must still be exactly
+    # what FastAPI would have produced from it.
+    create(client, auth_headers(make_user("owner@example.com")))
+    response = client.get(url, headers=auth_headers(make_user("reader@example.com")))
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/json"
+
+    body = response.json()
+    [item] = body["items"]
+    if "photo" in item:
+        assert set(item["photo_variants"]) == {"thumb", "medium"}
+    assert body == Page[model].model_validate(body).model_dump(mode="json")
@@ -0,0 +1,67 @@
+import pytest
+
+
+@pytest.fixture
+def headers(make_user, auth_headers):
+    return auth_headers(make_user("user@example.com"))
+
+
+def create_pet(client, headers, **pet) -> str:
+    response = client.post("/pets/", json=pet, headers=headers)
+    assert response.status_code == 201, response.text
+    return response.json()["pet_id"]
+
+
+def search(client, headers, q: str, **params) -> list[dict]:
+    response = client.get("/search/", params={"q": q, **params}, headers=headers)
+    assert response.status_code == 200, response.text
+    items = response.json()["items"]
+    assert [item["rank"] for item in items] == sorted((item["rank"] for item in items), reverse=True)
+    return items
+
+
+def test_name_matches_outrank_description_matches(client, headers):
+    create_pet(client, headers, name="Buddy", description="Friendly shadow, loves walks")
+    create_pet(client, headers, name="Shadow", description="Quiet and calm")
+    assert [item["title"] for item in search(client, headers, "shadow")] == ["Shadow", "Buddy"]
+
+
+def test_rows_matching_more_terms_rank_first(client, headers):
+    create_pet(client, headers, name="Luna", species="Cat", color="black", description="white paws, found near the lake")
+    create_pet(client, headers, name="Coal", species="Cat", color="black", description="shy")
+    create_pet(client, headers, name="Rex", species="Dog", color="brown", description="barks a lot")
+    items = search(client, headers, "black cat with white paws near the lake")
+    assert [item["title"] for item in items] == ["Luna", "Coal"]
+
+
+def test_matches_word_stems_across_types(client, headers):
+    create_pet(client, headers, name="Biscuit", description="Running around the garden")
+    response = client.post("/lost-found/", json={"pet_name": "Pip", "location": "Garden Street", "status": "Lost"}, headers=headers)
+    assert response.status_code == 201
+    assert {item["type"] for item in search(client, headers, "gardens")} == {"pet", "lost_found"}
+    assert [item["title"] for item in search(client, headers, "runs", types="pet")] == ["Biscuit"]
+    assert [item["title"] for item in search(client, headers, "gardens", types="lost_found")] == ["Pip"]
+
+
+def test_index_follows_updates_deletes_and_adoption(client, headers):
+    pet_id = create_pet(client, headers, name="Milo", description="tabby")
+    assert client.put(f"/pets/{pet_id}", json={"description": "ginger"}, headers=headers).status_code == 200
+    assert search(client, headers, "tabby") == []
+    assert [item["title"] for item in search(client, headers, "ginger")] == ["Milo"]
+
+    assert client.put(f"/pets/{pet_id}/adopt", headers=headers).status_code == 200
+    assert search(client, headers, "ginger") == []
+
+    other = create_pet(client, headers, name="Nala", description="ginger")
+    assert client.delete(f"/pets/{other}", headers=headers).status_code == 204
+    assert search(client, headers, "nala") == []
+
+
+@pytest.mark.parametrize("q", ["   ", "?!", "_-_"])
+def test_query_without_words_is_rejected(client, headers, q):
+    response = client.get("/search/", params={"q": q}, headers=headers)
+    assert response.status_code == 400
+
+
+def test_missing_query_is_invalid(client, headers):
+    assert client.get("/search/", params={"q": ""}, headers=headers).status_code == 422
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from src import streaming
+
+
+def create_reports(client, headers, count: int) -> None:
+    for i in range(count):
+        response = client.post(
+            "/lost-found/",
+            json={"pet_name": f"pet {i}", "location": "Park", "status": "Lost"},
+            headers=headers,
+        )
+        assert response.status_code == 201, response.text
+
+
+def parse(response, fmt: str) -> list:
+    if fmt == "json":
+        return response.json()
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+@pytest.mark.parametrize("fmt", ["json", "ndjson"])
+def test_stream_returns_every_row_across_batches(client, make_user, auth_headers, monkeypatch, fmt):
+    # 7 rows in batches of 3: two full batches and a partial one.
+    monkeypatch.setattr(streaming, "STREAM_BATCH_SIZE", 3)
+    headers = auth_headers(make_user("user@example.com"))
+    create_reports(client, headers, 7)
+
+    response = client.get(f"/lost-found/stream?format={fmt}", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == streaming.MEDIA_TYPES[streaming.StreamFormat(fmt)]
+    rows = parse(response, fmt)
+    assert sorted(row["pet_name"] for row in rows) == [f"pet {i}" for i in range(7)]
+    assert len({row["reportId"] for row in rows}) == 7
+
+    # Same rows, same order as paging through the list route.
+    listed = client.get("/lost-found/?limit=50", headers=headers).json()["items"]
+    assert [row["reportId"] for row in rows] == [item["reportId"] for item in listed]
+
+
+@pytest.mark.parametrize("fmt, body", [("json", "[]"), ("ndjson", "")])
+def test_empty_stream(client, make_user, auth_headers, fmt, body):
+    response = client.get(f"/lost-found/stream?format={fmt}", headers=auth_headers(make_user("user@example.com")))
+    assert response.status_code == 200
+    assert response.text == body
+
+
+def test_stream_honours_fields(client, make_user, auth_headers):
+    headers = auth_headers(make_user("user@example.com"))
+    create_reports(client, headers, 2)
+    rows = client.get("/lost-found/stream?fields=reportId,pet_name", headers=headers).json()
+    assert [set(row) for row in rows] == [{"reportId", "pet_name"}] * 2
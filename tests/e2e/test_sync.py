@@ -0,0 +1,90 @@
+from datetime import timedelta
+
+from src import sync
+from src.pagination import encode_cursor
+
+
+def changes(client, headers, since=None, url="/pets/changes"):
+    response = client.get(url, headers=headers, params={"since": since} if since else {})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def create_pet(client, headers, name: str) -> str:
+    response = client.post("/pets/", json={"name": name}, headers=headers)
+    assert response.status_code == 201, response.text
+    return response.json()["pet_id"]
+
+
+def test_create_update_delete_round_trip(client, make_user, auth_headers):
+    headers = auth_headers(make_user("owner@example.com"))
+    full = changes(client, headers)
+    assert full["upserts"] == [] and full["deletes"] == [] and not full["has_more"]
+
+    pet_id = create_pet(client, headers, "Rex")
+    created = changes(client, headers, full["next_cursor"])
+    assert [p["name"] for p in created["upserts"]] == ["Rex"] and created["deletes"] == []
+
+    assert client.put(f"/pets/{pet_id}", json={"name": "Max"}, headers=headers).status_code == 200
+    updated = changes(client, headers, created["next_cursor"])
+    assert [(p["pet_id"], p["name"]) for p in updated["upserts"]] == [(pet_id, "Max")]
+
+    assert client.delete(f"/pets/{pet_id}", headers=headers).status_code == 204
+    deleted = changes(client, headers, updated["next_cursor"])
+    assert deleted["upserts"] == [] and deleted["deletes"] == [pet_id]
+
+    caught_up = changes(client, headers, deleted["next_cursor"])
+    assert caught_up["upserts"] == [] and caught_up["deletes"] == []
+
+
+def test_deletions_are_only_reported_to_the_owner(client, make_user, auth_headers):
+    owner, other = auth_headers(make_user("owner@example.com")), auth_headers(make_user("other@example.com"))
+    cursor = changes(client, other)["next_cursor"]
+
+    pet_id = create_pet(client, owner, "Rex")
+    assert client.delete(f"/pets/{pet_id}", headers=owner).status_code == 204
+
+    assert changes(client, other, cursor)["deletes"] == []
+
+
+def test_adoption_feed_reports_deletions_of_other_users_requests(client, make_user, auth_headers):
+    requester, reader = auth_headers(make_user("requester@example.com")), auth_headers(make_user("reader@example.com"))
+    cursor = changes(client, reader, url="/adoption_reqs/changes")["next_cursor"]
+    response = client.post(
+        "/adoption_reqs/", json={"pet": {"name": "Rex", "species": "Dog"}, "description": "d"}, headers=requester
+    )
+    assert response.status_code == 201, response.text
+    adopt_id = response.json()["id"]
+    assert client.delete(f"/adoption_reqs/{adopt_id}", headers=requester).status_code == 204
+
+    assert changes(client, reader, cursor, url="/adoption_reqs/changes")["deletes"] == [adopt_id]
+    own = changes(client, requester, url="/adoption_reqs/changes")
+    assert changes(client, requester, own["next_cursor"], url="/adoption_reqs/changes")["deletes"] == []
+
+
+def test_cursor_expires_once_tombstones_are_pruned(client, db, make_user, auth_headers, monkeypatch):
+    headers = auth_headers(make_user("owner@example.com"))
+    cursor = changes(client, headers)["next_cursor"]
+    pet_id = create_pet(client, headers, "Rex")
+    assert client.delete(f"/pets/{pet_id}", headers=headers).status_code == 204
+
+    later = sync._utcnow() + timedelta(days=sync.TOMBSTONE_RETENTION_DAYS + 1)
+    monkeypatch.setattr(sync, "_utcnow", lambda: later)
+    assert sync.prune_tombstones(db) == 1
+
+    response = client.get("/pets/changes", headers=headers, params={"since": cursor})
+    assert response.status_code == 410
+    assert changes(client, headers)["upserts"] == []
+
+
+def test_cursor_is_tied_to_its_user(client, make_user, auth_headers):
+    owner, other = auth_headers(make_user("owner@example.com")), auth_headers(make_user("other@example.com"))
+    cursor = changes(client, owner)["next_cursor"]
+    assert client.get("/pets/changes", headers=other, params={"since": cursor}).status_code == 400
+    assert client.get("/pets/changes", headers=other, params={"since": "not-a-cursor"}).status_code == 400
+
+
+def test_cursor_from_before_owner_scoping_asks_for_a_full_sync(client, make_user, auth_headers):
+    headers = auth_headers(make_user("owner@example.com"))
+    legacy = encode_cursor([None, None, sync._utcnow(), "00000000-0000-0000-0000-000000000000"])
+    assert client.get("/pets/changes", headers=headers, params={"since": legacy}).status_code == 410
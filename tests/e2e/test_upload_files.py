@@ -0,0 +1,55 @@
+import pytest
+
+from src.media import uploads
+
+
+@pytest.fixture
+def limits(monkeypatch):
+    # Small parts so a few hundred bytes already go up as a multipart upload.
+    monkeypatch.setattr(uploads, "MEDIA_UPLOAD_PART_SIZE", 64)
+    monkeypatch.setattr(uploads, "MEDIA_MAX_UPLOAD_BYTES", 300)
+    monkeypatch.setattr(uploads, "MEDIA_UPLOAD_MAX_FILES", 4)
+
+
+def upload(client, headers, files: list):
+    return client.post("/uploads/files?purpose=pet_image", files=files, headers=headers)
+
+
+def test_each_file_succeeds_or_fails_on_its_own(client, make_user, auth_headers, media_storage, limits):
+    small, multipart, oversized = b"a" * 10, bytes(range(200)), b"c" * 301
+    response = upload(client, auth_headers(make_user("user@example.com")), [
+        ("files", ("small.png", small, "image/png")),
+        ("files", ("big.png", oversized, "image/png")),
+        ("files", ("notes.txt", b"hello", "text/plain")),
+        ("files", ("multi.jpg", multipart, "image/jpeg")),
+        ("files", ("fifth.png", small, "image/png")),
+    ])
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert (body["stored"], body["failed"]) == (2, 3)
+
+    ok, too_big, wrong_type, parts, too_many = body["files"]
+    assert [f["index"] for f in body["files"]] == [0, 1, 2, 3, 4]
+
+    assert ok["status"] == "stored" and ok["size"] == 10 and ok["parts"] == 1
+    assert media_storage.get(media_storage.key_for_url(ok["url"])) == small
+
+    assert parts["status"] == "stored" and parts["parts"] == 4  # 64 + 64 + 64 + 8 bytes
+    assert media_storage.get(media_storage.key_for_url(parts["url"])) == multipart
+
+    assert too_big["status"] == "failed" and too_big["url"] is None
+    assert too_big["error"] == "File is larger than 300 bytes"
+    assert too_big["size"] > 300 and too_big["parts"] < 5  # cut off before the whole file was stored
+    assert wrong_type["status"] == "failed" and wrong_type["error"].startswith("Unsupported content type")
+    assert too_many["status"] == "failed" and too_many["error"] == "Too many files; at most 4 per request"
+
+    # Only the stored files (and no partial uploads) are left in the storage.
+    keys = {media_storage.key_for_url(ok["url"]), media_storage.key_for_url(parts["url"])}
+    assert set(media_storage.list_keys("pet_images/")) == keys
+    assert [p.name for p in media_storage.root.rglob(".*")] == []
+
+
+def test_request_without_files_is_rejected(client, make_user, auth_headers):
+    headers = auth_headers(make_user("user@example.com"))
+    assert client.post("/uploads/files?purpose=pet_image", data={"note": "hi"}, headers=headers).status_code == 400
+    assert client.post("/uploads/files?purpose=pet_image", json={}, headers=headers).status_code == 400
@@ -0,0 +1,118 @@
+import io
+
+import pytest
+
+from src.media import service as media_service
+
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\0" * 64
+
+
+@pytest.fixture
+def owner(make_user, auth_headers):
+    return auth_headers(make_user("owner@example.com"))
+
+
+@pytest.fixture
+def report_id(client, owner) -> str:
+    response = client.post("/lost-found/", json={"pet_name": "Rex", "location": "Park", "status": "Lost"}, headers=owner)
+    return response.json()["reportId"]
+
+
+def presign(client, headers, report_id: str, size: int = len(PNG), content_type: str = "image/png"):
+    return client.post("/uploads/presign", json={
+        "purpose": "lost_found_photo", "target_id": report_id,
+        "content_type": content_type, "size": size, "method": "put",
+    }, headers=headers)
+
+
+def photo(client, headers) -> str | None:
+    [report] = client.get("/lost-found/?fields=photo", headers=headers).json()["items"]
+    return report["photo"]
+
+
+def put(client, upload: dict, body: bytes = PNG):
+    return client.put(upload["url"], content=body, headers=upload["headers"])
+
+
+def confirm(client, headers, upload: dict):
+    return client.post("/uploads/confirm", json={"upload_token": upload["upload_token"]}, headers=headers)
+
+
+def test_presign_put_confirm(client, owner, report_id, media_storage):
+    response = presign(client, owner, report_id)
+    assert response.status_code == 200, response.text
+    upload = response.json()
+    assert upload["method"] == "PUT" and upload["key"].startswith("lost_found/")
+
+    assert put(client, upload).status_code == 204
+    assert media_storage.get(upload["key"]) == PNG
+
+    response = confirm(client, owner, upload)
+    assert response.status_code == 200, response.text
+    url = response.json()["url"]
+    assert media_storage.key_for_url(url) == upload["key"]
+    assert photo(client, owner) == url
+
+
+def test_only_the_owner_can_presign_or_confirm(client, owner, report_id, make_user, auth_headers, media_storage):
+    other = auth_headers(make_user("other@example.com"))
+    assert presign(client, other, report_id).status_code == 404
+
+    upload = presign(client, owner, report_id).json()
+    assert put(client, upload).status_code == 204
+    response = confirm(client, other, upload)
+    assert response.status_code == 403
+    assert photo(client, owner) is None
+
+
+def test_confirm_needs_the_uploaded_object(client, owner, report_id, media_storage):
+    upload = presign(client, owner, report_id).json()
+    assert confirm(client, owner, upload).status_code == 404
+
+
+@pytest.mark.parametrize("size, content_type", [(10 * 1024 * 1024 + 1, "image/png"), (10, "application/pdf")])
+def test_presign_enforces_limits(client, owner, report_id, size, content_type):
+    assert presign(client, owner, report_id, size, content_type).status_code == 400
+
+
+def test_local_put_rejects_oversized_and_mistyped_bodies(client, owner, report_id, media_storage, monkeypatch):
+    monkeypatch.setattr(media_service, "MEDIA_MAX_UPLOAD_BYTES", 32)
+    upload = presign(client, owner, report_id, size=32).json()
+
+    response = put(client, upload, b"x" * 33)
+    assert response.status_code == 400 and "larger than 32 bytes" in response.json()["detail"]
+    assert client.put(upload["url"], content=PNG[:32], headers={"Content-Type": "image/jpeg"}).status_code == 400
+    assert list(media_storage.list_keys("lost_found/")) == []
+    assert confirm(client, owner, upload).status_code == 404
+
+
+def test_confirm_rejects_and_deletes_an_oversized_object(client, owner, report_id, media_storage, monkeypatch):
+    # An object that got past the storage's own limits is never attached.
+    monkeypatch.setattr(media_service, "MEDIA_MAX_UPLOAD_BYTES", 32)
+    upload = presign(client, owner, report_id, size=32).json()
+    media_storage.put(upload["key"], io.BytesIO(b"x" * 64), "image/png")
+
+    assert confirm(client, owner, upload).status_code == 400
+    assert media_storage.stat(upload["key"]) is None
+    assert photo(client, owner) is None
+
+
+def test_confirming_again_is_a_no_op(client, owner, report_id, media_storage, monkeypatch):
+    scheduled = []
+    monkeypatch.setattr(media_service, "schedule_variants", scheduled.append)
+    pet_id = client.post("/pets/", json={"name": "Rex"}, headers=owner).json()["pet_id"]
+    uploads = [
+        presign(client, owner, report_id).json(),
+        client.post("/uploads/presign", json={
+            "purpose": "pet_image", "target_id": pet_id, "content_type": "image/png", "size": len(PNG), "method": "put",
+        }, headers=owner).json(),
+    ]
+    for upload in uploads:
+        assert put(client, upload).status_code == 204
+        first, again = confirm(client, owner, upload), confirm(client, owner, upload)
+        assert first.status_code == again.status_code == 200
+        assert first.json() == again.json()
+
+    assert scheduled == [upload["key"] for upload in uploads]
+    assert client.get(f"/pets/{pet_id}", headers=owner).json()["images"] == [media_storage.url(uploads[1]["key"])]
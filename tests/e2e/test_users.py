@@ -0,0 +1,52 @@
+import pytest
+from sqlalchemy import event
+
+from src.database.core import engine
+
+
+@pytest.fixture
+def user_loads():
+    # Full User row SELECTs (the token revocation refresh reads only id/token_version).
+    loads = []
+
+    def record(conn, cursor, statement, *args):
+        if statement.lstrip().startswith("SELECT") and "FROM users" in statement and "users.email" in statement:
+            loads.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield loads
+    event.remove(engine, "before_cursor_execute", record)
+
+
+def test_me_loads_the_user_once(client, make_user, auth_headers, user_loads):
+    headers = auth_headers(make_user("user@example.com"))
+    user_loads.clear()  # make_user's own refresh
+    response = client.get("/users/me", headers=headers)
+    assert response.status_code == 200 and response.json()["email"] == "user@example.com"
+    assert len(user_loads) == 1
+
+
+def test_batch_shares_one_user_load(client, make_user, auth_headers, user_loads):
+    headers = auth_headers(make_user("user@example.com"))
+    user_loads.clear()
+    requests = [{"id": "me", "path": "/users/me"}, {"id": "again", "path": "/users/me"}, {"id": "recs", "path": "/recommend/"}]
+    response = client.post("/batch/", json={"requests": requests}, headers=headers)
+    assert response.status_code == 200
+    assert [r["status"] for r in response.json()["responses"]] == [200, 200, 200]
+    assert len(user_loads) == 1
+
+
+def test_routes_without_the_user_row_do_not_load_it(client, make_user, auth_headers, user_loads):
+    headers = auth_headers(make_user("user@example.com"))
+    user_loads.clear()
+    assert client.get("/notifications/", headers=headers).status_code == 200
+    assert user_loads == []
+
+
+def test_deleted_user_gets_404(client, db, make_user, auth_headers):
+    user = make_user("user@example.com")
+    headers = auth_headers(user)
+    db.delete(user)
+    db.commit()
+    response = client.get("/users/me", headers=headers)
+    assert response.status_code == 404
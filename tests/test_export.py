@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta
+
+import pyarrow.parquet as pq
+import pytest
+
+from src.entities.rescue_rep import RescueReport, RescueStatusEnum
+from src.export import service as export
+from src.export.models import ExportTable
+
+
+@pytest.fixture
+def owner(make_user):
+    return make_user("owner@example.com")
+
+
+@pytest.fixture(autouse=True)
+def small_batches(monkeypatch):
+    # Several record batches per file, and a fixed lag for the held-back test.
+    monkeypatch.setattr(export, "EXPORT_BATCH_SIZE", 2)
+    monkeypatch.setattr(export, "EXPORT_LAG_SECONDS", 60)
+
+
+def add_reports(db, owner, updated: list[datetime]) -> list[RescueReport]:
+    reports = [
+        RescueReport(user_id=owner.id, location=f"spot {i}", created_at=at, updated_at=at)
+        for i, at in enumerate(updated)
+    ]
+    db.add_all(reports)
+    db.commit()
+    return reports
+
+
+def exported_ids(path) -> list[str]:
+    return pq.read_table(path).column("report_id").to_pylist()
+
+
+def test_export_writes_every_row(db, owner, tmp_path):
+    start = export._utcnow() - timedelta(hours=1)
+    reports = add_reports(db, owner, [start + timedelta(seconds=i) for i in range(5)])
+
+    path = export.export_table(ExportTable.rescue_reports, export_dir=tmp_path)
+    assert path.suffix == ".parquet" and not list(tmp_path.rglob("*.part"))
+    table = pq.read_table(path)
+    assert table.num_rows == 5
+    assert table.column("report_id").to_pylist() == [str(r.report_id) for r in reports]
+    assert set(table.column("status").to_pylist()) == {RescueStatusEnum.Pending.value}
+    assert export.load_watermarks(tmp_path) == {"rescue_reports": reports[-1].updated_at.isoformat()}
+
+
+def test_export_is_incremental(db, owner, tmp_path):
+    start = export._utcnow() - timedelta(hours=1)
+    first, second = add_reports(db, owner, [start, start + timedelta(seconds=1)])
+    assert len(exported_ids(export.export_table(ExportTable.rescue_reports, export_dir=tmp_path))) == 2
+
+    # Nothing changed: no file, watermark kept.
+    watermarks = export.load_watermarks(tmp_path)
+    assert export.export_table(ExportTable.rescue_reports, export_dir=tmp_path) is None
+    assert export.load_watermarks(tmp_path) == watermarks
+
+    # Only the new row and the one updated since are exported next time.
+    [third] = add_reports(db, owner, [start + timedelta(minutes=2)])
+    first.updated_at = start + timedelta(minutes=3)
+    db.commit()
+    path = export.export_table(ExportTable.rescue_reports, export_dir=tmp_path)
+    assert exported_ids(path) == [str(third.report_id), str(first.report_id)]
+
+    # --full ignores the watermark.
+    path = export.export_table(ExportTable.rescue_reports, full=True, export_dir=tmp_path)
+    assert sorted(exported_ids(path)) == sorted(str(r.report_id) for r in (first, second, third))
+
+
+def test_recent_rows_wait_for_the_next_run(db, owner, tmp_path):
+    now = export._utcnow()
+    old, recent = add_reports(db, owner, [now - timedelta(hours=1), now - timedelta(seconds=5)])
+
+    path = export.export_table(ExportTable.rescue_reports, export_dir=tmp_path)
+    assert exported_ids(path) == [str(old.report_id)]
+    assert export.load_watermarks(tmp_path)["rescue_reports"] == old.updated_at.isoformat()
@@ -0,0 +1,61 @@
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+from src.auth import hashing
+from src.exceptions import PasswordHashingBusyError
+
+
+class FakeExecutor:
+    # Stands in for the process pool: returns a future resolved with `error` or `result`.
+    def __init__(self, result=None, error: Exception | None = None):
+        self.result, self.error = result, error
+
+    def submit(self, fn, *args) -> Future:
+        future = Future()
+        if self.error is not None:
+            future.set_exception(self.error)
+        else:
+            future.set_result(self.result)
+        return future
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    # A one-slot queue, as if HASH_WORKERS=1 and HASH_QUEUE_MAX=1.
+    monkeypatch.setattr(hashing, "HASH_WORKERS", 1)
+    monkeypatch.setattr(hashing, "_slots", threading.BoundedSemaphore(1))
+    monkeypatch.setattr(hashing, "_stats", {"in_flight": 0, "completed": 0, "failed": 0, "rejected": 0})
+    return monkeypatch
+
+
+def test_rejects_with_503_when_the_queue_is_full(pool):
+    hashing._slots.acquire()  # another request holds the only slot
+    with pytest.raises(PasswordHashingBusyError) as excinfo:
+        hashing.hash_password("secret")
+    assert excinfo.value.status_code == 503
+    assert excinfo.value.headers["Retry-After"] == str(hashing.HASH_RETRY_AFTER_SECONDS)
+    assert hashing.hashing_status()["rejected"] == 1
+
+
+def test_login_is_shed_when_the_queue_is_full(pool, client, make_user):
+    make_user("user@example.com")
+    hashing._slots.acquire()
+    response = client.post("/auth/token", data={"username": "user@example.com", "password": "secret"})
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
+
+
+def test_counts_completed_and_failed_calls_separately(pool):
+    pool.setattr(hashing, "_get_executor", lambda: FakeExecutor(result="hashed"))
+    assert hashing.hash_password("secret") == "hashed"
+
+    pool.setattr(hashing, "_get_executor", lambda: FakeExecutor(error=ValueError("bad salt")))
+    with pytest.raises(ValueError):
+        hashing.hash_password("secret")
+
+    status = hashing.hashing_status()
+    assert (status["completed"], status["failed"], status["in_flight"]) == (1, 1, 0)
+    # The slot was given back both times.
+    assert hashing._slots.acquire(blocking=False)
@@ -0,0 +1,35 @@
+import time
+import uuid
+
+from src.database import ids
+from src.database.ids import uuid7
+
+
+def test_uuid7_sets_version_and_variant():
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_embeds_the_current_unix_millisecond():
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+    assert before <= value.int >> 80 <= after
+
+
+def test_uuid7_is_strictly_increasing_within_a_process():
+    values = [uuid7() for _ in range(10_000)]
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+
+
+def test_uuid7_borrows_the_next_millisecond_when_the_counter_runs_out(monkeypatch):
+    # Restored afterwards, so ids minted by later tests are not pushed into the future.
+    monkeypatch.setattr(ids, "_last_ms", ids._last_ms)
+    monkeypatch.setattr(ids, "_counter", ids._counter)
+    frozen_ms = (time.time_ns() // 1_000_000) + 60_000  # ahead of any id minted so far
+    monkeypatch.setattr(ids.time, "time_ns", lambda: frozen_ms * 1_000_000)
+    values = [uuid7() for _ in range(0x1001)]
+    assert values == sorted(values)
+    assert values[-1].int >> 80 > frozen_ms
@@ -0,0 +1,93 @@
+import uuid
+from pathlib import Path
+
+import pytest
+import sqlalchemy as sa
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+
+
+BEFORE_PET_IMAGES = "4b9e0f27d1c8"
+PET_IMAGES = "9e5a3c71b0d4"
+
+
+@pytest.fixture
+def migrate(tmp_path, monkeypatch):
+    # alembic/env.py reads DATABASE_URL; point it at an empty database of its own.
+    url = f"sqlite:///{tmp_path / 'migrations.db'}"
+    monkeypatch.setenv("DATABASE_URL", url)
+    config = Config()
+    config.set_main_option("script_location", str(Path(__file__).resolve().parents[1] / "alembic"))
+    # Every command reuses one ScriptDirectory, so revision modules are loaded (and can
+    # be patched) once.
+    script = ScriptDirectory.from_config(config)
+    monkeypatch.setattr(ScriptDirectory, "from_config", classmethod(lambda cls, config: script))
+    engine = sa.create_engine(url)
+    command.upgrade(config, "head")
+    command.downgrade(config, BEFORE_PET_IMAGES)
+    yield config, engine
+    engine.dispose()
+
+
+def add_pet(conn, user_id: str, name: str, images) -> str:
+    pet_id = uuid.uuid4().hex
+    conn.execute(sa.text(
+        "INSERT INTO pets (pet_id, user_id, name, species, gender, is_adopted, images, created_at, updated_at) "
+        "VALUES (:pet_id, :user_id, :name, 'Dog', 'Unknown', 0, :images, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+    ), {"pet_id": pet_id, "user_id": user_id, "name": name, "images": images})
+    return pet_id
+
+
+def pet_images(conn) -> dict[str, list[tuple[int, str]]]:
+    rows = conn.execute(sa.text("SELECT pets.name, position, url FROM pet_images JOIN pets USING (pet_id) ORDER BY 1, 2"))
+    images: dict = {}
+    for name, position, url in rows:
+        images.setdefault(name, []).append((position, url))
+    return images
+
+
+def json_images(conn) -> dict[str, str | None]:
+    return dict(conn.execute(sa.text("SELECT name, images FROM pets")).fetchall())
+
+
+def test_pet_images_round_trip(migrate, monkeypatch):
+    config, engine = migrate
+    # Several keyset batches each way.
+    monkeypatch.setattr(ScriptDirectory.from_config(config).get_revision(PET_IMAGES).module, "BATCH_SIZE", 2)
+    with engine.begin() as conn:
+        assert "pet_images" not in sa.inspect(conn).get_table_names()
+        user_id = uuid.uuid4().hex
+        for name, images in [
+            ("two", '["/media/pets/a.jpg", "https://x.org/b.png"]'),
+            ("one", '["/media/pets/c.jpg"]'),
+            ("empty", "[]"),
+            ("none", None),
+            ("junk", '["/media/pets/d.jpg", "", 7, null]'),
+        ]:
+            add_pet(conn, user_id, name, images)
+
+    command.upgrade(config, PET_IMAGES)
+    with engine.begin() as conn:
+        assert "images" not in {c["name"] for c in sa.inspect(conn).get_columns("pets")}
+        assert pet_images(conn) == {
+            "junk": [(0, "/media/pets/d.jpg")],
+            "one": [(0, "/media/pets/c.jpg")],
+            "two": [(0, "/media/pets/a.jpg"), (1, "https://x.org/b.png")],
+        }
+
+    command.downgrade(config, BEFORE_PET_IMAGES)
+    with engine.begin() as conn:
+        assert "pet_images" not in sa.inspect(conn).get_table_names()
+        assert json_images(conn) == {
+            "two": '["/media/pets/a.jpg", "https://x.org/b.png"]',
+            "one": '["/media/pets/c.jpg"]',
+            "junk": '["/media/pets/d.jpg"]',
+            "empty": None,
+            "none": None,
+        }
+
+    # And forward again to head.
+    command.upgrade(config, "head")
+    with engine.begin() as conn:
+        assert set(pet_images(conn)) == {"junk", "one", "two"}
@@ -0,0 +1,94 @@
+import json
+from datetime import timedelta
+
+import pytest
+
+from src.entities.email_outbox import EmailOutbox, OUTBOX_FAILED, OUTBOX_PENDING, OUTBOX_SENT
+from src.outbox import worker
+from src.outbox.service import enqueue_verification_code
+from src.outbox.transports import EmailTransport, FileTransport
+
+
+class FailingTransport(EmailTransport):
+    name = "failing"
+
+    def send(self, message: EmailOutbox) -> None:
+        raise ConnectionError("SES unavailable")
+
+
+@pytest.fixture
+def file_transport(tmp_path):
+    return FileTransport(tmp_path / "emails.jsonl")
+
+
+def sent_lines(transport: FileTransport) -> list[dict]:
+    return [json.loads(line) for line in transport.path.read_text().splitlines()]
+
+
+def enqueue(db, count: int) -> list[EmailOutbox]:
+    messages = [enqueue_verification_code(db, f"user{i}@example.com", f"{i:06d}") for i in range(count)]
+    db.commit()
+    return messages
+
+
+def make_due(db, message: EmailOutbox) -> None:
+    message.next_attempt_at = worker._utcnow() - timedelta(seconds=1)
+    db.commit()
+
+
+def test_deliver_batch_sends_in_batches_through_the_file_transport(db, file_transport):
+    messages = enqueue(db, 3)
+
+    assert worker.deliver_batch(db, file_transport, batch_size=2) == 2
+    assert worker.deliver_batch(db, file_transport, batch_size=2) == 1
+    assert worker.deliver_batch(db, file_transport, batch_size=2) == 0
+
+    lines = sent_lines(file_transport)
+    assert sorted(line["to"] for line in lines) == [m.to_address for m in messages]
+    assert all("Your verification code is" in line["text"] for line in lines)
+    for message in messages:
+        db.refresh(message)
+        assert message.status == OUTBOX_SENT and message.attempts == 1
+        # The code is not kept once the email is out.
+        assert message.body_text == "" and message.body_html is None
+
+
+def test_failed_send_is_retried_with_backoff(db, file_transport):
+    (message,) = enqueue(db, 1)
+
+    assert worker.deliver_batch(db, FailingTransport()) == 1
+    db.refresh(message)
+    assert message.status == OUTBOX_PENDING and message.attempts == 1
+    assert message.last_error == "SES unavailable"
+    first_delay = message.next_attempt_at - worker._utcnow()
+    assert timedelta(0) < first_delay <= worker.retry_delay(1)
+
+    # Not due yet, so the next batch skips it.
+    assert worker.deliver_batch(db, file_transport) == 0
+
+    make_due(db, message)
+    assert worker.deliver_batch(db, FailingTransport()) == 1
+    db.refresh(message)
+    assert message.attempts == 2
+    assert message.next_attempt_at - worker._utcnow() > first_delay
+
+    make_due(db, message)
+    assert worker.deliver_batch(db, file_transport) == 1
+    db.refresh(message)
+    assert message.status == OUTBOX_SENT and message.last_error is None
+    assert len(sent_lines(file_transport)) == 1
+
+
+def test_gives_up_after_max_attempts(db, monkeypatch):
+    monkeypatch.setattr(worker, "EMAIL_MAX_ATTEMPTS", 2)
+    (message,) = enqueue(db, 1)
+
+    for _ in range(2):
+        make_due(db, message)
+        assert worker.deliver_batch(db, FailingTransport()) == 1
+    db.refresh(message)
+    assert message.status == OUTBOX_FAILED and message.attempts == 2
+    assert message.body_text == ""
+
+    make_due(db, message)
+    assert worker.deliver_batch(db, FailingTransport()) == 0
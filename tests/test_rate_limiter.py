@@ -0,0 +1,78 @@
+from types import SimpleNamespace
+
+import pytest
+from starlette.requests import Request
+
+from src import rate_limiter
+from src.rate_limiter import DatabaseStorage, client_address
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimpleNamespace(now=1_000_000.0)
+    monkeypatch.setattr(rate_limiter, "time", SimpleNamespace(time=lambda: clock.now))
+    return clock
+
+
+@pytest.fixture
+def storage(db, clock):
+    return DatabaseStorage("database://")
+
+
+@pytest.fixture
+def trusted_proxies(monkeypatch):
+    networks, _ = rate_limiter._parse_networks("10.0.0.0/16, 127.0.0.1")
+    monkeypatch.setattr(rate_limiter, "TRUSTED_PROXY_IPS", networks)
+
+
+def request_from(peer: str, forwarded_for: str | None = None) -> Request:
+    headers = [(b"x-forwarded-for", forwarded_for.encode())] if forwarded_for else []
+    return Request({"type": "http", "client": (peer, 50000), "headers": headers})
+
+
+def test_database_storage_counts_hits_until_the_window_expires(storage, clock):
+    assert storage.incr("login:1.2.3.4", expiry=60) == 1
+    assert storage.incr("login:1.2.3.4", expiry=60) == 2
+    assert storage.get("login:1.2.3.4") == 2
+    assert storage.get("login:5.6.7.8") == 0
+
+    clock.now += 61
+    assert storage.get("login:1.2.3.4") == 0
+    assert storage.incr("login:1.2.3.4", expiry=60) == 1
+
+
+def test_database_storage_sliding_window_refuses_past_the_limit(storage, clock):
+    assert all(storage.acquire_sliding_window_entry("login", limit=3, expiry=60) for _ in range(3))
+    assert not storage.acquire_sliding_window_entry("login", limit=3, expiry=60)
+
+    # Two windows later the earlier hits no longer count.
+    clock.now += 120
+    assert storage.acquire_sliding_window_entry("login", limit=3, expiry=60)
+
+
+def test_client_address_uses_forwarded_for_from_a_trusted_proxy(trusted_proxies):
+    assert client_address(request_from("10.0.3.7", "203.0.113.9")) == "203.0.113.9"
+
+
+def test_client_address_ignores_forwarded_for_from_an_untrusted_peer(trusted_proxies):
+    assert client_address(request_from("198.51.100.4", "203.0.113.9")) == "198.51.100.4"
+
+
+def test_client_address_takes_the_last_untrusted_hop(trusted_proxies):
+    # The client sent a spoofed first hop; the ALB appended the real address, then an internal proxy.
+    request = request_from("10.0.3.7", "6.6.6.6, 203.0.113.9, 10.0.1.1")
+    assert client_address(request) == "203.0.113.9"
+
+
+def test_check_config_names_invalid_trusted_proxies(monkeypatch):
+    _, invalid = rate_limiter._parse_networks("REPLACE_ME_VPC_CIDR, 10.0.0.0/16")
+    monkeypatch.setattr(rate_limiter, "_INVALID_PROXY_IPS", invalid)
+    with pytest.raises(RuntimeError, match="TRUSTED_PROXY_IPS.*REPLACE_ME_VPC_CIDR"):
+        rate_limiter.check_config()
+
+
+def test_check_config_refuses_memory_storage_in_production(monkeypatch):
+    monkeypatch.setattr(rate_limiter, "is_production", lambda: True)
+    monkeypatch.setattr(rate_limiter, "RATE_LIMIT_STORAGE_URI", "memory://")
+    with pytest.raises(RuntimeError, match="RATE_LIMIT_STORAGE_URI"):
+        rate_limiter.check_config()
@@ -0,0 +1,65 @@
+from datetime import timedelta
+
+import pytest
+
+from src.auth import service, token_cache as token_cache_module
+from src.auth.token_cache import TokenCache
+from src.exceptions import AuthenticationError
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # Controls the time TokenCache compares `exp` against.
+    now = [1_000_000.0]
+    monkeypatch.setattr(token_cache_module.time, "time", lambda: now[0])
+    return now
+
+
+def test_entries_expire_with_the_token(clock):
+    cache = TokenCache(10)
+    cache.put("token", "claims", expires_at=clock[0] + 60)
+    assert cache.get("token") == "claims"
+
+    clock[0] += 60
+    assert cache.get("token") is None
+    assert cache.stats() == {"size": 0, "max_size": 10, "hits": 1, "misses": 1, "evictions": 0, "hit_rate": 0.5}
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = TokenCache(2)
+    for token in ("a", "b"):
+        cache.put(token, token, expires_at=clock[0] + 60)
+    cache.get("a")
+    cache.put("c", "c", expires_at=clock[0] + 60)
+    assert [cache.get(token) for token in ("a", "b", "c")] == ["a", None, "c"]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_disabled_cache_stores_nothing():
+    cache = TokenCache(0)
+    cache.put("token", "claims", expires_at=float("inf"))
+    assert cache.get("token") is None
+
+
+def test_verify_token_caches_until_exp(db, make_user, monkeypatch):
+    cache = TokenCache(10)
+    monkeypatch.setattr(service, "token_cache", cache)
+    user = make_user("user@example.com")
+    token = service.create_access_token(user, timedelta(minutes=5))
+
+    decodes = []
+    decode = service.jwt.decode
+    monkeypatch.setattr(service.jwt, "decode", lambda *args, **kwargs: decodes.append(1) or decode(*args, **kwargs))
+
+    first, second = service.verify_token(token), service.verify_token(token)
+    assert first == second and first.user_id == str(user.id)
+    assert len(decodes) == 1 and cache.hits == 1
+
+
+def test_expired_token_is_rejected_and_not_cached(db, make_user, monkeypatch):
+    cache = TokenCache(10)
+    monkeypatch.setattr(service, "token_cache", cache)
+    token = service.create_access_token(make_user("user@example.com"), timedelta(seconds=-1))
+    with pytest.raises(AuthenticationError):
+        service.verify_token(token)
+    assert cache.stats()["size"] == 0